@@ -2,7 +2,7 @@ from django.conf import settings
 from django.urls import path
 from rest_framework.routers import DefaultRouter, SimpleRouter
 
-from mycarehub.clients.views import ClientAPIView
+from mycarehub.clients.views import ClientAPIView, ClientBulkUpsertView
 from mycarehub.common.views import (
     FacilityViewSet,
     OrganisationAPIView,
@@ -11,6 +11,9 @@ from mycarehub.common.views import (
 )
 from mycarehub.content.views import (
     ContentBookmarkViewSet,
+    ContentEngagementTimeseriesView,
+    ContentEngagementTopItemsView,
+    ContentInteractionStateView,
     ContentItemCategoryViewSet,
     ContentLikeViewSet,
     ContentShareViewSet,
@@ -44,6 +47,22 @@ urlpatterns = router.urls + [
         ProgramAPIView.as_view(),
         name="programs-general",
     ),
+    path(
+        "content_interactions/",
+        ContentInteractionStateView.as_view(),
+        name="content-interactions",
+    ),
+    path(
+        "content_engagement/timeseries/",
+        ContentEngagementTimeseriesView.as_view(),
+        name="content-engagement-timeseries",
+    ),
+    path(
+        "content_engagement/top/",
+        ContentEngagementTopItemsView.as_view(),
+        name="content-engagement-top",
+    ),
+    path("clients/bulk/", ClientBulkUpsertView.as_view(), name="clients-bulk"),
     path("clients/<pk>/", ClientAPIView.as_view(), name="clients-detail"),
     path(
         "clients/",
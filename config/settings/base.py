@@ -471,6 +471,24 @@ WHITELISTED_DOMAINS = env.list(
 
 API_VERSION = "0.0.1"
 
+# how long (in seconds) the effective permissions of a user are cached
+USER_PERMISSIONS_CACHE_TIMEOUT = env.int("USER_PERMISSIONS_CACHE_TIMEOUT", default=3600)
+# how long (in seconds) the program and enrollment of a client are cached for content requests
+CLIENT_CONTEXT_CACHE_TIMEOUT = env.int("CLIENT_CONTEXT_CACHE_TIMEOUT", default=300)
+
+# how long (in seconds) content API listing responses are cached
+CONTENT_API_CACHE_TIMEOUT = env.int("CONTENT_API_CACHE_TIMEOUT", default=300)
+# how many background workers pre-generate image renditions (0 generates them inline)
+CONTENT_RENDITION_WORKERS = env.int("CONTENT_RENDITION_WORKERS", default=2)
+# how often (in seconds) pending content interaction counts are flushed to content items
+CONTENT_COUNTER_FLUSH_INTERVAL = env.int("CONTENT_COUNTER_FLUSH_INTERVAL", default=60)
+# how often (in seconds) content interaction counts are recomputed to correct drift
+CONTENT_COUNTER_RECONCILE_INTERVAL = env.int("CONTENT_COUNTER_RECONCILE_INTERVAL", default=3600)
+# how often (in seconds) content interactions are rolled up for engagement analytics
+CONTENT_INTERACTION_ROLLUP_INTERVAL = env.int("CONTENT_INTERACTION_ROLLUP_INTERVAL", default=900)
+# where archived content views are exported to
+CONTENT_ARCHIVE_STORAGE = "django.core.files.storage.FileSystemStorage"
+
 # debug_toolbar
 if DEBUG:
     # django-debug-toolbar
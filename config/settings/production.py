@@ -71,6 +71,7 @@ STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
 # ------------------------------------------------------------------------------
 DEFAULT_FILE_STORAGE = "mycarehub.utils.storages.MediaRootGoogleCloudStorage"
 MEDIA_URL = f"https://storage.googleapis.com/{GS_BUCKET_NAME}/media/"
+CONTENT_ARCHIVE_STORAGE = "mycarehub.utils.storages.ArchiveGoogleCloudStorage"
 
 # Anymail
 # ------------------------------------------------------------------------------
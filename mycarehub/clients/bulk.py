@@ -0,0 +1,113 @@
+"""
+Bulk registration of clients.
+
+The myCareHub core backend registers the clients of a facility in batches of
+thousands. Each client of a batch is validated on its own, the organisations
+and programs that the batch refers to are looked up in a query each, and the
+valid clients are written in a single upsert keyed on their ids
+(`INSERT ... ON CONFLICT (id) DO UPDATE`). Clients that already exist are
+updated instead of inserted, so sending a batch again is safe.
+"""
+from django.db import transaction
+
+from mycarehub.common.models import BulkValidationError, Organisation, Program
+
+from .context import invalidate_client_contexts
+from .models import Client
+from .serializers import ClientUpsertSerializer
+
+CREATED = "created"
+UPDATED = "updated"
+INVALID = "invalid"
+
+# the client fields that are written when a client already exists
+UPSERTED_FIELDS = ["name", "gender", "date_of_birth", "organisation", "program"]
+
+
+def _get_client_id(row):
+    return str(row.get("client_id")) if isinstance(row, dict) else None
+
+
+def _invalid(client_id, errors):
+    return {"client_id": client_id, "status": INVALID, "errors": errors}
+
+
+def _get_existing_ids(model, ids):
+    return set(model.objects.filter(id__in=ids).values_list("id", flat=True))
+
+
+def upsert_clients(rows, user_id=None):
+    """
+    Insert and update clients from the representations sent by the core backend.
+
+    Returns a result per row, in the order of the rows, with the id of the row's
+    client and whether the client was created, updated or is invalid (and why).
+    """
+    results = [None] * len(rows)
+    valid = {}
+    for index, row in enumerate(rows):
+        serializer = ClientUpsertSerializer(data=row)
+        if not serializer.is_valid():
+            results[index] = _invalid(_get_client_id(row), serializer.errors)
+        elif serializer.validated_data["client_id"] in valid:
+            results[index] = _invalid(
+                _get_client_id(row), {"client_id": ["the client is repeated in the request"]}
+            )
+        else:
+            valid[serializer.validated_data["client_id"]] = (index, serializer.validated_data)
+
+    organisation_ids = _get_existing_ids(
+        Organisation, {data["organisation_id"] for _, data in valid.values()}
+    )
+    program_ids = _get_existing_ids(Program, {data["program_id"] for _, data in valid.values()})
+    existing_ids = _get_existing_ids(Client, valid.keys())
+
+    writes = []
+    for client_id, (index, data) in valid.items():
+        errors = {}
+        if data["organisation_id"] not in organisation_ids:
+            errors["organisation_id"] = ["the organisation does not exist"]
+        if data["program_id"] not in program_ids:
+            errors["program_id"] = ["the program does not exist"]
+        if errors:
+            results[index] = _invalid(str(client_id), errors)
+            continue
+
+        client = Client(
+            id=client_id,
+            name=data["name"],
+            gender=data["gender"],
+            date_of_birth=data["date_of_birth"],
+            organisation_id=data["organisation_id"],
+            program_id=data["program_id"],
+        )
+        writes.append((index, client))
+
+    try:
+        Client.objects.validated_bulk_upsert(
+            [client for _, client in writes],
+            unique_fields=["id"],
+            update_fields=UPSERTED_FIELDS,
+            user_id=user_id,
+        )
+    except BulkValidationError as e:
+        for position, errors in e.row_errors.items():
+            index, client = writes[position]
+            results[index] = _invalid(str(client.id), errors)
+        writes = [write for position, write in enumerate(writes) if position not in e.row_errors]
+        Client.objects.validated_bulk_upsert(
+            [client for _, client in writes],
+            unique_fields=["id"],
+            update_fields=UPSERTED_FIELDS,
+            user_id=user_id,
+        )
+
+    for index, client in writes:
+        results[index] = {
+            "client_id": str(client.id),
+            "status": UPDATED if client.id in existing_ids else CREATED,
+        }
+
+    written_ids = [client.id for _, client in writes]
+    transaction.on_commit(lambda: invalidate_client_contexts(written_ids))
+    return results
@@ -0,0 +1,73 @@
+"""
+The context of a client that content requests are personalised with.
+
+Content requests that carry a `client_id` need the client's program, their
+enrollment date and how the program's content is sequenced. These are looked
+up together in a single query and cached for `CLIENT_CONTEXT_CACHE_TIMEOUT`
+seconds. Clients that do not exist are cached too, so that unknown ids do not
+query the database on every request.
+
+The cached context of a client is evicted when the client is registered or
+removed through `ClientAPIView` or upserted in bulk (see `upsert_clients`).
+Changes to a program reach its clients' contexts within the timeout.
+"""
+import uuid
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import Client
+
+CLIENT_CONTEXT_CACHE_PREFIX = "clients:context"
+
+# cached in place of the context of clients that do not exist
+_MISSING = "missing"
+
+
+class ClientContext(NamedTuple):
+    """The properties of a client (and their program) that content is filtered with."""
+
+    client_id: uuid.UUID
+    program_id: uuid.UUID
+    enrollment_date: datetime
+    content_sequence: str
+    program_start_date: datetime
+
+
+def _cache_key(client_id):
+    return f"{CLIENT_CONTEXT_CACHE_PREFIX}:{client_id}"
+
+
+def get_client_context(client_id) -> Optional[ClientContext]:
+    """Return the context of a client, or None if the id is not that of a client."""
+    try:
+        client_id = uuid.UUID(str(client_id))
+    except ValueError:
+        return None
+
+    key = _cache_key(client_id)
+    context = cache.get(key)
+    if context is None:
+        values = (
+            Client.objects.filter(id=client_id)
+            .values_list(
+                "program_id", "enrollment_date", "program__content_sequence", "program__start_date"
+            )
+            .first()
+        )
+        context = ClientContext(client_id, *values) if values else _MISSING
+        cache.set(key, context, settings.CLIENT_CONTEXT_CACHE_TIMEOUT)
+
+    return None if context == _MISSING else context
+
+
+def invalidate_client_context(client_id):
+    """Evict the cached context of a client."""
+    cache.delete(_cache_key(client_id))
+
+
+def invalidate_client_contexts(client_ids):
+    """Evict the cached contexts of many clients."""
+    cache.delete_many([_cache_key(client_id) for client_id in client_ids])
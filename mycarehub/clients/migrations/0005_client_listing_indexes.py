@@ -0,0 +1,22 @@
+# Generated by Django 4.2.30 on 2026-10-18 19:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("clients", "0004_alter_client_organisation"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="client",
+            index=models.Index(fields=["created", "id"], name="clients_cli_created_3ebc1a_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="client",
+            index=models.Index(
+                fields=["program", "created", "id"], name="clients_cli_program_823d62_idx"
+            ),
+        ),
+    ]
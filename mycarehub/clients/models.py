@@ -1,4 +1,4 @@
-from django.db.models import PROTECT, CharField, DateTimeField, ForeignKey
+from django.db.models import PROTECT, CharField, DateTimeField, ForeignKey, Index
 from django.db.models.fields import DateField
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
@@ -16,3 +16,10 @@ class Client(AbstractBase):
         "common.Program", on_delete=PROTECT, default=default_program, related_name="clients"
     )
     enrollment_date = DateTimeField(default=timezone.now)
+
+    class Meta(AbstractBase.Meta):
+        # the client listings are paged in (created, id) order, optionally within a program
+        indexes = [
+            Index(fields=["created", "id"]),
+            Index(fields=["program", "created", "id"]),
+        ]
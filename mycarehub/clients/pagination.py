@@ -0,0 +1,73 @@
+"""
+Keyset (cursor) pagination for the clients API.
+
+Clients are listed in a stable `(created, id)` order and each page resumes
+after the last client of the previous one, so the database does not scan the
+clients of the earlier pages and clients that are registered while a caller is
+paging do not shift the page boundaries. The `next` value returned in the
+response metadata is passed back as `?cursor=` to get the following page.
+"""
+import base64
+import binascii
+import json
+import uuid
+from itertools import islice
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework import serializers
+
+CLIENT_ORDERING = ("created", "id")
+
+# the number of clients that are read from the database at a time when streaming
+CLIENT_STREAM_CHUNK_SIZE = 500
+
+
+def encode_cursor(client):
+    """Return an opaque cursor that resumes pagination after the given client."""
+    position = [client.created.isoformat(), str(client.pk)]
+    return base64.urlsafe_b64encode(json.dumps(position).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor):
+    """Return the `(created, id)` position encoded in a cursor."""
+    try:
+        created, pk = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        created = parse_datetime(created)
+        if created is None:
+            raise ValueError()
+        pk = uuid.UUID(pk)
+    except (binascii.Error, AttributeError, TypeError, ValueError):
+        raise serializers.ValidationError("cursor is not valid")
+
+    return created, pk
+
+
+def order_clients(queryset, cursor=None):
+    """Order clients for keyset pagination, starting after a decoded cursor if one is given."""
+    queryset = queryset.order_by(*CLIENT_ORDERING)
+    if cursor:
+        created, pk = cursor
+        queryset = queryset.filter(Q(created__gt=created) | Q(created=created, id__gt=pk))
+
+    return queryset
+
+
+def paginate_clients(queryset, cursor, limit):
+    """Return a page of clients and the cursor of the next page (None on the last page)."""
+    # fetch one extra client to find out whether there is a next page
+    clients = list(order_clients(queryset, cursor)[: limit + 1])
+    page = clients[:limit]
+    return page, encode_cursor(page[-1]) if len(clients) > limit else None
+
+
+def iterate_clients(queryset, cursor=None):
+    """
+    Yield chunks of clients, reading them through a server-side cursor.
+
+    Only a chunk of clients is held in memory at a time, however many clients
+    there are.
+    """
+    clients = order_clients(queryset, cursor).iterator(chunk_size=CLIENT_STREAM_CHUNK_SIZE)
+    while chunk := list(islice(clients, CLIENT_STREAM_CHUNK_SIZE)):
+        yield chunk
@@ -1,8 +1,10 @@
 from rest_framework import serializers
 
 from mycarehub.common.serializers import OrganisationSerializer, ProgramSerializer
+from mycarehub.users.models import GenderChoices
 
 from .models import Client
+from .pagination import decode_cursor
 
 
 class ClientSerializer(serializers.ModelSerializer):
@@ -25,3 +27,41 @@ class ClientSerializer(serializers.ModelSerializer):
             "organisation_id",
             "client_id",
         ]
+
+
+class ClientListQuerySerializer(serializers.Serializer):
+    """Validates the query parameters of a client listing."""
+
+    # the number of clients in a page, when a page is requested without a limit
+    DEFAULT_LIMIT = 100
+    # the most clients that are returned in a page
+    MAX_LIMIT = 1000
+
+    program_id = serializers.UUIDField(required=False)
+    organisation_id = serializers.UUIDField(required=False)
+    cursor = serializers.CharField(required=False)
+    limit = serializers.IntegerField(min_value=1, max_value=MAX_LIMIT, required=False)
+    stream = serializers.BooleanField(default=False)
+
+    def validate_cursor(self, value):
+        return decode_cursor(value)
+
+
+class ClientUpsertSerializer(serializers.Serializer):
+    """Validates a client of a bulk upsert."""
+
+    client_id = serializers.UUIDField()
+    name = serializers.CharField(allow_blank=True)
+    gender = serializers.ChoiceField(choices=GenderChoices.choices, allow_null=True)
+    date_of_birth = serializers.DateField(allow_null=True)
+    organisation_id = serializers.UUIDField()
+    program_id = serializers.UUIDField()
+
+
+class ClientBulkUpsertSerializer(serializers.Serializer):
+    """Validates a bulk upsert of clients, each client is validated on its own."""
+
+    # the most clients that can be upserted in a request
+    MAX_CLIENTS = 5000
+
+    clients = serializers.ListField(allow_empty=False, max_length=MAX_CLIENTS)
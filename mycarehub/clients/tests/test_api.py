@@ -1,10 +1,15 @@
+import base64
+import json
+
 import pytest
 from django.urls import reverse
 from faker import Faker
 from model_bakery import baker
 from rest_framework import status
 
+from mycarehub.clients.context import get_client_context
 from mycarehub.clients.models import Client
+from mycarehub.common.models import Organisation, Program
 from mycarehub.users.models import GenderChoices
 
 fake = Faker()
@@ -28,6 +33,93 @@ def test_client_list(user_with_all_permissions, client):
     assert len(response_data) > 0
 
 
+def test_client_list_is_not_paged_by_default(user_with_all_permissions, client):
+    client.force_login(user_with_all_permissions)
+    program = baker.make(Program, organisation=user_with_all_permissions.organisation)
+    clients = baker.make(Client, program=program, _quantity=3)
+
+    response = client.get(reverse("api:clients-general"), {"program_id": program.id})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert isinstance(response.json(), list)
+    assert {item["id"] for item in response.json()} == {str(c.id) for c in clients}
+
+    # a page is only returned when one is requested
+    response = client.get(reverse("api:clients-general"), {"program_id": program.id, "limit": 5})
+    assert set(response.json()) == {"meta", "items"}
+
+
+def test_client_list_pages(user_with_all_permissions, client, django_assert_num_queries):
+    client.force_login(user_with_all_permissions)
+    url = reverse("api:clients-general")
+    program = baker.make(Program, organisation=user_with_all_permissions.organisation)
+    clients = sorted(
+        baker.make(Client, program=program, _quantity=3), key=lambda c: (c.created, c.id)
+    )
+
+    # the organisations, programs and facilities of a page are fetched with the clients
+    with django_assert_num_queries(6):
+        response = client.get(url, {"program_id": program.id, "limit": 2})
+    assert response.status_code == status.HTTP_200_OK
+    page = response.json()
+    assert [item["id"] for item in page["items"]] == [str(c.id) for c in clients[:2]]
+    assert page["items"][0]["program"]["id"] == str(program.id)
+
+    response = client.get(url, {"program_id": program.id, "cursor": page["meta"]["next"]})
+    page = response.json()
+    assert [item["id"] for item in page["items"]] == [str(clients[2].id)]
+    assert page["meta"]["next"] is None
+
+
+def test_client_list_filters(user_with_all_permissions, client):
+    client.force_login(user_with_all_permissions)
+    url = reverse("api:clients-general")
+    organisation = baker.make(Organisation)
+    program = baker.make(Program, organisation=organisation)
+    organisation_client = baker.make(Client, organisation=organisation, program=program)
+    baker.make(Client)
+
+    for params in [{"organisation_id": organisation.id}, {"program_id": program.id}]:
+        response = client.get(url, params)
+        assert [item["id"] for item in response.json()] == [str(organisation_client.id)]
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"cursor": "not-a-cursor"},
+        {"cursor": base64.urlsafe_b64encode(b'["yesterday", 1]').decode("ascii")},
+        {"cursor": base64.urlsafe_b64encode(b'["2023-01-01T00:00:00", 1]').decode("ascii")},
+        {"limit": 0},
+        {"program_id": "not-a-uuid"},
+    ],
+)
+def test_client_list_invalid_parameters(user_with_all_permissions, client, params):
+    client.force_login(user_with_all_permissions)
+
+    response = client.get(reverse("api:clients-general"), params)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+def test_client_list_stream(user_with_all_permissions, client, monkeypatch):
+    monkeypatch.setattr("mycarehub.clients.pagination.CLIENT_STREAM_CHUNK_SIZE", 2)
+    client.force_login(user_with_all_permissions)
+    program = baker.make(Program, organisation=user_with_all_permissions.organisation)
+    clients = sorted(
+        baker.make(Client, program=program, _quantity=3), key=lambda c: (c.created, c.id)
+    )
+
+    response = client.get(
+        reverse("api:clients-general"), {"program_id": program.id, "stream": "true"}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response["Content-Type"] == "application/x-ndjson"
+    lines = b"".join(response.streaming_content).decode("utf-8").splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [str(c.id) for c in clients]
+
+
 def test_client_registration(user_with_all_permissions, client):
     client.force_login(user_with_all_permissions)
     url = reverse("api:clients-general")
@@ -54,6 +146,34 @@ def test_client_registration(user_with_all_permissions, client):
     assert response_data["id"] is not None
 
 
+def test_client_bulk_upsert(user_with_all_permissions, client):
+    client.force_login(user_with_all_permissions)
+    url = reverse("api:clients-bulk")
+    existing = baker.make(Client)
+    rows = [
+        {
+            "client_id": client_id,
+            "name": fake.name(),
+            "gender": GenderChoices.MALE,
+            "date_of_birth": str(fake.date_of_birth(minimum_age=18)),
+            "organisation_id": str(user_with_all_permissions.organisation.id),
+            "program_id": str(user_with_all_permissions.program.id),
+        }
+        for client_id in [fake.uuid4(), str(existing.id)]
+    ]
+
+    response = client.post(url, data={"clients": rows}, content_type="application/json")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [result["status"] for result in response.json()["results"]] == [
+        "created",
+        "updated",
+    ]
+
+    response = client.post(url, data={"clients": []}, content_type="application/json")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
 def test_client_registration_invalid_input(user_with_all_permissions, client):
     client.force_login(user_with_all_permissions)
     url = reverse("api:clients-general")
@@ -81,3 +201,33 @@ def test_client_remove(user_with_all_permissions, client):
     )
 
     assert response.status_code == status.HTTP_204_NO_CONTENT
+
+
+def test_client_registration_and_removal_evict_client_context(
+    user_with_all_permissions, client, django_capture_on_commit_callbacks
+):
+    client.force_login(user_with_all_permissions)
+    client_id = fake.uuid4()
+    assert get_client_context(client_id) is None
+
+    with django_capture_on_commit_callbacks(execute=True):
+        response = client.post(
+            reverse("api:clients-general"),
+            data={
+                "client_id": client_id,
+                "name": fake.name(),
+                "organisation_id": user_with_all_permissions.organisation.id,
+                "program_id": user_with_all_permissions.program.id,
+                "gender": GenderChoices.MALE,
+                "date_of_birth": fake.date_of_birth(minimum_age=18),
+            },
+            content_type="application/json",
+            accept="application/json",
+        )
+    assert response.status_code == status.HTTP_201_CREATED
+    assert get_client_context(client_id).program_id == user_with_all_permissions.program.id
+
+    with django_capture_on_commit_callbacks(execute=True):
+        response = client.delete(reverse("api:clients-detail", kwargs={"pk": client_id}))
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    assert get_client_context(client_id) is None
@@ -0,0 +1,93 @@
+import uuid
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from faker import Faker
+from model_bakery import baker
+
+from mycarehub.clients.bulk import CREATED, INVALID, UPDATED, upsert_clients
+from mycarehub.clients.context import get_client_context
+from mycarehub.clients.models import Client
+from mycarehub.users.models import GenderChoices
+
+fake = Faker()
+pytestmark = pytest.mark.django_db
+
+
+def client_row(program, **values):
+    return {
+        "client_id": str(uuid.uuid4()),
+        "name": fake.name(),
+        "gender": GenderChoices.FEMALE,
+        "date_of_birth": "1990-01-01",
+        "organisation_id": str(program.organisation_id),
+        "program_id": str(program.id),
+        **values,
+    }
+
+
+def test_upsert_clients(program):
+    existing = baker.make(Client, program=program, organisation=program.organisation)
+    rows = [
+        client_row(program),
+        client_row(program, client_id=str(existing.id), name="Renamed"),
+    ]
+
+    with CaptureQueriesContext(connection) as queries:
+        results = upsert_clients(rows)
+
+    # the organisations, programs and clients are looked up once, and written in one statement
+    assert len(queries) == 4
+    assert results == [
+        {"client_id": rows[0]["client_id"], "status": CREATED},
+        {"client_id": str(existing.id), "status": UPDATED},
+    ]
+    created = Client.objects.get(id=rows[0]["client_id"])
+    assert created.name == rows[0]["name"]
+    assert created.program == program
+    updated = Client.objects.get(id=existing.id)
+    assert updated.name == "Renamed"
+    assert updated.gender == GenderChoices.FEMALE
+    assert updated.created == existing.created
+    assert updated.enrollment_date == existing.enrollment_date
+
+    # sending the same clients again changes nothing
+    assert [result["status"] for result in upsert_clients(rows)] == [UPDATED, UPDATED]
+    assert Client.objects.filter(program=program).count() == 2
+
+
+def test_upsert_clients_invalid_rows(program):
+    valid = client_row(program)
+    rows = [
+        valid,
+        client_row(program, client_id="not-a-uuid"),
+        "not-a-client",
+        client_row(program, client_id=valid["client_id"]),
+        client_row(program, organisation_id=str(uuid.uuid4()), program_id=str(uuid.uuid4())),
+        client_row(program, name="x" * 256),
+    ]
+
+    results = upsert_clients(rows)
+
+    assert results[0] == {"client_id": valid["client_id"], "status": CREATED}
+    assert [result["status"] for result in results[1:]] == [INVALID] * 5
+    assert list(results[1]["errors"]) == ["client_id"]
+    assert results[2]["client_id"] is None
+    assert list(results[3]["errors"]) == ["client_id"]
+    assert set(results[4]["errors"]) == {"organisation_id", "program_id"}
+    assert list(results[5]["errors"]) == ["name"]
+    assert list(Client.objects.filter(program=program).values_list("id", flat=True)) == [
+        uuid.UUID(valid["client_id"])
+    ]
+
+
+def test_upsert_clients_evicts_client_contexts(program, django_capture_on_commit_callbacks):
+    other_program = baker.make("common.Program", organisation=program.organisation)
+    existing = baker.make(Client, program=program, organisation=program.organisation)
+    assert get_client_context(existing.id).program_id == program.id
+
+    with django_capture_on_commit_callbacks(execute=True):
+        upsert_clients([client_row(other_program, client_id=str(existing.id))])
+
+    assert get_client_context(existing.id).program_id == other_program.id
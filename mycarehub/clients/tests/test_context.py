@@ -0,0 +1,49 @@
+import uuid
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from model_bakery import baker
+
+from mycarehub.clients.context import (
+    ClientContext,
+    get_client_context,
+    invalidate_client_context,
+)
+from mycarehub.clients.models import Client
+from mycarehub.common.models import ContentSequence
+
+pytestmark = pytest.mark.django_db
+
+
+def test_get_client_context(program):
+    client = baker.make(Client, program=program)
+
+    with CaptureQueriesContext(connection) as queries:
+        assert get_client_context(client.id) == ClientContext(
+            client_id=client.id,
+            program_id=program.id,
+            enrollment_date=client.enrollment_date,
+            content_sequence=ContentSequence.INSTANT,
+            program_start_date=program.start_date,
+        )
+    assert len(queries) == 1
+
+    with CaptureQueriesContext(connection) as queries:
+        assert get_client_context(str(client.id)).program_id == program.id
+    assert len(queries) == 0
+
+
+def test_get_client_context_unknown_clients(program):
+    client_id = uuid.uuid4()
+
+    assert get_client_context("not-a-uuid") is None
+    assert get_client_context(client_id) is None
+    with CaptureQueriesContext(connection) as queries:
+        assert get_client_context(client_id) is None
+    assert len(queries) == 0
+
+    baker.make(Client, id=client_id, program=program)
+    assert get_client_context(client_id) is None
+    invalidate_client_context(client_id)
+    assert get_client_context(client_id).program_id == program.id
@@ -1,12 +1,29 @@
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import transaction
+from django.db.models import Prefetch
+from django.http import StreamingHttpResponse
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from mycarehub.common.models import Organisation, Program
+from mycarehub.common.models import Facility, Organisation, Program
 
+from .bulk import upsert_clients
+from .context import invalidate_client_context
 from .models import Client
-from .serializers import ClientSerializer
+from .pagination import iterate_clients, paginate_clients
+from .serializers import ClientBulkUpsertSerializer, ClientListQuerySerializer, ClientSerializer
+
+
+def stream_clients(clients, cursor=None):
+    """Yield the serialized clients as JSON lines, a chunk of clients at a time."""
+    for chunk in iterate_clients(clients, cursor):
+        yield "".join(
+            json.dumps(client, cls=DjangoJSONEncoder) + "\n"
+            for client in ClientSerializer(chunk, many=True).data
+        )
 
 
 class ClientAPIView(APIView):
@@ -14,10 +31,47 @@ class ClientAPIView(APIView):
     serializer_class = ClientSerializer
 
     def get(self, request):
-        users = Client.objects.all()
-        serializer = ClientSerializer(users, many=True)
-
-        return Response(status=status.HTTP_200_OK, data=serializer.data)
+        """
+        List clients, optionally only those of a program or an organisation.
+
+        All the matching clients are listed unless a page is requested with `?limit=`
+        or `?cursor=`, e.g. `GET /api/clients/?program_id=<uuid>&limit=500&cursor=<next>`
+
+        With `?stream=true` all the matching clients are streamed as JSON lines instead.
+        """
+        query = ClientListQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        params = query.validated_data
+
+        # the serialized programs only list the ids of their facilities
+        clients = Client.objects.select_related("organisation", "program").prefetch_related(
+            Prefetch("program__facilities", queryset=Facility.objects.only("id"))
+        )
+        for field in ["program_id", "organisation_id"]:
+            if field in params:
+                clients = clients.filter(**{field: params[field]})
+
+        if params["stream"]:
+            return StreamingHttpResponse(
+                stream_clients(clients, params.get("cursor")),
+                content_type="application/x-ndjson",
+            )
+
+        if "cursor" not in params and "limit" not in params:
+            # existing consumers expect a plain list of all the clients
+            serializer = ClientSerializer(clients, many=True)
+            return Response(status=status.HTTP_200_OK, data=serializer.data)
+
+        page, next_cursor = paginate_clients(
+            clients,
+            params.get("cursor"),
+            params.get("limit", ClientListQuerySerializer.DEFAULT_LIMIT),
+        )
+        data = {
+            "meta": {"next": next_cursor},
+            "items": ClientSerializer(page, many=True).data,
+        }
+        return Response(status=status.HTTP_200_OK, data=data)
 
     def post(self, request, format=None):
         serializer = self.serializer_class(data=request.data)
@@ -41,6 +95,7 @@ class ClientAPIView(APIView):
                         "program": program,
                     },
                 )
+                transaction.on_commit(lambda: invalidate_client_context(new_user.id))
 
                 # return the newly created client
                 serialized_client = ClientSerializer(new_user)
@@ -59,6 +114,7 @@ class ClientAPIView(APIView):
 
             with transaction.atomic():
                 user.delete()
+                transaction.on_commit(lambda: invalidate_client_context(pk))
 
         except Exception as e:  # pragma: nocover
             return Response(
@@ -67,3 +123,24 @@ class ClientAPIView(APIView):
             )  # pragma: nocover
 
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class ClientBulkUpsertView(APIView):
+    """
+    Register or update many clients at once.
+
+    e.g. `POST /api/clients/bulk/` with `{"clients": [{"client_id": <uuid>, ...}, ...]}`
+
+    The response has a result per client, in the order they were sent, telling
+    whether the client was created, updated or is invalid.
+    """
+
+    queryset = Client.objects.all()
+    serializer_class = ClientBulkUpsertSerializer
+
+    def post(self, request, format=None):
+        serializer = self.serializer_class(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        results = upsert_clients(serializer.validated_data["clients"], user_id=request.user.pk)
+        return Response({"results": results}, status=status.HTTP_200_OK)
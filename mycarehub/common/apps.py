@@ -5,3 +5,6 @@ from django.utils.translation import gettext_lazy as _
 class CommonConfig(AppConfig):
     name = "mycarehub.common"
     verbose_name = _("Common")
+
+    def ready(self):
+        import mycarehub.common.signals  # noqa F401
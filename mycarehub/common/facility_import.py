@@ -0,0 +1,164 @@
+"""
+Import of facilities from the Kenya Master Health Facilities List (MFL).
+
+The MFL is exported as a spreadsheet (see `data/all_mfl_facilities.xlsx`) with
+a header row and a row per facility. The workbook is streamed a row at a time
+and the facilities are written in batches keyed on their MFL code: each batch
+is compared with the facilities that already exist, and only the new and the
+changed ones are written, in a single upsert. Importing an unchanged
+spreadsheet again does not write anything.
+
+Rows without a valid MFL code, or whose county is not one of the counties the
+project operates in (`get_counties`), are skipped. Constituencies, sub-counties
+and wards that are not in the facility's county are left out.
+"""
+import logging
+from collections import Counter
+from itertools import islice
+
+from openpyxl import load_workbook
+
+from mycarehub.common.models import BulkValidationError, Facility
+from mycarehub.common.utils import get_counties, has_constituency, has_sub_county, has_ward
+
+LOGGER = logging.getLogger(__name__)
+
+# the number of spreadsheet rows that are compared and written together
+IMPORT_BATCH_SIZE = 1000
+
+# the facility fields that are imported and the spreadsheet columns they are read from
+MFL_COLUMNS = {
+    "mfl_code": "Code",
+    "name": "Name",
+    "county": "County",
+    "constituency": "Constituency",
+    "sub_county": "Sub county",
+    "ward": "Ward",
+}
+IMPORTED_FIELDS = [field for field in MFL_COLUMNS if field != "mfl_code"]
+
+INSERTED = "inserted"
+UPDATED = "updated"
+UNCHANGED = "unchanged"
+SKIPPED = "skipped"
+
+
+def read_mfl_rows(path):
+    """Stream the rows of an MFL spreadsheet as dicts of the imported facility fields."""
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = [str(column).strip() for column in next(rows, ())]
+        missing = [column for column in MFL_COLUMNS.values() if column not in header]
+        if missing:
+            raise ValueError(f"the spreadsheet has no {', '.join(missing)} column(s)")
+
+        positions = {field: header.index(column) for field, column in MFL_COLUMNS.items()}
+        for row in rows:
+            yield {field: row[position] for field, position in positions.items()}
+    finally:
+        workbook.close()
+
+
+def _clean_row(row, counties):
+    """Return the facility values of a row, or None when the row is skipped."""
+    try:
+        mfl_code = int(str(row["mfl_code"]).strip())
+    except ValueError:
+        return None
+
+    name, county, constituency, sub_county, ward = (
+        str(row[field] or "").strip()
+        for field in ["name", "county", "constituency", "sub_county", "ward"]
+    )
+    if not name or county not in counties:
+        return None
+
+    if not has_sub_county(county, sub_county):
+        sub_county = None
+    return {
+        "mfl_code": mfl_code,
+        "name": name,
+        "county": county,
+        "constituency": constituency if has_constituency(county, constituency) else None,
+        "sub_county": sub_county,
+        "ward": ward if sub_county and has_ward(sub_county, ward) else None,
+    }
+
+
+def _import_batch(rows, counts, user_id):
+    existing = {
+        facility.mfl_code: facility
+        for facility in Facility.objects.filter(
+            mfl_code__in=[row["mfl_code"] for row in rows]
+        ).only("mfl_code", *IMPORTED_FIELDS)
+    }
+    # names are unique too, a name that another facility holds can not be taken
+    name_holders = dict(
+        Facility.objects.filter(name__in=[row["name"] for row in rows]).values_list(
+            "name", "mfl_code"
+        )
+    )
+
+    writes = []
+    for row in rows:
+        facility = existing.get(row["mfl_code"])
+        if name_holders.get(row["name"], row["mfl_code"]) != row["mfl_code"]:
+            LOGGER.warning(f"facility {row['mfl_code']} skipped, {row['name']} is taken")
+            counts[SKIPPED] += 1
+        elif facility is None:
+            writes.append((INSERTED, Facility(**row)))
+        elif any(getattr(facility, field) != row[field] for field in IMPORTED_FIELDS):
+            writes.append((UPDATED, Facility(**row)))
+        else:
+            counts[UNCHANGED] += 1
+
+    try:
+        Facility.objects.validated_bulk_upsert(
+            [facility for _, facility in writes],
+            unique_fields=["mfl_code"],
+            update_fields=IMPORTED_FIELDS,
+            user_id=user_id,
+        )
+    except BulkValidationError as e:
+        for index, errors in e.row_errors.items():
+            LOGGER.warning(f"facility {writes[index][1].mfl_code} skipped: {errors}")
+        counts[SKIPPED] += len(e.row_errors)
+        writes = [write for index, write in enumerate(writes) if index not in e.row_errors]
+        Facility.objects.validated_bulk_upsert(
+            [facility for _, facility in writes],
+            unique_fields=["mfl_code"],
+            update_fields=IMPORTED_FIELDS,
+            user_id=user_id,
+        )
+
+    counts.update(outcome for outcome, _ in writes)
+
+
+def import_facilities(path, batch_size=IMPORT_BATCH_SIZE, user_id=None):
+    """
+    Insert and update facilities from an MFL spreadsheet.
+
+    Returns the number of facilities that were inserted, updated, unchanged and
+    skipped.
+    """
+    counties = {county for county, _ in get_counties()}
+    counts = Counter({INSERTED: 0, UPDATED: 0, UNCHANGED: 0, SKIPPED: 0})
+    seen = set()
+
+    rows = read_mfl_rows(path)
+    while batch := list(islice(rows, batch_size)):
+        cleaned = []
+        for row in batch:
+            row = _clean_row(row, counties)
+            # a facility that is listed twice is imported from its first row
+            if row is None or row["mfl_code"] in seen or row["name"] in seen:
+                counts[SKIPPED] += 1
+                continue
+
+            seen.update([row["mfl_code"], row["name"]])
+            cleaned.append(row)
+
+        _import_batch(cleaned, counts, user_id)
+
+    return dict(counts)
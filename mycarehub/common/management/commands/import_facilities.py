@@ -0,0 +1,30 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from mycarehub.common.facility_import import IMPORT_BATCH_SIZE, import_facilities
+
+
+class Command(BaseCommand):
+    help = (
+        "Insert and update facilities from a Kenya Master Health Facilities List spreadsheet, "
+        "keyed on their MFL codes."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "path",
+            nargs="?",
+            default=str(settings.ROOT_DIR / "data" / "all_mfl_facilities.xlsx"),
+            help="The MFL spreadsheet (.xlsx) to import.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=IMPORT_BATCH_SIZE,
+            help="The number of spreadsheet rows that are compared and written together.",
+        )
+
+    def handle(self, *args, **options):
+        counts = import_facilities(options["path"], batch_size=options["batch_size"])
+        for outcome, total in counts.items():
+            self.stdout.write(f"{outcome}: {total}")
@@ -2,6 +2,7 @@ from .base_models import (
     AbstractBase,
     AbstractBaseManager,
     AbstractBaseQuerySet,
+    BulkValidationError,
     OwnerlessAbstractBase,
     OwnerlessAbstractBaseManager,
     OwnerlessAbstractBaseQuerySet,
@@ -20,6 +21,7 @@ __all__ = [
     "AbstractBase",
     "AbstractBaseManager",
     "AbstractBaseQuerySet",
+    "BulkValidationError",
     "Facility",
     "Organisation",
     "OrganisationAbstractBase",
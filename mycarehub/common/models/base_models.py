@@ -17,6 +17,9 @@ from .utils import unique_list
 LOGGER = logging.getLogger(__file__)
 T_OA = TypeVar("T_OA", bound="OwnerlessAbstractBase", covariant=True)
 
+# the audit fields that are never changed once a record is created
+CREATED_AND_CREATED_BY = ("created", "created_by")
+
 
 # =============================================================================
 # QUERYSETS
@@ -41,21 +44,102 @@ class AbstractBaseQuerySet(OwnerlessAbstractBaseQuerySet[T_OA]):  # noqa
     ...
 
 
+# =============================================================================
+# EXCEPTIONS
+# =============================================================================
+
+
+class BulkValidationError(ValidationError):
+    """Raised when some of the records of a bulk write are not valid.
+
+    `row_errors` maps the position of each invalid record to its errors.
+    """
+
+    def __init__(self, row_errors):
+        self.row_errors = row_errors
+        super().__init__(f"{len(row_errors)} of the records are not valid")
+
+
 # =============================================================================
 # MANAGERS
 # =============================================================================
 
 
 class OwnerlessAbstractBaseManager(models.Manager[T_OA]):  # noqa
-    """Base manager for all models not linked to an organisation."""
+    """Base manager for all models not linked to an organisation.
+
+    The `validated_bulk_*` methods write many records in chunked multi-row
+    statements. Like `save`, they populate the audit fields and validate each
+    record (without the validators that query the database) before writing any.
+    """
 
     use_for_related_fields = True
     use_in_migrations = True
 
+    # the number of records that are written per statement by the bulk methods
+    bulk_batch_size = 1000
+
     def active(self):
         """Return all the records marked as active."""
         return self.get_queryset().active()
 
+    def _prepare_bulk_write(self, objs, user_id, is_create):
+        """Populate the audit fields of records and validate them."""
+        now = timezone.now()
+        row_errors = {}
+        for index, obj in enumerate(objs):
+            obj.updated = now
+            obj.updated_by = user_id
+            if is_create:
+                obj.created_by = user_id
+            try:
+                obj.clean_without_queries()
+            except ValidationError as e:
+                row_errors[index] = e.message_dict
+
+        if row_errors:
+            raise BulkValidationError(row_errors)
+
+    def _get_bulk_update_fields(self, fields):
+        return unique_list(
+            [field for field in fields if field not in CREATED_AND_CREATED_BY]
+            + ["updated", "updated_by"]
+        )
+
+    def validated_bulk_create(self, objs, user_id=None, batch_size=None):
+        """Validate and insert new records."""
+        objs = list(objs)
+        self._prepare_bulk_write(objs, user_id, is_create=True)
+        return self.bulk_create(objs, batch_size=batch_size or self.bulk_batch_size)
+
+    def validated_bulk_update(self, objs, fields, user_id=None, batch_size=None):
+        """Validate existing records and write the given fields."""
+        objs = list(objs)
+        self._prepare_bulk_write(objs, user_id, is_create=False)
+        return self.bulk_update(
+            objs,
+            self._get_bulk_update_fields(fields),
+            batch_size=batch_size or self.bulk_batch_size,
+        )
+
+    def validated_bulk_upsert(
+        self, objs, unique_fields, update_fields, user_id=None, batch_size=None
+    ):
+        """Validate records, inserting new ones and updating the ones that already exist.
+
+        Records that conflict with an existing record on `unique_fields` update
+        its `update_fields`. Existing records keep their created and created_by values.
+        """
+        objs = list(objs)
+        self._prepare_bulk_write(objs, user_id, is_create=True)
+        return self.bulk_create(
+            objs,
+            batch_size=batch_size or self.bulk_batch_size,
+            update_conflicts=True,
+            unique_fields=unique_fields,
+            update_fields=self._get_bulk_update_fields(update_fields),
+        )
+
     def get_queryset(self):
         return OwnerlessAbstractBaseQuerySet(self.model, using=self.db)  # pragma: nocover
 
@@ -134,18 +218,20 @@ class OwnerlessAbstractBase(models.Model, metaclass=ValidationMetaclass):
             # using dates to avoid a lot of fuss about milliseconds etc
             raise ValidationError("The updated date cannot be less than the created date")
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the created and created_by values that were loaded from the database."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_created_and_created_by = {
+            field: instance.__dict__[field]
+            for field in CREATED_AND_CREATED_BY
+            if field in instance.__dict__
+        }
+        return instance
+
     def preserve_created_and_created_by(self):
         """Ensure that in created and created_by fields are not overwritten."""
-        try:
-            original = self.__class__.objects.get(pk=self.pk)
-            self.created = original.created
-            self.created_by = original.created_by
-        except self.__class__.DoesNotExist:
-            LOGGER.debug(
-                "preserve_created_and_created_by "
-                "Could not find an instance of {} with pk {} hence treating "
-                "this as a new record.".format(self.__class__, self.pk)
-            )
+        self.__dict__.update(getattr(self, "_loaded_created_and_created_by", {}))
 
     def run_model_validators(self):
         """Ensure that all model validators run."""
@@ -174,12 +260,57 @@ class OwnerlessAbstractBase(models.Model, metaclass=ValidationMetaclass):
         self.run_model_validators()
         super().clean()
 
-    def save(self, *args, **kwargs):
-        """Handle audit fields correctly when saving."""
+    def get_update_fields(self, update_fields=None):
+        """Return the fields that saving an existing record writes, leaving out created(_by)."""
+        if update_fields is None:
+            deferred_fields = self.get_deferred_fields()
+            update_fields = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.attname not in deferred_fields
+            ]
+        return [field for field in update_fields if field not in CREATED_AND_CREATED_BY]
+
+    def clean_without_queries(self):
+        """Run the field and model validators, skipping the ones that query the database."""
+        errors = {}
+        try:
+            self.clean_fields(
+                exclude=[field.name for field in self._meta.fields if field.is_relation]
+            )
+        except ValidationError as e:
+            errors = e.update_error_dict(errors)
+        try:
+            self.clean()
+        except ValidationError as e:
+            errors = e.update_error_dict(errors)
+
+        self._raise_errors(errors)
+
+    def save(self, *args, full_validation=True, **kwargs):
+        """Handle audit fields correctly when saving.
+
+        New records are inserted without looking them up first. Existing records
+        keep the created and created_by values they were loaded with, and are
+        saved without writing them.
+
+        Callers that have already validated the related objects and unique
+        constraints (e.g. in a serializer) can skip the validators that query the
+        database with `full_validation=False`.
+        """
         self.updated = timezone.now() if self.updated is None else self.updated
-        self.preserve_created_and_created_by()
-        self.full_clean()
+        if not self._state.adding:
+            self.preserve_created_and_created_by()
+            kwargs["update_fields"] = self.get_update_fields(kwargs.get("update_fields"))
+
+        if full_validation:
+            self.full_clean()
+        else:
+            self.clean_without_queries()
         super().save(*args, **kwargs)
+        self._loaded_created_and_created_by = {
+            field: getattr(self, field) for field in CREATED_AND_CREATED_BY
+        }
 
     class Meta:
         """Define a sensible default ordering."""
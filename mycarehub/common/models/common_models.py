@@ -6,7 +6,16 @@ from django.db.models import Q
 from django.db.models.fields.json import JSONField
 from django.utils import timezone
 
-from ..utils import get_constituencies, get_counties, get_sub_counties, get_wards
+from ..utils import (
+    get_administrative_unit_index,
+    get_constituencies,
+    get_counties,
+    get_sub_counties,
+    get_wards,
+    has_constituency,
+    has_sub_county,
+    has_ward,
+)
 from .base_models import AbstractBase, AbstractBaseManager, AbstractBaseQuerySet
 
 User = get_user_model()
@@ -55,19 +64,45 @@ class Facility(AbstractBase):
     name = models.TextField(unique=True)
     description = models.TextField(blank=True, default="")
     mfl_code = models.IntegerField(unique=True, help_text="MFL Code", blank=True, null=True)
-    county = models.CharField(max_length=64, choices=get_counties(), null=True, blank=True)
+    county = models.CharField(
+        max_length=64, choices=get_counties(), null=True, blank=True, db_index=True
+    )
+    constituency = models.CharField(
+        max_length=150, choices=get_constituencies(), null=True, blank=True, db_index=True
+    )
+    sub_county = models.CharField(
+        max_length=150, choices=get_sub_counties(), null=True, blank=True, db_index=True
+    )
+    ward = models.CharField(
+        max_length=150, choices=get_wards(), null=True, blank=True, db_index=True
+    )
     phone = models.CharField(max_length=15, null=True, blank=True)
 
     objects = FacilityManager()
 
     model_validators = [
         "check_facility_name_longer_than_three_characters",
+        "check_administrative_units_belong_to_county",
     ]
 
     def check_facility_name_longer_than_three_characters(self):
         if len(self.name) < 3:
             raise ValidationError("the facility name should exceed 3 characters")
 
+    def check_administrative_units_belong_to_county(self):
+        if self.county not in get_administrative_unit_index().counties:
+            return
+
+        errors = {}
+        if self.constituency and not has_constituency(self.county, self.constituency):
+            errors["constituency"] = f'"{self.constituency}" is not in {self.county} county'
+        if self.sub_county and not has_sub_county(self.county, self.sub_county):
+            errors["sub_county"] = f'"{self.sub_county}" is not in {self.county} county'
+        elif self.sub_county and self.ward and not has_ward(self.sub_county, self.ward):
+            errors["ward"] = f'"{self.ward}" is not in {self.sub_county} sub county'
+        if errors:
+            raise ValidationError(errors)
+
     def __str__(self):
         return f"{self.name}"
 
@@ -93,6 +128,14 @@ class UserFacilityAllotment(AbstractBase):
         SUB_COUNTY = "sub_county"
         WARD = "ward"
 
+    # the allotment field that holds the selected regions of each region type
+    REGION_FIELDS = {
+        RegionType.COUNTY.value: "counties",
+        RegionType.CONSTITUENCY.value: "constituencies",
+        RegionType.SUB_COUNTY.value: "sub_counties",
+        RegionType.WARD.value: "wards",
+    }
+
     user = models.OneToOneField(User, on_delete=models.PROTECT)
     allotment_type = models.CharField(max_length=10, choices=AllotmentType.choices)
     region_type = models.CharField(
@@ -261,11 +304,12 @@ class UserFacilityAllotment(AbstractBase):
     def _get_allot_by_region_filter(allotment: "UserFacilityAllotment"):
         """Helper for generating a queryset filter."""
 
-        by_region_filter = {}
-        if allotment.region_type == UserFacilityAllotment.RegionType.COUNTY.value:
-            by_region_filter["county__in"] = allotment.counties
+        # the facility field of each region type is named after the region type
+        region_field = UserFacilityAllotment.REGION_FIELDS.get(allotment.region_type)
+        if region_field is None:
+            return {"pk__in": []}
 
-        return by_region_filter
+        return {f"{allotment.region_type}__in": getattr(allotment, region_field) or []}
 
     class Meta(AbstractBase.Meta):
         """Define ordering and other attributes for attachments."""
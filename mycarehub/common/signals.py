@@ -0,0 +1,13 @@
+from django.conf import settings
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from mycarehub.common.models import Organisation, Program
+from mycarehub.utils.general_utils import clear_defaults
+
+
+@receiver(post_delete, sender=Organisation)
+@receiver(post_delete, sender=Program)
+def clear_deleted_defaults(sender, instance, **kwargs):
+    if str(instance.pk) in (settings.DEFAULT_ORG_ID, settings.DEFAULT_PROGRAM_ID):
+        clear_defaults()
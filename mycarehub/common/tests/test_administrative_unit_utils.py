@@ -1,11 +1,15 @@
 import pytest
 
 from mycarehub.common.utils import (
+    get_administrative_unit_index,
     get_constituencies,
     get_constituencies_for_county,
     get_counties,
+    get_county_for_constituency,
+    get_county_for_sub_county,
     get_sub_counties,
     get_sub_counties_for_county,
+    get_sub_counties_for_ward,
     get_wards,
     get_wards_for_sub_county,
     has_constituency,
@@ -123,3 +127,32 @@ def test_has_wards():
 def test_has_ward_with_missing_sub_county():
     with pytest.raises(ValueError):
         assert has_ward("Kitui", "Kitui")
+
+
+def test_get_administrative_unit_index():
+    index = get_administrative_unit_index()
+    assert index is get_administrative_unit_index()
+    assert index.counties == frozenset(["Kajiado", "Nairobi"])
+    assert index.wards_by_sub_county["Dagoretti North"][0] == "Gatini"
+    with pytest.raises(TypeError):
+        index.county_by_sub_county["Naivasha"] = "Nakuru"
+
+
+def test_get_county_for_constituency():
+    assert get_county_for_constituency("Magadi") == "Kajiado"
+    assert get_county_for_constituency("Starehe") == "Nairobi"
+    assert get_county_for_constituency("Lamu") is None
+
+
+def test_get_county_for_sub_county():
+    assert get_county_for_sub_county("Loitokitok") == "Kajiado"
+    assert get_county_for_sub_county("Westlands") == "Nairobi"
+    assert get_county_for_sub_county("Naivasha") is None
+
+
+def test_get_sub_counties_for_ward():
+    assert get_sub_counties_for_ward("Kilimani") == frozenset(["Dagoretti North"])
+    assert get_sub_counties_for_ward("Maringo/Hamza") == frozenset(["Embakasi West", "Makadara"])
+    assert get_sub_counties_for_ward("Kitui") == frozenset()
+    assert has_ward("Makadara", "Maringo/Hamza")
+    assert has_ward("Embakasi West", "Maringo/Hamza")
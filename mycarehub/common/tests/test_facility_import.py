@@ -0,0 +1,127 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from model_bakery import baker
+from openpyxl import Workbook
+
+from mycarehub.common.facility_import import import_facilities
+from mycarehub.common.models import Facility
+
+pytestmark = pytest.mark.django_db
+
+HEADER = ["Code", "Name", "Officialname", "County", "Constituency", "Sub county", "Ward"]
+
+
+def make_workbook(path, rows, header=HEADER):
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(header)
+    for row in rows:
+        sheet.append(row)
+    workbook.save(path)
+    return path
+
+
+@pytest.fixture
+def mfl_rows():
+    return [
+        [
+            "100",
+            "Kajiado Hospital",
+            "Kajiado County Hospital",
+            "Kajiado",
+            "Kajiado Central",
+            "Kajiado Central",
+            "Ildamat",
+        ],
+        ["101", "Kibera Clinic", "Kibera Clinic", "Nairobi", "Kibra", "Kibra", "Makina"],
+        ["102", "Pumwani Hospital", "Pumwani Hospital", "Nairobi", "Ruaraka", "Kamukunji", ""],
+    ]
+
+
+def test_import_facilities(mfl_rows, tmp_path):
+    path = make_workbook(tmp_path / "mfl.xlsx", mfl_rows)
+
+    assert import_facilities(path, batch_size=2) == {
+        "inserted": 3,
+        "updated": 0,
+        "unchanged": 0,
+        "skipped": 0,
+    }
+    # units that are not in the facility's county are left out
+    assert set(
+        Facility.objects.values_list("mfl_code", "county", "constituency", "sub_county", "ward")
+    ) == {
+        (100, "Kajiado", "Kajiado Central", "Kajiado Central", "Ildamat"),
+        (101, "Nairobi", "Kibra", "Kibra", None),
+        (102, "Nairobi", "Ruaraka", "Kamukunji", None),
+    }
+
+    # importing an unchanged spreadsheet writes nothing
+    with CaptureQueriesContext(connection) as queries:
+        assert import_facilities(path, batch_size=2) == {
+            "inserted": 0,
+            "updated": 0,
+            "unchanged": 3,
+            "skipped": 0,
+        }
+    assert all(query["sql"].startswith("SELECT") for query in queries)
+
+    created = Facility.objects.get(mfl_code=101).created
+    mfl_rows[1][1] = "Kibera Health Centre"
+    path = make_workbook(tmp_path / "mfl.xlsx", mfl_rows)
+    assert import_facilities(path)["updated"] == 1
+    facility = Facility.objects.get(mfl_code=101)
+    assert facility.name == "Kibera Health Centre"
+    assert facility.created == created
+
+
+def test_import_facilities_skips_rows(mfl_rows, tmp_path):
+    baker.make(Facility, name="Mbagathi Hospital", mfl_code=999, county="Nairobi")
+    path = make_workbook(
+        tmp_path / "mfl.xlsx",
+        mfl_rows
+        + [
+            ["None", "Uncoded Clinic", "Uncoded Clinic", "Nairobi", "Kibra", "Kibra", ""],
+            ["103", "Busia Hospital", "Busia Hospital", "Busia", "Matayos", "Matayos", ""],
+            ["104", "", "", "Nairobi", "Kibra", "Kibra", ""],
+            ["100", "Kajiado Annex", "Kajiado Annex", "Kajiado", "", "", ""],
+            ["105", "Mbagathi Hospital", "Mbagathi Hospital", "Nairobi", "", "", ""],
+            ["106", "Ab", "Ab", "Nairobi", "", "", ""],
+        ],
+    )
+
+    assert import_facilities(path) == {
+        "inserted": 3,
+        "updated": 0,
+        "unchanged": 0,
+        "skipped": 6,
+    }
+    assert Facility.objects.get(mfl_code=100).name == "Kajiado Hospital"
+    assert not Facility.objects.filter(mfl_code__in=[103, 104, 105, 106]).exists()
+
+
+def test_import_facilities_missing_columns(tmp_path):
+    path = make_workbook(tmp_path / "mfl.xlsx", [], header=HEADER[:3])
+
+    with pytest.raises(
+        ValueError, match="the spreadsheet has no County, Constituency, Sub county, Ward column"
+    ):
+        import_facilities(path)
+
+
+def test_import_facilities_command(mfl_rows, tmp_path):
+    path = make_workbook(tmp_path / "mfl.xlsx", mfl_rows)
+    stdout = StringIO()
+
+    call_command("import_facilities", str(path), stdout=stdout)
+
+    assert stdout.getvalue().splitlines() == [
+        "inserted: 3",
+        "updated: 0",
+        "unchanged: 0",
+        "skipped: 0",
+    ]
@@ -8,13 +8,16 @@ import pytest
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from faker import Faker
 from model_bakery import baker
 from PIL import Image
 
 from mycarehub.common.models import (
+    BulkValidationError,
     Facility,
     Organisation,
     OwnerlessAbstractBase,
@@ -103,6 +106,35 @@ def test_facility_error_saving():
     assert "the facility name should exceed 3 characters" in e.value.messages
 
 
+def test_facility_administrative_units_belong_to_county():
+    organisation = baker.make("common.Organisation")
+    facility = Facility(
+        name=fake.name(),
+        county="Nairobi",
+        constituency="Kajiado East",
+        sub_county="Kibra",
+        ward="Ngong",
+        organisation=organisation,
+    )
+    with pytest.raises(ValidationError) as e:
+        facility.save()
+
+    assert e.value.message_dict == {
+        "constituency": ['"Kajiado East" is not in Nairobi county'],
+        "ward": ['"Ngong" is not in Kibra sub county'],
+    }
+
+    facility.sub_county = "Kajiado North"
+    with pytest.raises(ValidationError) as e:
+        facility.save()
+    assert e.value.message_dict["sub_county"] == ['"Kajiado North" is not in Nairobi county']
+
+    facility.county = "Kajiado"
+    facility.constituency = "Kajiado East"
+    facility.save()
+    assert Facility.objects.get(pk=facility.pk).ward == "Ngong"
+
+
 def test_organisation_string_representation():
     org = baker.make("common.Organisation", name="Test Organisation")
     assert str(org) == "Test Organisation"
@@ -169,6 +201,68 @@ def test_duplicate_validator_ignored():
     validation_one.assert_called_once_with()
 
 
+def test_validated_bulk_create():
+    """Test that records are validated and audited before they are inserted in bulk."""
+    user_id = uuid.uuid4()
+    facilities = [Facility(name=f"Facility {i}", mfl_code=i) for i in range(1, 6)]
+
+    with CaptureQueriesContext(connection) as queries:
+        Facility.objects.validated_bulk_create(facilities, user_id=user_id, batch_size=2)
+
+    assert len([query for query in queries if query["sql"].startswith("INSERT")]) == 3
+    assert Facility.objects.filter(mfl_code__in=range(1, 6), created_by=user_id).count() == 5
+
+
+def test_validated_bulk_create_row_errors():
+    """Test that nothing is written when any of the records is not valid."""
+    facilities = [
+        Facility(name="Facility 1", mfl_code=1),
+        Facility(name="F2", mfl_code=2),
+        Facility(name="Facility 3", mfl_code=3, county="Atlantis"),
+    ]
+
+    with pytest.raises(BulkValidationError) as e:
+        Facility.objects.validated_bulk_create(facilities)
+
+    assert e.value.row_errors == {
+        1: {"__all__": ["the facility name should exceed 3 characters"]},
+        2: {"county": ["Value 'Atlantis' is not a valid choice."]},
+    }
+    assert not Facility.objects.filter(mfl_code__in=[1, 2, 3]).exists()
+
+
+def test_validated_bulk_update_and_upsert():
+    """Test that bulk updates and upserts never overwrite created and created_by."""
+    creator_id, editor_id = uuid.uuid4(), uuid.uuid4()
+    facility = baker.make(Facility, name="Facility 1", mfl_code=1, created_by=creator_id)
+
+    facility.description = "updated"
+    facility.created_by = editor_id
+    Facility.objects.validated_bulk_update(
+        [facility], ["description", "created_by"], user_id=editor_id
+    )
+
+    facility.refresh_from_db()
+    assert facility.description == "updated"
+    assert facility.created_by == creator_id
+    assert facility.updated_by == editor_id
+
+    Facility.objects.validated_bulk_upsert(
+        [
+            Facility(name="Facility 1", mfl_code=1, description="upserted"),
+            Facility(name="Facility 2", mfl_code=2),
+        ],
+        unique_fields=["mfl_code"],
+        update_fields=["name", "description", "created_by"],
+        user_id=editor_id,
+    )
+
+    facility.refresh_from_db()
+    assert facility.description == "upserted"
+    assert facility.created_by == creator_id
+    assert Facility.objects.get(mfl_code=2).created_by == editor_id
+
+
 def test_abstract_base_manager_get_active():
     """Tests for AbstractBaseManager."""
     organisation = baker.make(Organisation)
@@ -277,6 +371,62 @@ class AuditAbstractBaseModelTest(TestCase):
         instance.save()
         assert timezone.is_aware(instance.created)
 
+    def test_save_does_not_look_up_records(self):
+        """Test that saving a record does not select it first."""
+        facility = baker.make(Facility, created=self.jana, created_by=self.user_1.pk)
+
+        facility.created = self.juzi
+        facility.name = "Renamed"
+        with CaptureQueriesContext(connection) as queries:
+            facility.save(full_validation=False)
+
+        assert [query["sql"].split()[0] for query in queries] == ["UPDATE"]
+        set_clause = queries[0]["sql"].split(" WHERE ")[0]
+        assert '"created"' not in set_clause
+        assert '"created_by"' not in set_clause
+        assert facility.created == self.jana
+        facility.refresh_from_db()
+        assert facility.name == "Renamed"
+        assert facility.created == self.jana
+
+        new_facility = Facility(name="New", mfl_code=randint(1, 999_999), county="Nairobi")
+        with CaptureQueriesContext(connection) as queries:
+            new_facility.save(full_validation=False)
+
+        assert [query["sql"].split()[0] for query in queries] == ["INSERT"]
+
+    def test_save_update_fields(self):
+        """Test that created and created_by are never written to existing records."""
+        facility = Facility.objects.only("id", "name", "updated").get(
+            id=baker.make(Facility, created=self.jana, created_by=self.user_1.pk).id
+        )
+        facility.name = "Renamed"
+        facility.save(update_fields=["name", "created"])
+
+        facility = Facility.objects.get(id=facility.id)
+        assert facility.name == "Renamed"
+        assert facility.created == self.jana
+        assert facility.created_by == self.user_1.pk
+
+        facility.created_by = self.user_2.pk
+        facility.save()
+        assert Facility.objects.get(id=facility.id).created_by == self.user_1.pk
+
+    def test_save_without_full_validation(self):
+        """Test that model validators still run when full validation is skipped."""
+        facility = Facility(created=self.leo, updated=self.juzi)
+
+        with pytest.raises(ValidationError) as e:
+            facility.save(full_validation=False)
+
+        assert e.value.message_dict == {
+            "name": ["This field cannot be blank."],
+            "__all__": [
+                "The updated date cannot be less than the created date",
+                "the facility name should exceed 3 characters",
+            ],
+        }
+
     def test_owner(self):
         """Test for test owner."""
         org = baker.make(Organisation, name="Savannah Informatics")
@@ -591,3 +741,58 @@ class UserFacilityAllotmentTest(TestCase):
         allotment.save()
 
         assert UserFacilityAllotment.get_facilities_for_allotment(allotment).count() == 5
+
+    def test_user_facility_allotment_by_constituency_sub_county_and_ward(self):
+        """Test that a user can be allotted facilities by every region type."""
+
+        baker.make(
+            Facility,
+            3,
+            county="Nairobi",
+            constituency="Kibra",
+            sub_county="Kibra",
+            ward="Lindi",
+            organisation=self.organisation,
+        )
+        baker.make(
+            Facility,
+            4,
+            county="Nairobi",
+            constituency="Starehe",
+            sub_county="Starehe",
+            ward="Ngara",
+            organisation=self.organisation,
+        )
+        user = baker.make(
+            get_user_model(),
+            name=fake.name(),
+            organisation=self.organisation,
+            program=self.program,
+        )
+        allotment = baker.make(
+            UserFacilityAllotment,
+            allotment_type=self.by_region.value,
+            organisation=self.organisation,
+            region_type=UserFacilityAllotment.RegionType.CONSTITUENCY.value,
+            constituencies=["Kibra"],
+            user=user,
+        )
+        assert UserFacilityAllotment.get_facilities_for_allotment(allotment).count() == 3
+
+        allotment.region_type = UserFacilityAllotment.RegionType.SUB_COUNTY.value
+        allotment.sub_counties = ["Kibra", "Starehe"]
+        allotment.save()
+        assert UserFacilityAllotment.get_facilities_for_allotment(allotment).count() == 7
+
+        allotment.region_type = UserFacilityAllotment.RegionType.WARD.value
+        allotment.wards = ["Ngara"]
+        allotment.save()
+        assert UserFacilityAllotment.get_facilities_for_allotment(allotment).count() == 4
+
+        allotment.allotment_type = self.by_both.value
+        allotment.facilities.set(self.facilities)
+        assert UserFacilityAllotment.get_facilities_for_allotment(allotment).count() == 9
+
+        # without a region type, only the allotted facilities are included
+        allotment.region_type = None
+        assert UserFacilityAllotment.get_facilities_for_allotment(allotment).count() == 5
@@ -1,9 +1,14 @@
 from .administrative_unit_utils import (
+    AdministrativeUnitIndex,
+    get_administrative_unit_index,
     get_constituencies,
     get_constituencies_for_county,
     get_counties,
+    get_county_for_constituency,
+    get_county_for_sub_county,
     get_sub_counties,
     get_sub_counties_for_county,
+    get_sub_counties_for_ward,
     get_wards,
     get_wards_for_sub_county,
     has_constituency,
@@ -12,11 +17,16 @@ from .administrative_unit_utils import (
 )
 
 __all__ = [
+    "AdministrativeUnitIndex",
+    "get_administrative_unit_index",
     "get_constituencies",
     "get_constituencies_for_county",
     "get_counties",
+    "get_county_for_constituency",
+    "get_county_for_sub_county",
     "get_sub_counties",
     "get_sub_counties_for_county",
+    "get_sub_counties_for_ward",
     "get_wards",
     "get_wards_for_sub_county",
     "has_constituency",
@@ -1,6 +1,16 @@
 from functools import lru_cache
-from itertools import chain
-from typing import Collection, Dict, Iterable, Optional, Tuple, cast
+from types import MappingProxyType
+from typing import (
+    Collection,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    cast,
+)
 
 from ..constants import ADMINISTRATIVE_UNITS
 
@@ -10,6 +20,22 @@ _CONSTITUENCIES = "Constituencies"
 _SUB_COUNTIES = "Sub Counties"
 
 
+class AdministrativeUnitIndex(NamedTuple):
+    """The administrative units of the myCareHub Project, indexed by parent and by child.
+
+    Constituency and sub-county names are unique across counties but ward names are
+    not, a ward is therefore looked up with the sub-counties that have a ward by its name.
+    """
+
+    counties: FrozenSet[str]
+    constituencies_by_county: Mapping[str, Tuple[str, ...]]
+    sub_counties_by_county: Mapping[str, Tuple[str, ...]]
+    wards_by_sub_county: Mapping[str, Tuple[str, ...]]
+    county_by_constituency: Mapping[str, str]
+    county_by_sub_county: Mapping[str, str]
+    sub_counties_by_ward: Mapping[str, FrozenSet[str]]
+
+
 def _sorted_field_choices(choices: Iterable[FieldChoice]) -> Collection[FieldChoice]:
     # Sort by the display value rather than the storage value. This way, the choices
     # appear sorted on the select DOM component of the user interface.
@@ -17,6 +43,52 @@ def _sorted_field_choices(choices: Iterable[FieldChoice]) -> Collection[FieldCho
     return tuple(sorted_choices)
 
 
+def _field_choices(names: Iterable[str]) -> Collection[FieldChoice]:
+    return _sorted_field_choices((name, name) for name in names)
+
+
+@lru_cache(maxsize=None)
+def get_administrative_unit_index() -> AdministrativeUnitIndex:
+    """Return the index of the administrative units in `ADMINISTRATIVE_UNITS`.
+
+    The index is built once and can not be changed.
+
+    :return: The administrative unit index.
+    """
+    constituencies_by_county: Dict[str, Tuple[str, ...]] = {}
+    sub_counties_by_county: Dict[str, Tuple[str, ...]] = {}
+    wards_by_sub_county: Dict[str, Tuple[str, ...]] = {}
+    county_by_constituency: Dict[str, str] = {}
+    county_by_sub_county: Dict[str, str] = {}
+    sub_counties_by_ward: Dict[str, set] = {}
+
+    for county, county_admin_units in ADMINISTRATIVE_UNITS.items():
+        constituencies = tuple(county_admin_units.get(_CONSTITUENCIES, tuple()))
+        sub_counties = cast(
+            Dict[str, Collection[str]], county_admin_units.get(_SUB_COUNTIES, dict())
+        )
+        constituencies_by_county[county] = constituencies
+        sub_counties_by_county[county] = tuple(sub_counties)
+        county_by_constituency.update((constituency, county) for constituency in constituencies)
+        county_by_sub_county.update((sub_county, county) for sub_county in sub_counties)
+        for sub_county, wards in sub_counties.items():
+            wards_by_sub_county[sub_county] = tuple(wards)
+            for ward in wards:
+                sub_counties_by_ward.setdefault(ward, set()).add(sub_county)
+
+    return AdministrativeUnitIndex(
+        counties=frozenset(ADMINISTRATIVE_UNITS),
+        constituencies_by_county=MappingProxyType(constituencies_by_county),
+        sub_counties_by_county=MappingProxyType(sub_counties_by_county),
+        wards_by_sub_county=MappingProxyType(wards_by_sub_county),
+        county_by_constituency=MappingProxyType(county_by_constituency),
+        county_by_sub_county=MappingProxyType(county_by_sub_county),
+        sub_counties_by_ward=MappingProxyType(
+            {ward: frozenset(sub_counties) for ward, sub_counties in sub_counties_by_ward.items()}
+        ),
+    )
+
+
 @lru_cache(maxsize=None)
 def get_counties() -> Collection[FieldChoice]:
     """Return a `Collection` of choices the counties involved in the mycarehub ya Jamii Project.
@@ -34,8 +106,7 @@ def get_constituencies() -> Collection[FieldChoice]:
     :return: A Collection of choices of the constituencies involved in the
              mycarehub ya Jamii Project.
     """
-    constituencies = (get_constituencies_for_county(county[0]) for county in get_counties())
-    return _sorted_field_choices(chain.from_iterable(constituencies))
+    return _field_choices(get_administrative_unit_index().county_by_constituency)
 
 
 @lru_cache(maxsize=None)
@@ -51,9 +122,8 @@ def get_constituencies_for_county(county: str) -> Collection[FieldChoice]:
              given county or an empty Collection if the provided county doesn't
              exist.
     """
-    county_admin_units = ADMINISTRATIVE_UNITS.get(county, dict())
-    constituencies = county_admin_units.get(_CONSTITUENCIES, tuple())
-    return _sorted_field_choices((constituency, constituency) for constituency in constituencies)
+    index = get_administrative_unit_index()
+    return _field_choices(index.constituencies_by_county.get(county, tuple()))
 
 
 @lru_cache(maxsize=None)
@@ -63,8 +133,7 @@ def get_sub_counties() -> Collection[FieldChoice]:
     :return: A Collection of choices of all the sub-counties involved in the
              mycarehub ya Jamii Project.
     """
-    sub_counties = (get_sub_counties_for_county(county[0]) for county in get_counties())
-    return _sorted_field_choices(chain.from_iterable(sub_counties))
+    return _field_choices(get_administrative_unit_index().county_by_sub_county)
 
 
 @lru_cache(maxsize=None)
@@ -80,9 +149,8 @@ def get_sub_counties_for_county(county: str) -> Collection[FieldChoice]:
              given county or an empty Collection if the provided county doesn't
              exist.
     """
-    county_admin_units = ADMINISTRATIVE_UNITS.get(county, dict())
-    sub_counties = county_admin_units.get(_SUB_COUNTIES, dict())
-    return _sorted_field_choices((sub_county, sub_county) for sub_county in sub_counties)
+    index = get_administrative_unit_index()
+    return _field_choices(index.sub_counties_by_county.get(county, tuple()))
 
 
 @lru_cache(maxsize=None)
@@ -92,8 +160,8 @@ def get_wards() -> Collection[FieldChoice]:
     :return: A Collection of choices of the wards involved in the mycarehub ya
              Jamii Project.
     """
-    wards = (get_wards_for_sub_county(sub_county[0]) for sub_county in get_sub_counties())
-    return _sorted_field_choices(chain.from_iterable(wards))
+    wards_by_sub_county = get_administrative_unit_index().wards_by_sub_county
+    return _field_choices(ward for wards in wards_by_sub_county.values() for ward in wards)
 
 
 @lru_cache(maxsize=None)
@@ -109,20 +177,8 @@ def get_wards_for_sub_county(sub_county: str) -> Collection[FieldChoice]:
              sub-county or an empty Collection if the provided sub-county
              doesn't exist.
     """
-    owning_county: Optional[str] = None
-    for county in get_counties():
-        if (sub_county, sub_county) in get_sub_counties_for_county(county[0]):
-            owning_county = county[0]
-            break
-
-    if owning_county is None:
-        return tuple()
-
-    sub_counties = cast(
-        Dict[str, Collection[str]], ADMINISTRATIVE_UNITS[owning_county][_SUB_COUNTIES]
-    )
-    wards = sub_counties[sub_county]
-    return _sorted_field_choices((ward, ward) for ward in wards)
+    index = get_administrative_unit_index()
+    return _field_choices(index.wards_by_sub_county.get(sub_county, tuple()))
 
 
 def has_constituency(county: str, constituency: str) -> bool:
@@ -142,9 +198,10 @@ def has_constituency(county: str, constituency: str) -> bool:
 
     :raise ValueError: If the given county is not part of the FYJ program.
     """
-    if county not in ADMINISTRATIVE_UNITS:
+    index = get_administrative_unit_index()
+    if county not in index.counties:
         raise ValueError('county "{}" does not exist'.format(county))
-    return (constituency, constituency) in get_constituencies_for_county(county)
+    return index.county_by_constituency.get(constituency) == county
 
 
 def has_sub_county(county: str, sub_county: str) -> bool:
@@ -164,9 +221,10 @@ def has_sub_county(county: str, sub_county: str) -> bool:
 
     :raise ValueError: If the given county is not part of the FYJ program.
     """
-    if county not in ADMINISTRATIVE_UNITS:
+    index = get_administrative_unit_index()
+    if county not in index.counties:
         raise ValueError('county "{}" does not exist'.format(county))
-    return (sub_county, sub_county) in get_sub_counties_for_county(county)
+    return index.county_by_sub_county.get(sub_county) == county
 
 
 def has_ward(sub_county: str, ward: str) -> bool:
@@ -187,6 +245,42 @@ def has_ward(sub_county: str, ward: str) -> bool:
     :raise ValueError: If the given sub-county doesn't belong to a county in
            the FYJ program.
     """
-    if (sub_county, sub_county) not in get_sub_counties():
+    index = get_administrative_unit_index()
+    if sub_county not in index.county_by_sub_county:
         raise ValueError('sub county "{}" does not exist'.format(sub_county))
-    return (ward, ward) in get_wards_for_sub_county(sub_county)
+    return sub_county in index.sub_counties_by_ward.get(ward, frozenset())
+
+
+def get_county_for_constituency(constituency: str) -> Optional[str]:
+    """Return the county that the given constituency belongs to.
+
+    :param constituency: The constituency whose county to return.
+
+    :return: The county of the given constituency or `None` if the constituency
+             doesn't exist.
+    """
+    return get_administrative_unit_index().county_by_constituency.get(constituency)
+
+
+def get_county_for_sub_county(sub_county: str) -> Optional[str]:
+    """Return the county that the given sub-county belongs to.
+
+    :param sub_county: The sub-county whose county to return.
+
+    :return: The county of the given sub-county or `None` if the sub-county
+             doesn't exist.
+    """
+    return get_administrative_unit_index().county_by_sub_county.get(sub_county)
+
+
+def get_sub_counties_for_ward(ward: str) -> FrozenSet[str]:
+    """Return the sub-counties that have a ward by the given name.
+
+    Ward names are not unique, a few sub-counties share a ward name.
+
+    :param ward: The ward whose sub-counties to return.
+
+    :return: The sub-counties with the given ward or an empty set if the ward
+             doesn't exist.
+    """
+    return get_administrative_unit_index().sub_counties_by_ward.get(ward, frozenset())
@@ -2,6 +2,7 @@ import pytest
 from django.conf import settings
 from django.contrib.auth.models import Group, Permission
 from django.contrib.messages.storage.fallback import FallbackStorage
+from django.core.cache import cache
 from django.utils import timezone
 from faker import Faker
 from model_bakery import baker
@@ -15,6 +16,7 @@ from mycarehub.content.wagtail_hooks import set_organisation_after_page_create
 from mycarehub.home.models import HomePage
 from mycarehub.users.models import User
 from mycarehub.users.tests.factories import UserFactory
+from mycarehub.utils.general_utils import clear_defaults
 
 fake = Faker()
 
@@ -33,6 +35,12 @@ def test_email_backend(settings):
     settings.EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    clear_defaults()
+
+
 @pytest.fixture
 def program() -> Program:
     return baker.make(Program)
@@ -137,6 +145,34 @@ def content_item_index(homepage, program):
     return content_item_index
 
 
+@pytest.fixture
+def make_content_item(content_item_index, program):
+    """Return a function that adds a content item to the content item index and publishes it."""
+
+    def make(slug, publish=True, **kwargs):
+        if "author" not in kwargs:
+            kwargs["author"] = baker.make(Author)
+        content_item = ContentItem(
+            **{
+                "title": slug,
+                "slug": slug,
+                "intro": "intro",
+                "body": "body",
+                "item_type": "ARTICLE",
+                "date": timezone.now().date(),
+                "program": program,
+                "hero_image": baker.make("content.CustomImage", _create_files=True),
+                **kwargs,
+            }
+        )
+        content_item_index.add_child(instance=content_item)
+        if publish:
+            content_item.save_revision().publish()
+        return content_item
+
+    return make
+
+
 @pytest.fixture
 def facility():
     return baker.make(Facility)
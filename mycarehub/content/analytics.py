@@ -0,0 +1,175 @@
+"""
+Engagement analytics on daily rollups of content interactions.
+
+Likes, bookmarks, shares and views are rolled up into daily counts per content
+item and program (`ContentInteractionRollup`), so engagement reports read
+thousands of rollups instead of millions of interactions.
+
+Rollups are kept up to date incrementally: each run only aggregates the
+interactions created since the previous run's watermark. Interactions are
+rolled up at most once every `CONTENT_INTERACTION_ROLLUP_INTERVAL` seconds.
+"""
+import logging
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from mycarehub.content.models import (
+    ContentBookmark,
+    ContentInteractionRollup,
+    ContentInteractionRollupWatermark,
+    ContentLike,
+    ContentShare,
+    ContentView,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+ROLLUP_SCHEDULED_KEY = "contentapi:analytics:rollup"
+
+# interactions created this recently may not be committed yet, so they are rolled up later
+ROLLUP_LAG = timedelta(minutes=5)
+
+ROLLED_UP_INTERACTIONS = {
+    ContentInteractionRollup.Interaction.LIKE: ContentLike,
+    ContentInteractionRollup.Interaction.BOOKMARK: ContentBookmark,
+    ContentInteractionRollup.Interaction.SHARE: ContentShare,
+    ContentInteractionRollup.Interaction.VIEW: ContentView,
+}
+
+
+def rollup_interactions(until=None):
+    """
+    Roll up the interactions created since the last watermark and until `until`.
+
+    Return the number of interactions of each kind that were rolled up.
+    """
+    until = until or timezone.now() - ROLLUP_LAG
+    rolled_up = {}
+    for interaction, model in ROLLED_UP_INTERACTIONS.items():
+        with transaction.atomic():
+            # the watermark is locked so that concurrent runs do not count interactions twice
+            watermark = (
+                ContentInteractionRollupWatermark.objects.select_for_update()
+                .filter(interaction=interaction)
+                .first()
+            )
+            if watermark is None:
+                watermark = ContentInteractionRollupWatermark(interaction=interaction)
+                interactions = model.objects.all()
+            else:
+                interactions = model.objects.filter(created__gte=watermark.watermark)
+
+            totals = {
+                (row["date"], row["content_item_id"], row["program_id"]): row["count"]
+                for row in interactions.filter(created__lt=until)
+                .annotate(date=TruncDate("created"))
+                .order_by()
+                .values("date", "content_item_id", "program_id")
+                .annotate(count=Count("id"))
+            }
+
+            rollups = {
+                (rollup.date, rollup.content_item_id, rollup.program_id): rollup
+                for rollup in ContentInteractionRollup.objects.filter(
+                    interaction=interaction,
+                    date__in={date for date, _, _ in totals},
+                    content_item_id__in={content_item_id for _, content_item_id, _ in totals},
+                )
+            }
+            new_rollups = []
+            for key, count in totals.items():
+                if key in rollups:
+                    rollups[key].count += count
+                    continue
+
+                date, content_item_id, program_id = key
+                new_rollups.append(
+                    ContentInteractionRollup(
+                        date=date,
+                        content_item_id=content_item_id,
+                        program_id=program_id,
+                        interaction=interaction,
+                        count=count,
+                    )
+                )
+            ContentInteractionRollup.objects.bulk_update(rollups.values(), ["count"])
+            ContentInteractionRollup.objects.bulk_create(new_rollups)
+
+            watermark.watermark = until
+            watermark.save()
+
+        rolled_up[interaction] = sum(totals.values())
+
+    return rolled_up
+
+
+def _rollup_interactions():
+    try:
+        LOGGER.info(f"rolled up content interactions: {rollup_interactions()}")
+    finally:
+        connections.close_all()
+
+
+def rollup_interactions_in_background():
+    """Roll up the interactions created since the last watermark in a background thread."""
+    thread = threading.Thread(target=_rollup_interactions, name="interaction-rollup", daemon=True)
+    thread.start()
+    return thread
+
+
+def schedule_interaction_rollup():
+    """Roll up interactions after the current transaction, unless they were rolled up recently."""
+    if cache.add(ROLLUP_SCHEDULED_KEY, True, settings.CONTENT_INTERACTION_ROLLUP_INTERVAL):
+        transaction.on_commit(rollup_interactions_in_background)
+
+
+def get_rollups(
+    program_id=None,
+    start=None,
+    end=None,
+    interaction=None,
+    content_item_id=None,
+    facility_id=None,
+):
+    """Return the rollups that an engagement report covers."""
+    rollups = ContentInteractionRollup.objects.all()
+    if program_id:
+        rollups = rollups.filter(program_id=program_id)
+    if start:
+        rollups = rollups.filter(date__gte=start)
+    if end:
+        rollups = rollups.filter(date__lte=end)
+    if interaction:
+        rollups = rollups.filter(interaction=interaction)
+    if content_item_id:
+        rollups = rollups.filter(content_item_id=content_item_id)
+    if facility_id:
+        # clients are not linked to facilities, so the content's facilities are used
+        rollups = rollups.filter(content_item__facilities=facility_id)
+
+    return rollups
+
+
+def get_engagement_timeseries(rollups):
+    """Return the daily number of interactions of each kind."""
+    return list(
+        rollups.values("date", "interaction")
+        .annotate(count=Sum("count"))
+        .order_by("date", "interaction")
+    )
+
+
+def get_top_content_items(rollups, limit):
+    """Return the content items with the most interactions."""
+    return list(
+        rollups.values("content_item", title=F("content_item__title"))
+        .annotate(count=Sum("count"))
+        .order_by("-count", "content_item")[:limit]
+    )
@@ -0,0 +1,123 @@
+"""
+Archival of old content views.
+
+There is a content view per client per content item that they opened, so the
+table grows without bound. Months of views that are older than the retention
+period are exported to gzipped JSON lines files in the archive storage
+(`CONTENT_ARCHIVE_STORAGE`) and deleted, so that queries (and vacuums) only
+touch recent views. An `ArchivedContentView` is kept for each of them, so that
+a client viewing a content item again is not counted again.
+
+Only months that have been rolled up are archived, so archived views remain
+counted in the engagement analytics and in the content items' view counts.
+"""
+import gzip
+import json
+import logging
+import tempfile
+from datetime import datetime, time
+from itertools import islice
+
+from django.conf import settings
+from django.core.files import File
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from mycarehub.content.models import (
+    ArchivedContentView,
+    ContentInteractionRollup,
+    ContentInteractionRollupWatermark,
+    ContentView,
+    ContentViewArchive,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+# the number of views that are read from the database at a time when exporting
+EXPORT_CHUNK_SIZE = 2000
+
+
+def get_month_start(moment):
+    """Return the start of the (local) month that `moment` falls in."""
+    moment = timezone.localtime(moment)
+    return timezone.make_aware(datetime(moment.year, moment.month, 1))
+
+
+def get_next_month(month):
+    """Return the first day of the month after `month`."""
+    if month.month == 12:
+        return month.replace(year=month.year + 1, month=1)
+    return month.replace(month=month.month + 1)
+
+
+def get_archived_until():
+    """Return the first day after the archived months, or None if no views were archived."""
+    last_month = ContentViewArchive.objects.aggregate(last_month=Max("month"))["last_month"]
+    return get_next_month(last_month) if last_month else None
+
+
+def export_content_views(views, name):
+    """Export content views to a gzipped JSON lines file and return its path and line count."""
+    fields = [field.attname for field in ContentView._meta.concrete_fields]
+    count = 0
+    with tempfile.TemporaryFile() as export:
+        with gzip.GzipFile(fileobj=export, mode="wb") as lines:
+            for view in views.order_by().values(*fields).iterator(chunk_size=EXPORT_CHUNK_SIZE):
+                lines.write(json.dumps(view, cls=DjangoJSONEncoder).encode() + b"\n")
+                count += 1
+
+        export.seek(0)
+        storage = import_string(settings.CONTENT_ARCHIVE_STORAGE)()
+        return storage.save(name, File(export)), count
+
+
+def record_archived_views(views):
+    """Keep a record of the clients that viewed each content item, before the views are deleted."""
+    pairs = views.order_by().values_list("client_id", "content_item_id")
+    pairs = pairs.iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    while chunk := list(islice(pairs, EXPORT_CHUNK_SIZE)):
+        ArchivedContentView.objects.bulk_create(
+            (
+                ArchivedContentView(client_id=client_id, content_item_id=content_item_id)
+                for client_id, content_item_id in chunk
+            ),
+            ignore_conflicts=True,
+        )
+
+
+def archive_content_views(before):
+    """
+    Archive the months of content views that started before `before`.
+
+    Months are archived oldest first and months that have not been rolled up
+    completely are left alone. Return the archives that were created.
+    """
+    watermark = ContentInteractionRollupWatermark.objects.filter(
+        interaction=ContentInteractionRollup.Interaction.VIEW
+    ).first()
+    oldest = ContentView.objects.order_by("created").values_list("created", flat=True).first()
+    if watermark is None or oldest is None:
+        return []
+
+    archives = []
+    month = get_month_start(oldest)
+    while month < before:
+        month_end = timezone.make_aware(datetime.combine(get_next_month(month.date()), time.min))
+        if month_end > watermark.watermark:
+            LOGGER.info(f"content views from {month:%Y-%m} have not been rolled up yet")
+            break
+
+        views = ContentView.objects.filter(created__gte=month, created__lt=month_end)
+        path, count = export_content_views(views, f"content_views/{month:%Y-%m}.jsonl.gz")
+        with transaction.atomic():
+            record_archived_views(views)
+            views.delete()
+            archives.append(
+                ContentViewArchive.objects.create(month=month.date(), path=path, count=count)
+            )
+        month = month_end
+
+    return archives
@@ -0,0 +1,169 @@
+"""
+Response caching for the content API.
+
+Cached listing responses are namespaced by program. Every program has a cache
+"generation" that is part of the cache key; bumping the generation evicts all
+the listings cached for that program without enumerating keys (see
+`mycarehub.utils.cache_generations`).
+
+Listings that are not scoped to a program (no `client_id` was supplied) are
+kept in a shared namespace that is evicted whenever any program changes.
+
+Responses also carry an `ETag` (and, where the content has a modification
+time, a `Last-Modified`) validator so that clients can revalidate what they
+already have with a conditional GET.
+"""
+import hashlib
+from urllib.parse import urlencode
+
+from django.db.models import (
+    BigIntegerField,
+    Count,
+    F,
+    Max,
+    QuerySet,
+    Sum,
+)
+from django.db.models.functions import Cast
+
+from mycarehub.clients.context import get_client_context
+from mycarehub.content.counters import COUNTED_INTERACTIONS, load_pending_counts
+from mycarehub.content.models import ContentItem, ContentItemCounterDelta
+from mycarehub.utils.cache_generations import bump_generation, get_generation
+
+LISTING_CACHE_PREFIX = "contentapi:listing"
+ALL_PROGRAMS = "all"
+
+# query parameters that do not change the response e.g jQuery's cache buster
+IGNORED_QUERY_PARAMETERS = frozenset(["_"])
+
+
+def get_cache_generation(scope):
+    """Return the current cache generation of a program (or of the shared namespace)."""
+    return get_generation(LISTING_CACHE_PREFIX, scope)
+
+
+def invalidate_listing_cache(program_id=None):
+    """
+    Evict the cached listings of a program.
+
+    The shared (unscoped) namespace is always evicted since it may contain the
+    program's content.
+    """
+    scopes = [ALL_PROGRAMS] if program_id is None else [str(program_id), ALL_PROGRAMS]
+    for scope in scopes:
+        bump_generation(LISTING_CACHE_PREFIX, scope)
+
+
+def normalize_query_parameters(query_params):
+    """Return a canonical representation of the query parameters of a request."""
+    items = sorted(
+        (name, value)
+        for name in query_params.keys()
+        if name not in IGNORED_QUERY_PARAMETERS
+        for value in query_params.getlist(name)
+    )
+    return urlencode(items)
+
+
+def get_listing_scope(request):
+    """
+    Return the program whose content a listing request is limited to.
+
+    The program is derived from the `client_id` query parameter. Requests that
+    are not limited to a single program use the shared namespace.
+    """
+    client_id = request.query_params.get("client_id", "")
+    if not client_id:
+        return ALL_PROGRAMS
+
+    client_context = get_client_context(client_id)
+
+    return str(client_context.program_id) if client_context else ALL_PROGRAMS
+
+
+def _request_digest(request, *extra):
+    """
+    Hash the parts of a request that the response depends on.
+
+    These are the normalized query parameters, the requesting user's organisation
+    and program and the host (the pages served depend on the site).
+    """
+    user = request.user
+    parts = [
+        request.get_host(),
+        str(getattr(user, "organisation_id", "")),
+        str(getattr(user, "program_id", "")),
+        normalize_query_parameters(request.query_params),
+        *[str(part) for part in extra],
+    ]
+    return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+def get_listing_cache_key(request):
+    """
+    Build the cache key of a content listing request.
+
+    The key is made up of the request digest and the generation of the program
+    the listing is scoped to.
+    """
+    scope = get_listing_scope(request)
+    digest = _request_digest(request)
+
+    return f"{LISTING_CACHE_PREFIX}:{scope}:{get_cache_generation(scope)}:{digest}"
+
+
+def get_detail_validators(request, page):
+    """
+    Return the `(etag, last_modified)` validators of a page detail response.
+
+    A page changes when it is published. Content items also serve their
+    interaction counts, which change with every interaction and have no
+    modification time: their ETag covers the counts (pending deltas included)
+    and they get no `Last-Modified`, so that `If-Modified-Since` can not match
+    stale counts.
+    """
+    if not hasattr(page, "get_count"):
+        etag = _request_digest(request, page.pk, page.last_published_at)
+        return etag, page.last_published_at
+
+    # the pending deltas are summed once for all the counts (and the serializer)
+    load_pending_counts(page)
+    counts = [page.get_count(counter) for counter in COUNTED_INTERACTIONS]
+    return _request_digest(request, page.pk, page.last_published_at, *counts), None
+
+
+def get_listing_validators(request, queryset):
+    """
+    Return the `(etag, last_modified)` validators of a listing response.
+
+    The ETag is derived from a cheap aggregate of the filtered pages: their
+    number, the most recent publication and the newest page. Listings of content
+    items also serve their interaction counts, so the aggregate covers the counts
+    (weighted by item, so that changes to two items can not cancel out) and the
+    pending deltas. Listings change without any of their pages being published
+    too (when pages are unpublished or deleted, or content unlocks), so they get
+    no `Last-Modified`. Search results can not be aggregated and get no validators.
+    """
+    if not isinstance(queryset, QuerySet):
+        return None, None
+
+    aggregates = {
+        "count": Count("id"),
+        "last_published_at": Max("last_published_at"),
+        "max_id": Max("id"),
+    }
+    pending = {}
+    if issubclass(queryset.model, ContentItem):
+        aggregates.update(
+            (counter, Sum(Cast("id", BigIntegerField()) * F(counter)))
+            for counter in COUNTED_INTERACTIONS
+        )
+        # deltas are only ever appended until they are flushed into the counts
+        pending = ContentItemCounterDelta.objects.filter(
+            content_item_id__in=queryset.values("id")
+        ).aggregate(pending_count=Count("id"), pending_max_id=Max("id"))
+
+    fingerprint = queryset.order_by().aggregate(**aggregates)
+    etag = _request_digest(request, *fingerprint.values(), *pending.values())
+    return etag, None
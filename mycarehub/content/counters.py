@@ -0,0 +1,265 @@
+"""
+Write-behind aggregation of the interaction counts of content items.
+
+Views, likes, shares and bookmarks append a delta to `ContentItemCounterDelta`
+instead of incrementing the count on the content item, so that interactions with
+a popular item do not all wait on the same row lock. Pending deltas are coalesced
+and flushed to the content items by a background thread, batch after batch until
+none are left, at most once every `CONTENT_COUNTER_FLUSH_INTERVAL` seconds.
+
+Until they are flushed, deltas are summed by the database and added to the counts
+that the API serves (see `ContentItem.get_count`).
+
+The counts are also recomputed from the interaction tables at most once every
+`CONTENT_COUNTER_RECONCILE_INTERVAL` seconds, to correct any drift.
+"""
+import logging
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections, transaction
+from django.db.models import Count, F, IntegerField, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce, Greatest
+
+from mycarehub.content.archival import get_archived_until
+from mycarehub.content.models import (
+    ContentBookmark,
+    ContentInteractionRollup,
+    ContentItem,
+    ContentItemCounterDelta,
+    ContentLike,
+    ContentShare,
+    ContentView,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+FLUSH_SCHEDULED_KEY = "contentapi:counters:flush"
+RECONCILE_SCHEDULED_KEY = "contentapi:counters:reconcile"
+
+# the number of deltas that a single flush applies
+FLUSH_BATCH_SIZE = 5000
+
+# the number of content items whose counts are recomputed together
+RECONCILE_BATCH_SIZE = 500
+
+# the interactions that each count is made up of
+COUNTED_INTERACTIONS = {
+    "like_count": ContentLike,
+    "bookmark_count": ContentBookmark,
+    "share_count": ContentShare,
+    "view_count": ContentView,
+}
+
+
+def record_counter_delta(content_item_id, counter, delta=1):
+    """Record a change to one of the interaction counts of a content item."""
+    record_counter_deltas({(content_item_id, counter): delta})
+
+
+def record_counter_deltas(deltas):
+    """Record changes to interaction counts, given as `{(content_item_id, counter): delta}`."""
+    ContentItemCounterDelta.objects.bulk_create(
+        ContentItemCounterDelta(content_item_id=content_item_id, counter=counter, delta=delta)
+        for (content_item_id, counter), delta in deltas.items()
+    )
+    schedule_counter_flush()
+
+
+def schedule_counter_flush():
+    """Flush the pending deltas after the current transaction, unless a flush ran recently."""
+    if cache.add(FLUSH_SCHEDULED_KEY, True, settings.CONTENT_COUNTER_FLUSH_INTERVAL):
+        transaction.on_commit(flush_counter_deltas_in_background)
+    if cache.add(RECONCILE_SCHEDULED_KEY, True, settings.CONTENT_COUNTER_RECONCILE_INTERVAL):
+        transaction.on_commit(reconcile_counts_in_background)
+
+
+def flush_counter_deltas(batch_size=FLUSH_BATCH_SIZE):
+    """
+    Apply a batch of pending deltas to the content items and return how many were applied.
+
+    Deltas that another flush is applying are skipped, and the content items are
+    updated in a consistent order so that concurrent flushes cannot deadlock.
+    """
+    with transaction.atomic():
+        deltas = list(
+            ContentItemCounterDelta.objects.select_for_update(skip_locked=True)
+            .order_by("id")
+            .values_list("id", "content_item_id", "counter", "delta")[:batch_size]
+        )
+
+        totals = defaultdict(lambda: defaultdict(int))
+        for _, content_item_id, counter, delta in deltas:
+            totals[content_item_id][counter] += delta
+
+        for content_item_id in sorted(totals):
+            updates = {
+                # a count that has drifted must not go below zero
+                counter: Greatest(F(counter) + delta, 0)
+                for counter, delta in totals[content_item_id].items()
+                if delta
+            }
+            if updates:
+                ContentItem.objects.filter(id=content_item_id).update(**updates)
+
+        ContentItemCounterDelta.objects.filter(id__in=[delta[0] for delta in deltas]).delete()
+
+    return len(deltas)
+
+
+def flush_all_counter_deltas(batch_size=FLUSH_BATCH_SIZE):
+    """
+    Apply batches of pending deltas until one comes back short and return how many were applied.
+
+    A short batch means that the deltas have run out, or that the rest are being
+    applied by another flush.
+    """
+    applied = 0
+    while True:
+        batch = flush_counter_deltas(batch_size)
+        applied += batch
+        if batch < batch_size:
+            return applied
+
+
+def _flush_counter_deltas():
+    try:
+        flush_all_counter_deltas()
+    finally:
+        connections.close_all()
+
+
+def flush_counter_deltas_in_background():
+    """Apply the pending deltas in a background thread, off the request that scheduled it."""
+    thread = threading.Thread(target=_flush_counter_deltas, name="counter-flush", daemon=True)
+    thread.start()
+    return thread
+
+
+def _count(model):
+    return Coalesce(
+        Subquery(
+            model.objects.filter(content_item_id=OuterRef("pk"))
+            .order_by()
+            .values("content_item_id")
+            .annotate(total=Count("*"))
+            .values("total"),
+            output_field=IntegerField(),
+        ),
+        Value(0),
+    )
+
+
+def _archived_views(archived_until):
+    # archived views were rolled up before they were deleted
+    return Coalesce(
+        Subquery(
+            ContentInteractionRollup.objects.filter(
+                content_item_id=OuterRef("pk"),
+                interaction=ContentInteractionRollup.Interaction.VIEW,
+                date__lt=archived_until,
+            )
+            .order_by()
+            .values("content_item_id")
+            .annotate(total=Sum("count"))
+            .values("total"),
+            output_field=IntegerField(),
+        ),
+        Value(0),
+    )
+
+
+def _pending(counter):
+    return Coalesce(
+        Subquery(
+            ContentItemCounterDelta.objects.filter(content_item_id=OuterRef("pk"), counter=counter)
+            .order_by()
+            .values("content_item_id")
+            .annotate(total=Sum("delta"))
+            .values("total"),
+            output_field=IntegerField(),
+        ),
+        Value(0),
+    )
+
+
+def annotate_pending_counts(queryset, counters=COUNTED_INTERACTIONS):
+    """Annotate content items with the sums of the pending deltas of their counts."""
+    return queryset.annotate(**{f"pending_{counter}": _pending(counter) for counter in counters})
+
+
+def load_pending_counts(content_item):
+    """Set the sums of the pending deltas of a content item's counts on it, in a single query."""
+    pending = dict(
+        ContentItemCounterDelta.objects.filter(content_item_id=content_item.pk)
+        .order_by()
+        .values("counter")
+        .annotate(total=Sum("delta"))
+        .values_list("counter", "total")
+    )
+    for counter in COUNTED_INTERACTIONS:
+        setattr(content_item, f"pending_{counter}", pending.get(counter, 0))
+    return content_item
+
+
+def reconcile_counts(batch_size=RECONCILE_BATCH_SIZE):
+    """
+    Recompute the interaction counts of all content items and correct the ones that drifted.
+
+    Each batch of content items is recomputed in a single query, so that the counts
+    and the pending deltas are read from the same snapshot, while the content items
+    are locked against concurrent flushes. Archived views are counted from their
+    rollups. Only the content items whose counts changed are written.
+
+    Return the total drift corrected for each count.
+    """
+    actual_counts = {
+        f"actual_{counter}": _count(model) - _pending(counter)
+        for counter, model in COUNTED_INTERACTIONS.items()
+    }
+    archived_until = get_archived_until()
+    if archived_until:
+        actual_counts["actual_view_count"] += _archived_views(archived_until)
+
+    drift = dict.fromkeys(COUNTED_INTERACTIONS, 0)
+    last_id = 0
+    while True:
+        with transaction.atomic():
+            content_items = list(
+                ContentItem.objects.select_for_update(of=("self",))
+                .filter(id__gt=last_id)
+                .order_by("id")
+                .only("id", *COUNTED_INTERACTIONS)
+                .annotate(**actual_counts)[:batch_size]
+            )
+            if not content_items:
+                return drift
+
+            changed = []
+            for content_item in content_items:
+                for counter in COUNTED_INTERACTIONS:
+                    # pending deltas that would take a count below zero are clamped by the flush
+                    actual = max(getattr(content_item, f"actual_{counter}"), 0)
+                    if getattr(content_item, counter) != actual:
+                        drift[counter] += actual - getattr(content_item, counter)
+                        setattr(content_item, counter, actual)
+                        changed.append(content_item)
+
+            ContentItem.objects.bulk_update(set(changed), list(COUNTED_INTERACTIONS))
+            last_id = content_items[-1].id
+
+
+def _reconcile_counts():
+    try:
+        LOGGER.info(f"corrected content interaction count drift: {reconcile_counts()}")
+    finally:
+        connections.close_all()
+
+
+def reconcile_counts_in_background():
+    """Recompute the interaction counts of all content items in a background thread."""
+    thread = threading.Thread(target=_reconcile_counts, name="counter-reconciliation", daemon=True)
+    thread.start()
+    return thread
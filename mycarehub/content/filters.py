@@ -1,14 +1,16 @@
+from abc import ABC, abstractmethod
+
 import django_filters
-from django.core.exceptions import ObjectDoesNotExist
-from django.db.models import Count, Q
+from django.db.models import Count, Exists, OuterRef, Q
 from django.utils import timezone
 from rest_framework.filters import BaseFilterBackend
 from wagtail.admin.filters import WagtailFilterSet
 
-from mycarehub.clients.models import Client
+from mycarehub.clients.context import get_client_context
 from mycarehub.common.models import ContentSequence
-from mycarehub.content.models import ContentItem
+from mycarehub.content.models import ContentItem, ContentItemTag
 from mycarehub.content.models.sms import SMSContentItem, SMSContentItemCategory, SMSContentItemTag
+from mycarehub.content.schedule import get_unlocked_content
 
 from .models import (
     Author,
@@ -20,24 +22,63 @@ from .models import (
 )
 
 
-class TagFilter(BaseFilterBackend):
+class ContentItemFilterBackend(ABC, BaseFilterBackend):
+    """
+    Base class of the filters that narrow down the content items served by the API.
+
+    Filters return conditions instead of filtering the queryset themselves. Conditions
+    on related objects are compiled into correlated `EXISTS` subqueries on the through
+    tables, so combining filters neither multiplies rows nor needs a DISTINCT over the
+    page table.
+    """
+
+    @abstractmethod
+    def get_conditions(self, query_params):
+        """Return the conditions that the content items must meet, given the query parameters."""
+
+    def filter_queryset(self, request, queryset, view):
+        if queryset.model is ContentItem:
+            queryset = queryset.filter(*self.get_conditions(request.query_params))
+
+        return queryset
+
+
+def has_tag(tag):
+    return Exists(
+        ContentItemTag.objects.filter(
+            Q(tag__name=tag) | Q(tag__slug=tag), content_object=OuterRef("pk")
+        )
+    )
+
+
+def has_category(**lookups):
+    return Exists(
+        ContentItem.categories.through.objects.filter(contentitem=OuterRef("pk"), **lookups)
+    )
+
+
+def has_facility(facility_id):
+    return Exists(
+        ContentItem.facilities.through.objects.filter(
+            contentitem=OuterRef("pk"), facility_id=facility_id
+        )
+    )
+
+
+class TagFilter(ContentItemFilterBackend):
     """
     Implements the ?tag filter which returns only pages that match a tag.
 
     This filter accepts a single tag.
     """
 
-    def filter_queryset(self, request, queryset, view):
-        query_params = request.query_params
+    def get_conditions(self, query_params):
         tag = query_params.get("tag", "")
 
-        if tag and queryset.model is ContentItem:
-            queryset = queryset.filter(Q(tags__name=tag) | Q(tags__slug=tag))
-
-        return queryset
+        return [has_tag(tag)] if tag else []
 
 
-class CategoryFilter(BaseFilterBackend):
+class CategoryFilter(ContentItemFilterBackend):
     """
     Implements the ?category filter which returns only pages that match a
     category ID.
@@ -54,41 +95,37 @@ class CategoryFilter(BaseFilterBackend):
     or 'pro-faqs' unless the api explicitly provides these category-names.
     """
 
-    def filter_queryset(self, request, queryset, view):
-        query_params = request.query_params
+    def get_conditions(self, query_params):
         category_id = query_params.get("category", "")
         category_name = query_params.get("category_name", "")
         exclude_categories = query_params.getlist("exclude_category")
 
-        if category_name and queryset.model is ContentItem:
+        conditions = []
+        if category_name:
             categories = category_name.split(",")
-            queryset = queryset.filter(categories__name__in=categories)
-        if category_id and queryset.model is ContentItem:
+            conditions.append(has_category(contentitemcategory__name__in=categories))
+        if category_id:
             category_ids = category_id.split(",")
-            queryset = queryset.filter(Q(categories__id__in=category_ids))
-        if exclude_categories and queryset.model is ContentItem:
-            queryset = queryset.exclude(categories__name__in=exclude_categories)
+            conditions.append(has_category(contentitemcategory_id__in=category_ids))
+        if exclude_categories:
+            conditions.append(~has_category(contentitemcategory__name__in=exclude_categories))
 
-        return queryset.distinct()
+        return conditions
 
 
-class ContentFilter(BaseFilterBackend):
+class ContentFilter(ContentItemFilterBackend):
     """
     This filter excludes the content item given while returning all content
     available on CMS.
     """
 
-    def filter_queryset(self, request, queryset, view):
-        query_params = request.query_params
+    def get_conditions(self, query_params):
         exclude_content = query_params.get("exclude_content", "")
 
-        if exclude_content and queryset.model is ContentItem:
-            queryset = queryset.exclude(id=exclude_content)
-
-        return queryset
+        return [~Q(id=exclude_content)] if exclude_content else []
 
 
-class ClientFilter(BaseFilterBackend):
+class ClientFilter(ContentItemFilterBackend):
     """
     Implements the client_id filter which returns only pages that a specific client can view
 
@@ -96,16 +133,20 @@ class ClientFilter(BaseFilterBackend):
     "personalised" to the specific client. Currently includes:
 
     - the program they belong to
+
+    Unknown clients can not view any content.
     """
 
-    def filter_queryset(self, request, queryset, view):
-        query_params = request.query_params
+    def get_conditions(self, query_params):
         client_id = query_params.get("client_id", "")
+        if not client_id:
+            return []
 
-        if client_id and queryset.model is ContentItem:
-            queryset = queryset.filter(Q(program__clients=client_id))
+        client_context = get_client_context(client_id)
+        if client_context is None:
+            return [Q(pk__in=[])]
 
-        return queryset
+        return [Q(program_id=client_context.program_id)]
 
 
 class ContentSequenceFilter(BaseFilterBackend):
@@ -114,6 +155,10 @@ class ContentSequenceFilter(BaseFilterBackend):
     i.e based on the time a user joined which allows gradual delivery of content to a user.
 
     This filter accepts a client_id.
+
+    The content a client can see is looked up in their program's precomputed unlock
+    schedule. The time at which more content unlocks is set on the view as
+    `next_unlock_at` so that responses can be cached until then.
     """
 
     def filter_queryset(self, request, queryset, view):
@@ -121,39 +166,28 @@ class ContentSequenceFilter(BaseFilterBackend):
         client_id = query_params.get("client_id", "")
 
         if client_id and queryset.model is ContentItem:
-            try:
-                client = Client.objects.get(id=client_id)
-            except ObjectDoesNotExist:
+            client_context = get_client_context(client_id)
+            if client_context is None:
                 return queryset
 
-            program = client.program
-
-            if program.content_sequence == ContentSequence.GRADUAL:
-                # How long a client has been active since creation/enrollment
-                today = timezone.now()
-                client_active_delta = today - client.enrollment_date
-
-                # Determine the content to show i.e up to which date
-                effective_date = program.start_date + client_active_delta
-
-                return queryset.filter(date__lte=effective_date)
+            if client_context.content_sequence == ContentSequence.GRADUAL:
+                page_ids, view.next_unlock_at = get_unlocked_content(
+                    client_context, timezone.now()
+                )
+                return queryset.filter(id__in=page_ids)
 
         return queryset
 
 
-class FacilityFilter(BaseFilterBackend):
+class FacilityFilter(ContentItemFilterBackend):
     """
     Implements the facility_id filter which only returns pages from a specific facility
     """
 
-    def filter_queryset(self, request, queryset, view):
-        query_params = request.query_params
+    def get_conditions(self, query_params):
         facility_id = query_params.get("facility_id", "")
 
-        if facility_id and queryset.model is ContentItem:
-            queryset = queryset.filter(Q(facilities=facility_id))
-
-        return queryset
+        return [has_facility(facility_id)] if facility_id else []
 
 
 class ContentItemCategoryFilter(django_filters.FilterSet):
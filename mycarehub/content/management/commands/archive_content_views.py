@@ -0,0 +1,31 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from mycarehub.content.archival import archive_content_views, get_month_start
+
+
+class Command(BaseCommand):
+    help = (
+        "Export the months of content views that are older than the retention period to the "
+        "archive storage and delete them."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--keep-months",
+            type=int,
+            default=12,
+            help="The number of months of content views that are kept, including this month.",
+        )
+
+    def handle(self, *args, **options):
+        before = get_month_start(timezone.now())
+        for _ in range(options["keep_months"] - 1):
+            before = get_month_start(before - timedelta(days=1))
+
+        for archive in archive_content_views(before):
+            self.stdout.write(
+                f"{archive.month:%Y-%m}: {archive.count} views archived to {archive.path}"
+            )
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from mycarehub.content.counters import RECONCILE_BATCH_SIZE, reconcile_counts
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the cached like, bookmark, share and view counts of content items "
+        "from the interaction tables and correct the ones that drifted."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=RECONCILE_BATCH_SIZE,
+            help="The number of content items recomputed together.",
+        )
+
+    def handle(self, *args, **options):
+        drift = reconcile_counts(batch_size=options["batch_size"])
+        for counter, total in drift.items():
+            self.stdout.write(f"{counter}: {total:+d}")
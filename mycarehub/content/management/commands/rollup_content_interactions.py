@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from mycarehub.content.analytics import rollup_interactions
+
+
+class Command(BaseCommand):
+    help = "Roll up the content interactions created since the last rollup into daily counts."
+
+    def handle(self, *args, **options):
+        for interaction, count in rollup_interactions().items():
+            self.stdout.write(f"{interaction}: {count}")
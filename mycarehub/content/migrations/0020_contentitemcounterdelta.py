@@ -0,0 +1,46 @@
+# Generated by Django 4.2.30 on 2026-10-18 17:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("content", "0019_alter_contentitem_facilities_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ContentItemCounterDelta",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                (
+                    "counter",
+                    models.CharField(
+                        choices=[
+                            ("like_count", "Likes"),
+                            ("bookmark_count", "Bookmarks"),
+                            ("share_count", "Shares"),
+                            ("view_count", "Views"),
+                        ],
+                        max_length=32,
+                    ),
+                ),
+                ("delta", models.IntegerField(default=1)),
+                ("created", models.DateTimeField(auto_now_add=True)),
+                (
+                    "content_item",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="counter_deltas",
+                        to="content.contentitem",
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,84 @@
+# Generated by Django 4.2.30 on 2026-10-18 17:14
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("common", "0008_alter_organisation_email_address_and_more"),
+        ("content", "0020_contentitemcounterdelta"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ContentInteractionRollupWatermark",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                (
+                    "interaction",
+                    models.CharField(
+                        choices=[
+                            ("like", "Likes"),
+                            ("bookmark", "Bookmarks"),
+                            ("share", "Shares"),
+                            ("view", "Views"),
+                        ],
+                        max_length=16,
+                        unique=True,
+                    ),
+                ),
+                ("watermark", models.DateTimeField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name="ContentInteractionRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("date", models.DateField()),
+                (
+                    "interaction",
+                    models.CharField(
+                        choices=[
+                            ("like", "Likes"),
+                            ("bookmark", "Bookmarks"),
+                            ("share", "Shares"),
+                            ("view", "Views"),
+                        ],
+                        max_length=16,
+                    ),
+                ),
+                ("count", models.PositiveIntegerField(default=0)),
+                (
+                    "content_item",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="interaction_rollups",
+                        to="content.contentitem",
+                    ),
+                ),
+                (
+                    "program",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, to="common.program"
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["program", "date"], name="content_con_program_f43673_idx")
+                ],
+                "unique_together": {("date", "content_item", "program", "interaction")},
+            },
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 4.2.30 on 2026-10-18 19:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("clients", "0004_alter_client_organisation"),
+        ("content", "0022_contentviewarchive"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedContentView",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                (
+                    "client",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.PROTECT, to="clients.client"
+                    ),
+                ),
+                (
+                    "content_item",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.PROTECT, to="content.contentitem"
+                    ),
+                ),
+            ],
+            options={
+                "unique_together": {("client", "content_item")},
+            },
+        ),
+    ]
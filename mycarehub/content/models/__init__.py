@@ -1,8 +1,19 @@
 from .documents import CustomDocument
 from .images import CustomImage, CustomRendition
-from .interactions import ContentBookmark, ContentLike, ContentShare, ContentView
+from .interactions import (
+    ArchivedContentView,
+    ContentBookmark,
+    ContentInteractionRollup,
+    ContentInteractionRollupWatermark,
+    ContentItemCounterDelta,
+    ContentLike,
+    ContentShare,
+    ContentView,
+    ContentViewArchive,
+)
 from .media import CustomMedia
 from .models import (
+    HERO_IMAGE_RENDITION,
     ContentItem,
     ContentItemDocumentLink,
     ContentItemGalleryImage,
@@ -12,13 +23,16 @@ from .models import (
     ContentItemQuestionnaire,
     ContentItemTag,
     ContentItemTagIndexPage,
+    CounterField,
     MediaSerializedField,
 )
 from .sms import SMSContentItem, SMSContentItemCategory, SMSContentItemTag
 from .snippets import Author, ContentItemCategory
 
 __all__ = [
+    "HERO_IMAGE_RENDITION",
     "MediaSerializedField",
+    "CounterField",
     "Author",
     "ContentItemCategory",
     "ContentItemTag",
@@ -32,6 +46,11 @@ __all__ = [
     "ContentBookmark",
     "ContentShare",
     "ContentView",
+    "ContentItemCounterDelta",
+    "ContentInteractionRollup",
+    "ContentInteractionRollupWatermark",
+    "ContentViewArchive",
+    "ArchivedContentView",
     "ContentItemQuestionnaire",
     "CustomMedia",
     "ContentItemPageForm",
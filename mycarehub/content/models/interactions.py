@@ -97,3 +97,96 @@ class ContentView(ContentInteraction):
             "client",
             "content_item",
         )
+
+
+class ContentItemCounterDelta(models.Model):
+    """
+    An increment (or decrement) of one of the cached interaction counts of a content item.
+
+    Interactions append deltas here instead of updating the content item, which would
+    make every interaction with a popular item wait on its row lock. The deltas are
+    periodically coalesced and flushed to the content item in batches
+    (see `mycarehub.content.counters`).
+    """
+
+    class Counter(models.TextChoices):
+        LIKE = "like_count", "Likes"
+        BOOKMARK = "bookmark_count", "Bookmarks"
+        SHARE = "share_count", "Shares"
+        VIEW = "view_count", "Views"
+
+    content_item = models.ForeignKey(
+        ContentItem, on_delete=models.CASCADE, related_name="counter_deltas"
+    )
+    counter = models.CharField(max_length=32, choices=Counter.choices)
+    delta = models.IntegerField(default=1)
+    created = models.DateTimeField(auto_now_add=True)
+
+
+class ContentInteractionRollup(models.Model):
+    """
+    The number of interactions of one kind with a content item, per day and program.
+
+    Engagement reporting reads these rollups instead of the interaction tables. They
+    are kept up to date incrementally (see `mycarehub.content.analytics`).
+    """
+
+    class Interaction(models.TextChoices):
+        LIKE = "like", "Likes"
+        BOOKMARK = "bookmark", "Bookmarks"
+        SHARE = "share", "Shares"
+        VIEW = "view", "Views"
+
+    date = models.DateField()
+    content_item = models.ForeignKey(
+        ContentItem, on_delete=models.CASCADE, related_name="interaction_rollups"
+    )
+    program = models.ForeignKey(Program, on_delete=models.CASCADE)
+    interaction = models.CharField(max_length=16, choices=Interaction.choices)
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ("date", "content_item", "program", "interaction")
+        indexes = [models.Index(fields=["program", "date"])]
+
+
+class ContentInteractionRollupWatermark(models.Model):
+    """The creation time up to which the interactions of one kind have been rolled up."""
+
+    interaction = models.CharField(
+        max_length=16, choices=ContentInteractionRollup.Interaction.choices, unique=True
+    )
+    watermark = models.DateTimeField()
+
+
+class ContentViewArchive(models.Model):
+    """
+    A month of content views that was exported to the archive storage and deleted.
+
+    Archived views remain counted in the daily interaction rollups
+    (see `mycarehub.content.archival`).
+    """
+
+    month = models.DateField(db_index=True)
+    path = models.CharField(max_length=255, unique=True)
+    count = models.PositiveIntegerField(default=0)
+    created = models.DateTimeField(auto_now_add=True)
+
+
+class ArchivedContentView(models.Model):
+    """
+    A client's view of a content item that was archived.
+
+    Archiving a content view deletes it, so this compact record is all that is kept of
+    it in the database. A client that views an archived content item again has already
+    been counted and the view is treated as a duplicate (see `mycarehub.content.archival`).
+    """
+
+    client = models.ForeignKey(Client, on_delete=models.PROTECT)
+    content_item = models.ForeignKey(ContentItem, on_delete=models.PROTECT)
+
+    class Meta:
+        unique_together = (
+            "client",
+            "content_item",
+        )
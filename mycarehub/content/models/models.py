@@ -2,6 +2,7 @@ from django import forms
 from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models import Sum
 from modelcluster.contrib.taggit import ClusterTaggableManager
 from modelcluster.fields import ParentalKey, ParentalManyToManyField
 from rest_framework.fields import Field, ReadOnlyField
@@ -20,6 +21,9 @@ from mycarehub.utils.general_utils import default_program
 
 from .snippets import Author, ContentItemCategory
 
+# the rendition of the hero image that is served over the API
+HERO_IMAGE_RENDITION = "fill-1920x1080|jpegquality-60"
+
 RICH_TEXT_FIELD_FEATURES = [
     "h1",
     "h2",
@@ -43,6 +47,22 @@ RICH_TEXT_FIELD_FEATURES = [
 ]
 
 
+class CounterField(Field):
+    """
+    A custom serializer for the cached interaction counts of a content item.
+
+    The count includes the increments that are yet to be flushed to the item.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs["source"] = "*"
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, page):
+        return page.get_count(self.field_name)
+
+
 class MediaSerializedField(Field):
     """A custom serializer used to serialize media in Wagtails v2 API."""
 
@@ -283,6 +303,19 @@ class ContentItem(Page):
     share_count = models.PositiveIntegerField(default=0)
     view_count = models.PositiveIntegerField(default=0)
 
+    def get_count(self, counter):
+        """
+        Return an interaction count, including the increments that are yet to be flushed.
+
+        The pending increments are summed by the database, unless they have been loaded
+        on the item already (see `mycarehub.content.counters.annotate_pending_counts`).
+        """
+        pending = getattr(self, f"pending_{counter}", None)
+        if pending is None:
+            deltas = self.counter_deltas.filter(counter=counter)
+            pending = deltas.aggregate(total=Sum("delta"))["total"] or 0
+        return getattr(self, counter) + pending
+
     @property
     def author_name(self):
         return self.author.name
@@ -357,15 +390,15 @@ class ContentItem(Page):
         APIField(
             "hero_image_rendition",
             serializer=ImageRenditionField(
-                "fill-1920x1080|jpegquality-60",
+                HERO_IMAGE_RENDITION,
                 source="hero_image",
             ),
         ),
         APIField("program"),
-        APIField("like_count"),
-        APIField("bookmark_count"),
-        APIField("view_count"),
-        APIField("share_count"),
+        APIField("like_count", serializer=CounterField()),
+        APIField("bookmark_count", serializer=CounterField()),
+        APIField("view_count", serializer=CounterField()),
+        APIField("share_count", serializer=CounterField()),
         APIField("documents"),
         APIField(
             "featured_media",
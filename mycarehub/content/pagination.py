@@ -0,0 +1,109 @@
+"""
+Keyset (cursor) pagination for the content API.
+
+Offset pagination makes the database scan and discard every row before the
+requested page and shifts page boundaries when content is published while a
+client is paging. Cursor pagination instead resumes after the last item that
+was returned, using a stable `(first_published_at, id)` ordering. Pages that
+were never published through Wagtail (e.g. imported ones) have no
+`first_published_at` and are listed first.
+
+Cursor pagination is opted into with `?pagination=cursor`; the `next` value
+returned in the response metadata is passed back as `?cursor=` to get the
+following page.
+"""
+import base64
+import binascii
+import json
+from collections import OrderedDict
+
+from django.conf import settings
+from django.db.models import F, Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from wagtail.api.v2.utils import BadRequestError
+
+CURSOR_PAGINATION = "cursor"
+
+# query parameters that cannot be combined with cursor pagination
+CURSOR_INCOMPATIBLE_PARAMETERS = ["offset", "order", "search"]
+
+
+def encode_cursor(page):
+    """Return an opaque cursor that resumes pagination after the given page."""
+    published_at = page.first_published_at
+    position = [published_at.isoformat() if published_at else None, page.pk]
+    return base64.urlsafe_b64encode(json.dumps(position).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor):
+    """Return the `(first_published_at, id)` position encoded in a cursor."""
+    try:
+        published_at, pk = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        if published_at is not None:
+            published_at = parse_datetime(published_at)
+            if published_at is None:
+                raise ValueError()
+        if not isinstance(pk, int):
+            raise ValueError()
+    except (binascii.Error, TypeError, ValueError):
+        raise BadRequestError("cursor is not valid")
+
+    return published_at, pk
+
+
+class ContentCursorPagination(BasePagination):
+    ordering = (F("first_published_at").asc(nulls_first=True), "id")
+
+    def get_limit(self, request):
+        limit_max = getattr(settings, "WAGTAILAPI_LIMIT_MAX", 20)
+        limit_default = 20 if not limit_max else min(20, limit_max)
+        try:
+            limit = int(request.GET.get("limit", limit_default))
+            if limit < 0:
+                raise ValueError()
+        except ValueError:
+            raise BadRequestError("limit must be a positive integer")
+
+        if limit_max and limit > limit_max:
+            raise BadRequestError("limit cannot be higher than %d" % limit_max)
+
+        return limit
+
+    def paginate_queryset(self, queryset, request, view=None):
+        for parameter in CURSOR_INCOMPATIBLE_PARAMETERS:
+            if parameter in request.GET:
+                raise BadRequestError(f"{parameter} cannot be used with cursor pagination")
+
+        limit = self.get_limit(request)
+        queryset = queryset.order_by(*self.ordering)
+
+        cursor = request.GET.get("cursor")
+        if cursor:
+            published_at, pk = decode_cursor(cursor)
+            if published_at is None:
+                queryset = queryset.filter(
+                    Q(first_published_at__isnull=False)
+                    | Q(first_published_at__isnull=True, id__gt=pk)
+                )
+            else:
+                queryset = queryset.filter(
+                    Q(first_published_at__gt=published_at)
+                    | Q(first_published_at=published_at, id__gt=pk)
+                )
+
+        # fetch one extra item to find out whether there is a next page
+        items = list(queryset[: limit + 1])
+        page = items[:limit]
+        self.next_cursor = encode_cursor(page[-1]) if page and len(items) > limit else None
+        return page
+
+    def get_paginated_response(self, data):
+        data = OrderedDict(
+            [
+                ("meta", OrderedDict([("next", self.next_cursor)])),
+                ("items", data),
+            ]
+        )
+        return Response(data)
@@ -0,0 +1,212 @@
+"""
+Provisioning of the content of programs.
+
+Every program has a content index page that its content is published under,
+and a "<program name> Editor" group whose members edit the program's content
+in the Wagtail admin (see `mycarehub.users.signals`).
+
+A program is provisioned when it is saved (see `mycarehub.content.signals`).
+Programs that are created in bulk, which does not send the signals, are
+provisioned together with `provision_programs`. The permissions that editors
+are granted are looked up in a single (cached) query, and the permissions of
+all the editor groups are inserted with a statement per kind of permission.
+"""
+from django.contrib.auth.models import Group, Permission
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.core.exceptions import ObjectDoesNotExist
+from wagtail.models import Collection, GroupCollectionPermission, GroupPagePermission, Page, Site
+
+from mycarehub.home.models import HomePage
+from mycarehub.users.effective_permissions import invalidate_effective_permissions
+
+from .models import ContentItemIndexPage
+
+HOMEPAGE_TITLE = "Mycarehub Home Page"
+
+EDITOR_PERMISSIONS_CACHE_KEY = "content:provisioning:permissions"
+EDITOR_PERMISSIONS_CACHE_TIMEOUT = 24 * 60 * 60
+
+# the permissions of the editors of a program's content, as "<app label>.<codename>"
+EDITOR_PERMISSIONS = [
+    "wagtailadmin.access_admin",
+    "content.add_author",
+    "content.change_author",
+    "content.add_contentitemcategory",
+    "content.change_contentitemcategory",
+    "content.add_smscontentitemcategory",
+    "content.change_smscontentitemcategory",
+    "content.add_smscontentitemtag",
+    "content.change_smscontentitemtag",
+    "simple_translation.submit_translation",
+    "wagtailcore.add_locale",
+    "wagtailcore.change_locale",
+    "wagtailcore.add_workflow",
+    "wagtailcore.change_workflow",
+    "wagtailcore.delete_workflow",
+    "wagtailcore.add_task",
+    "wagtailcore.change_task",
+    "wagtailcore.delete_task",
+    "wagtailcore.add_site",
+    "wagtailcore.change_site",
+    "wagtailcore.view_site",
+]
+# the permissions of the editors on their program's content index page
+EDITOR_PAGE_PERMISSIONS = [
+    "wagtailcore.add_page",
+    "wagtailcore.change_page",
+    "wagtailcore.publish_page",
+]
+# the permissions of the editors on the root collection of images, documents and media
+EDITOR_COLLECTION_PERMISSIONS = [
+    "wagtailimages.add_image",
+    "wagtailimages.choose_image",
+    "wagtailimages.change_image",
+    "wagtailimages.delete_image",
+    "wagtaildocs.add_document",
+    "wagtaildocs.choose_document",
+    "wagtaildocs.change_document",
+    "wagtaildocs.delete_document",
+    "wagtailmedia.add_media",
+    "wagtailmedia.delete_media",
+    "wagtailmedia.change_media",
+]
+
+
+def get_editor_permission_ids():
+    """Return the ids of the permissions that editors are granted, keyed by permission."""
+    permission_ids = cache.get(EDITOR_PERMISSIONS_CACHE_KEY)
+    if permission_ids is None:
+        wanted = set(EDITOR_PERMISSIONS + EDITOR_PAGE_PERMISSIONS + EDITOR_COLLECTION_PERMISSIONS)
+        app_labels, codenames = zip(*(permission.split(".") for permission in wanted))
+        permission_ids = {
+            f"{app_label}.{codename}": pk
+            for app_label, codename, pk in Permission.objects.filter(
+                content_type__app_label__in=app_labels, codename__in=codenames
+            ).values_list("content_type__app_label", "codename", "pk")
+            if f"{app_label}.{codename}" in wanted
+        }
+        missing = wanted - set(permission_ids)
+        if missing:
+            raise Permission.DoesNotExist(f"{', '.join(sorted(missing))} do(es) not exist")
+
+        cache.set(EDITOR_PERMISSIONS_CACHE_KEY, permission_ids, EDITOR_PERMISSIONS_CACHE_TIMEOUT)
+
+    return permission_ids
+
+
+def get_homepage():
+    """Return the home page that the content index pages are children of, creating it if needed."""
+    try:
+        return HomePage.objects.get(title=HOMEPAGE_TITLE)
+    except ObjectDoesNotExist:
+        homepage = HomePage(
+            title=HOMEPAGE_TITLE,
+            content_type=ContentType.objects.get_for_model(HomePage),
+        )
+        Page.get_first_root_node().add_child(instance=homepage)
+
+        Site.objects.update_or_create(
+            hostname="localhost",
+            defaults={
+                "root_page": homepage,
+                "is_default_site": True,
+                "site_name": "mycarehub.com",
+            },
+        )
+        return homepage
+
+
+def provision_program_editors(index_pages):
+    """Create the editor groups of the programs of index pages and grant them their permissions."""
+    if not index_pages:
+        return
+
+    permission_ids = get_editor_permission_ids()
+    group_names = {page.pk: f"{page.program.name} Editor" for page in index_pages}
+    groups = {group.name: group for group in Group.objects.filter(name__in=group_names.values())}
+    groups.update(
+        (group.name, group)
+        for group in Group.objects.bulk_create(
+            [Group(name=name) for name in set(group_names.values()) - set(groups)]
+        )
+    )
+
+    GroupPermission = Group.permissions.through
+    GroupPermission.objects.bulk_create(
+        [
+            GroupPermission(group=group, permission_id=permission_ids[permission])
+            for group in groups.values()
+            for permission in EDITOR_PERMISSIONS
+        ],
+        ignore_conflicts=True,
+    )
+    GroupPagePermission.objects.bulk_create(
+        [
+            GroupPagePermission(
+                group=groups[group_names[page.pk]],
+                page=page,
+                permission_id=permission_ids[permission],
+                # the deprecated permission type is filled in by `save`, which is skipped here
+                permission_type=permission.split(".")[1][: -len("_page")],
+            )
+            for page in index_pages
+            for permission in EDITOR_PAGE_PERMISSIONS
+        ],
+        ignore_conflicts=True,
+    )
+
+    root_collection = Collection.get_first_root_node()
+    GroupCollectionPermission.objects.bulk_create(
+        [
+            GroupCollectionPermission(
+                group=group,
+                collection=root_collection,
+                permission_id=permission_ids[permission],
+            )
+            for group in groups.values()
+            for permission in EDITOR_COLLECTION_PERMISSIONS
+        ],
+        ignore_conflicts=True,
+    )
+    # the bulk inserts do not send the signals that evict the permissions of the groups' members
+    invalidate_effective_permissions()
+
+
+def provision_programs(programs):
+    """
+    Create the content index pages (and editor groups) of programs that do not have one.
+
+    The index pages of programs that already have one are moved to the program's
+    organisation if it has changed.
+    """
+    programs = list(programs)
+    index_pages = {
+        page.program_id: page
+        for page in ContentItemIndexPage.objects.filter(
+            program_id__in=[program.pk for program in programs]
+        )
+    }
+
+    homepage = None
+    created = []
+    for program in programs:
+        index_page = index_pages.get(program.pk)
+        if index_page is None:
+            homepage = homepage or get_homepage()
+            index_page = ContentItemIndexPage(
+                title=f"{program.name} Program Content",
+                intro=f"Content for {program.name} program",
+                organisation_id=program.organisation_id,
+                program=program,
+            )
+            # the editors of the created index pages are provisioned together below
+            index_page.provisioned_in_bulk = True
+            homepage.add_child(instance=index_page)
+            index_pages[program.pk] = index_page
+            created.append(index_page)
+        elif index_page.organisation_id != program.organisation_id:
+            index_page.organisation_id = program.organisation_id
+            index_page.save()
+
+    provision_program_editors(created)
@@ -0,0 +1,121 @@
+"""
+Pre-generation of image renditions.
+
+The renditions that the API and the templates serve are generated by a pool of
+background workers when content is published (or when a published image is
+replaced), instead of by the first request that needs them.
+
+Each rendition is produced only once: renditions already queued in this process
+are not queued again and a cache lock keeps workers in other processes from
+generating the same rendition at the same time.
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections, transaction
+
+from mycarehub.content.models import HERO_IMAGE_RENDITION, ContentItem, CustomImage
+
+LOGGER = logging.getLogger(__name__)
+
+# the renditions that are served for each image field of a content item
+CONTENT_ITEM_RENDITIONS = {
+    "hero_image": [
+        HERO_IMAGE_RENDITION,  # `ContentItem.api_fields`
+        "min-500x200",  # content/content_item.html
+    ],
+}
+
+# how long (in seconds) a worker may hold on to a rendition it is generating
+RENDITION_LOCK_TIMEOUT = 300
+
+_executor = None
+_lock = threading.Lock()
+_pending = set()
+
+
+def get_rendition_executor():
+    """Return the worker pool that renditions are generated in."""
+    global _executor
+
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.CONTENT_RENDITION_WORKERS,
+                thread_name_prefix="renditions",
+            )
+    return _executor
+
+
+def get_page_renditions(page):
+    """Return the `(image_id, filter_spec)` renditions that a content item is served with."""
+    renditions = []
+    for field, filter_specs in CONTENT_ITEM_RENDITIONS.items():
+        image_id = getattr(page, f"{field}_id")
+        if image_id:
+            renditions.extend((image_id, filter_spec) for filter_spec in filter_specs)
+
+    return renditions
+
+
+def get_image_renditions(image):
+    """Return the `(image_id, filter_spec)` renditions that live content serves an image with."""
+    renditions = []
+    for field, filter_specs in CONTENT_ITEM_RENDITIONS.items():
+        if ContentItem.objects.live().filter(**{field: image}).exists():
+            renditions.extend((image.id, filter_spec) for filter_spec in filter_specs)
+
+    return renditions
+
+
+def generate_rendition(image_id, filter_spec):
+    """Generate a rendition unless it exists or another worker is generating it."""
+    lock_key = f"renditions:lock:{image_id}:{filter_spec}"
+    if not cache.add(lock_key, True, RENDITION_LOCK_TIMEOUT):
+        return
+
+    try:
+        image = CustomImage.objects.prefetch_renditions(filter_spec).get(id=image_id)
+        image.get_rendition(filter_spec)
+    except CustomImage.DoesNotExist:
+        LOGGER.info(f"image {image_id} was deleted before its renditions were generated")
+    except Exception:  # noqa
+        # the rendition will be generated when it is first requested
+        LOGGER.exception(f"unable to generate the {filter_spec} rendition of image {image_id}")
+    finally:
+        cache.delete(lock_key)
+
+
+def _generate_in_background(image_id, filter_spec):
+    try:
+        generate_rendition(image_id, filter_spec)
+    finally:
+        with _lock:
+            _pending.discard((image_id, filter_spec))
+        connections.close_all()
+
+
+def pregenerate_renditions(renditions):
+    """
+    Generate renditions once the current transaction is committed.
+
+    Renditions are generated in the worker pool. When no workers are configured,
+    they are generated right away.
+    """
+
+    def submit():
+        for image_id, filter_spec in renditions:
+            if not settings.CONTENT_RENDITION_WORKERS:
+                generate_rendition(image_id, filter_spec)
+                continue
+
+            with _lock:
+                if (image_id, filter_spec) in _pending:
+                    continue
+                _pending.add((image_id, filter_spec))
+            get_rendition_executor().submit(_generate_in_background, image_id, filter_spec)
+
+    transaction.on_commit(submit)
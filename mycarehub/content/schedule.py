@@ -0,0 +1,73 @@
+"""
+Content unlock schedules for GRADUAL programs.
+
+Clients in a GRADUAL program see the program's content at the pace it was
+originally published in, starting from their enrollment. Each program's
+schedule is a sorted list of `(date, page_id)` pairs, so the content that a
+client can see is a prefix of the schedule that is found with a binary search.
+
+Schedules are cached per program and evicted together with the program's
+cached listings (see `mycarehub.content.cache`).
+"""
+from bisect import bisect_right
+from datetime import datetime, time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from mycarehub.content.cache import LISTING_CACHE_PREFIX, get_cache_generation
+from mycarehub.content.models import ContentItem
+
+
+def get_content_sequence_cutoff(client_context, moment):
+    """
+    Return the latest content date that a client on a GRADUAL program can see at `moment`.
+
+    Content is unlocked at the pace the program was published in, starting from the
+    client's enrollment. The client is given as a `ClientContext`.
+    """
+    # How long a client has been active since creation/enrollment
+    client_active_delta = moment - client_context.enrollment_date
+
+    # Determine the content to show i.e up to which date
+    return client_context.program_start_date + client_active_delta
+
+
+def get_unlock_schedule(program_id):
+    """Return the `(date, page_id)` pairs of a program's live content, sorted by date."""
+    scope = str(program_id)
+    key = f"{LISTING_CACHE_PREFIX}:schedule:{scope}:{get_cache_generation(scope)}"
+    schedule = cache.get(key)
+    if schedule is None:
+        schedule = list(
+            ContentItem.objects.live()
+            .filter(program_id=program_id)
+            .order_by("date", "id")
+            .values_list("date", "id")
+        )
+        cache.set(key, schedule, settings.CONTENT_API_CACHE_TIMEOUT)
+
+    return schedule
+
+
+def get_unlocked_content(client_context, moment):
+    """
+    Return the content a client can see at `moment` and when more content unlocks.
+
+    The client is given as a `ClientContext`. The result is a `(page_ids, next_unlock_at)`
+    pair. `next_unlock_at` is None when the client has already unlocked the whole program.
+    """
+    schedule = get_unlock_schedule(client_context.program_id)
+    cutoff = timezone.localdate(get_content_sequence_cutoff(client_context, moment))
+    index = bisect_right(schedule, (cutoff, float("inf")))
+    page_ids = [page_id for _, page_id in schedule[:index]]
+
+    next_unlock_at = None
+    if index < len(schedule):
+        next_date = timezone.make_aware(datetime.combine(schedule[index][0], time.min))
+        next_unlock_at = client_context.enrollment_date + (
+            next_date - client_context.program_start_date
+        )
+
+    return page_ids, next_unlock_at
@@ -1,12 +1,14 @@
 from django.db import transaction
-from django.db.models import F
 from rest_framework import serializers
 
 from mycarehub.common.serializers.base_serializers import BaseSerializer
 
+from .analytics import schedule_interaction_rollup
+from .counters import record_counter_delta
 from .models import (
+    ArchivedContentView,
     ContentBookmark,
-    ContentItem,
+    ContentInteractionRollup,
     ContentItemCategory,
     ContentLike,
     ContentShare,
@@ -27,63 +29,108 @@ class ContentItemCategorySerializer(BaseSerializer):
         fields = "__all__"
 
 
-class ContentViewSerializer(BaseSerializer):
+class ContentInteractionSerializer(BaseSerializer):
+    """Base serializer for interactions that are counted on the content item."""
+
+    # the `ContentItem` count that the interaction is counted in
+    counter = None
+
     def create(self, validated_data):
         with transaction.atomic():
-            content_view = ContentView.objects.create(**validated_data)
+            # the related objects and the uniqueness were validated by the serializer
+            interaction = self.Meta.model(**validated_data)
+            interaction.save(full_validation=False)
 
             content_item = validated_data.get("content_item")
-            ContentItem.objects.filter(id=content_item.id).update(view_count=F("view_count") + 1)
+            record_counter_delta(content_item.id, self.counter)
+            schedule_interaction_rollup()
 
-            return content_view
+            return interaction
 
-    class Meta(BaseSerializer.Meta):
-        model = ContentView
-        fields = "__all__"
 
+def validate_view_not_archived(attrs):
+    """Reject a view of a content item that the client's archived views already count."""
+    if ArchivedContentView.objects.filter(
+        client=attrs["client"], content_item=attrs["content_item"]
+    ).exists():
+        raise serializers.ValidationError(
+            "The fields client, content_item must make a unique set.", code="unique"
+        )
 
-class ContentShareSerializer(BaseSerializer):
-    def create(self, validated_data):
-        with transaction.atomic():
-            content_share = ContentShare.objects.create(**validated_data)
 
-            content_item = validated_data.get("content_item")
-            ContentItem.objects.filter(id=content_item.id).update(share_count=F("share_count") + 1)
+class ContentViewSerializer(ContentInteractionSerializer):
+    counter = "view_count"
 
-            return content_share
+    def get_validators(self):
+        return [*super().get_validators(), validate_view_not_archived]
 
     class Meta(BaseSerializer.Meta):
-        model = ContentShare
+        model = ContentView
         fields = "__all__"
 
 
-class ContentLikeSerializer(BaseSerializer):
-    def create(self, validated_data):
-        with transaction.atomic():
-            content_like = ContentLike.objects.create(**validated_data)
+class ContentShareSerializer(ContentInteractionSerializer):
+    counter = "share_count"
+
+    class Meta(BaseSerializer.Meta):
+        model = ContentShare
+        fields = "__all__"
 
-            content_item = validated_data.get("content_item")
-            ContentItem.objects.filter(id=content_item.id).update(like_count=F("like_count") + 1)
 
-            return content_like
+class ContentLikeSerializer(ContentInteractionSerializer):
+    counter = "like_count"
 
     class Meta(BaseSerializer.Meta):
         model = ContentLike
         fields = "__all__"
 
 
-class ContentBookmarkSerializer(BaseSerializer):
-    def create(self, validated_data):
-        with transaction.atomic():
-            content_bookmark = ContentBookmark.objects.create(**validated_data)
-
-            content_item = validated_data.get("content_item")
-            ContentItem.objects.filter(id=content_item.id).update(
-                bookmark_count=F("bookmark_count") + 1
-            )
-
-            return content_bookmark
+class ContentBookmarkSerializer(ContentInteractionSerializer):
+    counter = "bookmark_count"
 
     class Meta(BaseSerializer.Meta):
         model = ContentBookmark
         fields = "__all__"
+
+
+class ContentInteractionBatchSerializer(serializers.Serializer):
+    """Validates the size of a batch of interactions sent to a bulk ingestion endpoint."""
+
+    # the most interactions that are ingested in one transaction
+    MAX_INTERACTIONS = 1000
+
+    # the interactions themselves are validated one by one by the viewset
+    interactions = serializers.ListField(allow_empty=True, max_length=MAX_INTERACTIONS)
+
+
+class ContentInteractionStateQuerySerializer(serializers.Serializer):
+    """Validates the query parameters of a content interaction state lookup."""
+
+    # the most content items whose interaction state can be looked up at once
+    MAX_CONTENT_ITEMS = 500
+
+    client_id = serializers.UUIDField()
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=MAX_CONTENT_ITEMS,
+    )
+
+
+class ContentEngagementQuerySerializer(serializers.Serializer):
+    """Validates the query parameters of a content engagement report."""
+
+    program_id = serializers.UUIDField(required=False)
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+    interaction = serializers.ChoiceField(
+        choices=ContentInteractionRollup.Interaction.choices, required=False
+    )
+    content_item_id = serializers.IntegerField(min_value=1, required=False)
+    facility_id = serializers.UUIDField(required=False)
+    limit = serializers.IntegerField(min_value=1, max_value=100, default=10)
+
+    def validate(self, attrs):
+        if attrs.get("start") and attrs.get("end") and attrs["start"] > attrs["end"]:
+            raise serializers.ValidationError({"end": "end must not be before start"})
+        return attrs
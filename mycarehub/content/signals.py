@@ -1,27 +1,20 @@
 from django.conf import settings
-from django.contrib.auth.models import Group, Permission
-from django.contrib.contenttypes.models import ContentType
-from django.core.exceptions import ObjectDoesNotExist
-from django.db.models import F
-from django.db.models.signals import post_delete, post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
-from wagtail.documents.models import Document
-from wagtail.images.models import Image
-from wagtail.models import Collection, GroupCollectionPermission, GroupPagePermission, Page, Site
-from wagtailmedia.models import Media
+from wagtail.models import PageLogEntry
+from wagtail.signals import page_published, page_unpublished, post_page_move
 
 from mycarehub.common.models import Program
-from mycarehub.content.models import (
-    Author,
-    ContentBookmark,
-    ContentItem,
-    ContentItemCategory,
-    ContentLike,
-)
-from mycarehub.content.models.sms import SMSContentItemCategory, SMSContentItemTag
-from mycarehub.home.models import HomePage
+from mycarehub.content.cache import invalidate_listing_cache
+from mycarehub.content.models import ContentBookmark, ContentItem, ContentLike, CustomImage
+from mycarehub.content.models.sms import SMSContentItem
 
+from .counters import record_counter_delta
 from .models import ContentItemIndexPage
+from .provisioning import provision_program_editors, provision_programs
+from .renditions import get_image_renditions, get_page_renditions, pregenerate_renditions
+from .sync import record_log_entry_program
 
 
 @receiver(post_save, sender=Program)
@@ -31,182 +24,67 @@ def create_program_content_index_page(sender, instance, created, **kwargs):
     if settings.DEFAULT_PROGRAM_ID == str(instance.id) and created:
         return
 
-    if created and ContentItemIndexPage.objects.filter(program=instance).exists():
-        return
-
-    try:
-        homepage = HomePage.objects.get(title="Mycarehub Home Page")
-    except ObjectDoesNotExist:
-        homepage_content_type = ContentType.objects.get_for_model(HomePage)
-
-        homepage = HomePage(
-            title="Mycarehub Home Page",
-            content_type=homepage_content_type,
-        )
-
-        root = Page.get_first_root_node()
-        root.add_child(instance=homepage)
-
-        Site.objects.update_or_create(
-            hostname="localhost",
-            defaults={
-                "root_page": homepage,
-                "is_default_site": True,
-                "site_name": "mycarehub.com",
-            },
-        )
-
-    try:
-        content_item_index = ContentItemIndexPage.objects.get(program=instance)
-    except ObjectDoesNotExist:
-        content_item_index = ContentItemIndexPage(
-            title=f"{instance.name} Program Content",
-            intro=f"Content for {instance.name} program",
-            organisation=instance.organisation,
-            program=instance,
-        )
-
-        homepage.add_child(instance=content_item_index)
-
-        return
-
-    content_item_index.organisation = instance.organisation
-    content_item_index.program = instance
-
-    content_item_index.save()
+    provision_programs([instance])
 
 
 # receiver that runs after creation of content item index page
 @receiver(post_save, sender=ContentItemIndexPage)
 def create_program_content_editor_permissions(sender, instance, created, **kwargs):
-    if created:
-        group, _ = Group.objects.get_or_create(name=f"{instance.program.name} Editor")
-
-        can_access_wagtail_admin = Permission.objects.get(
-            content_type=ContentType.objects.get(app_label="wagtailadmin", model="admin"),
-            codename="access_admin",
-        )
-        group.permissions.add(can_access_wagtail_admin)
-
-        allowed_author_permissions = ["add_author", "change_author"]
-        for permission in allowed_author_permissions:
-            permission_object = Permission.objects.get(
-                content_type=ContentType.objects.get_for_model(Author), codename=permission
-            )
-            group.permissions.add(permission_object)
-
-        allowed_content_category_permissions = [
-            "add_contentitemcategory",
-            "change_contentitemcategory",
-        ]
-        for permission in allowed_content_category_permissions:
-            permission_object = Permission.objects.get(
-                content_type=ContentType.objects.get_for_model(ContentItemCategory),
-                codename=permission,
-            )
-            group.permissions.add(permission_object)
-
-        allowed_sms_content_item_category_permissions = [
-            "add_smscontentitemcategory",
-            "change_smscontentitemcategory",
-        ]
-        for permission in allowed_sms_content_item_category_permissions:
-            permission_object = Permission.objects.get(
-                content_type=ContentType.objects.get_for_model(SMSContentItemCategory),
-                codename=permission,
-            )
-            group.permissions.add(permission_object)
-
-        allowed_sms_content_item_tag_permissions = [
-            "add_smscontentitemtag",
-            "change_smscontentitemtag",
-        ]
-        for permission in allowed_sms_content_item_tag_permissions:
-            permission_object = Permission.objects.get(
-                content_type=ContentType.objects.get_for_model(SMSContentItemTag),
-                codename=permission,
-            )
-            group.permissions.add(permission_object)
-
-        permission_object = Permission.objects.get(
-            content_type=ContentType.objects.get(
-                app_label="simple_translation", model="simpletranslation"
-            ),
-        )
-        group.permissions.add(permission_object)
-
-        allowed_locale_permissions = ["add_locale", "change_locale"]
-        allowed_site_permissions = ["add_site", "change_site", "view_site"]
-        allowed_workflow_permissions = ["add_workflow", "change_workflow", "delete_workflow"]
-        allowed_workflowtask_permissions = ["add_task", "change_task", "delete_task"]
-        for permission in (
-            allowed_locale_permissions
-            + allowed_workflow_permissions
-            + allowed_workflowtask_permissions
-            + allowed_site_permissions
-        ):
-            permission_object = Permission.objects.get(
-                content_type__app_label="wagtailcore",
-                codename=permission,
-            )
-            group.permissions.add(permission_object)
-
-        allowed_page_permissions = ["add_page", "change_page", "publish_page"]
-        for permission in allowed_page_permissions:
-            GroupPagePermission.objects.get_or_create(
-                group=group,
-                page=instance,
-                permission=Permission.objects.get(
-                    content_type=ContentType.objects.get_for_model(Page), codename=permission
-                ),
-            )
-
-        root_collection = Collection.get_first_root_node()
-        allowed_image_permissions = ["add_image", "choose_image", "change_image", "delete_image"]
-        for permission in allowed_image_permissions:
-            GroupCollectionPermission.objects.get_or_create(
-                group=group,
-                collection=root_collection,
-                permission=Permission.objects.get(
-                    content_type=ContentType.objects.get_for_model(Image), codename=permission
-                ),
-            )
-
-        allowed_document_permissions = [
-            "add_document",
-            "choose_document",
-            "change_document",
-            "delete_document",
-        ]
-
-        for permission in allowed_document_permissions:
-            GroupCollectionPermission.objects.get_or_create(
-                group=group,
-                collection=root_collection,
-                permission=Permission.objects.get(
-                    content_type=ContentType.objects.get_for_model(Document), codename=permission
-                ),
-            )
-
-        allowed_media_permissions = ["add_media", "delete_media", "change_media"]
-
-        for permission in allowed_media_permissions:
-            GroupCollectionPermission.objects.get_or_create(
-                group=group,
-                collection=root_collection,
-                permission=Permission.objects.get(
-                    content_type=ContentType.objects.get_for_model(Media), codename=permission
-                ),
-            )
+    # the editors of index pages created by `provision_programs` are provisioned in bulk
+    if created and not getattr(instance, "provisioned_in_bulk", False):
+        provision_program_editors([instance])
 
 
 @receiver(post_delete, sender=ContentLike)
 def reduce_like_count(sender, instance, *args, **kwargs):
-    ContentItem.objects.filter(id=instance.content_item.id).update(like_count=F("like_count") - 1)
+    record_counter_delta(instance.content_item_id, "like_count", -1)
 
 
 @receiver(post_delete, sender=ContentBookmark)
 def reduce_bookmark_count(sender, instance, *args, **kwargs):
-    ContentItem.objects.filter(id=instance.content_item.id).update(
-        bookmark_count=F("bookmark_count") - 1
-    )
+    record_counter_delta(instance.content_item_id, "bookmark_count", -1)
+
+
+@receiver(page_published, sender=ContentItem)
+@receiver(page_published, sender=SMSContentItem)
+@receiver(page_unpublished, sender=ContentItem)
+@receiver(page_unpublished, sender=SMSContentItem)
+@receiver(post_delete, sender=ContentItem)
+@receiver(post_delete, sender=SMSContentItem)
+def evict_program_content_listings(sender, instance, **kwargs):
+    program_id = instance.program_id
+    transaction.on_commit(lambda: invalidate_listing_cache(program_id))
+
+
+@receiver(post_page_move)
+def evict_moved_content_listings(
+    sender, instance, parent_page_before, parent_page_after, **kwargs
+):
+    if sender not in (ContentItem, SMSContentItem):
+        return
+
+    program_ids = {instance.specific.program_id}
+    for parent in (parent_page_before, parent_page_after):
+        program_ids.add(getattr(parent.specific, "program_id", None))
+
+    for program_id in program_ids - {None}:
+        transaction.on_commit(lambda program_id=program_id: invalidate_listing_cache(program_id))
+
+
+@receiver(pre_save, sender=PageLogEntry)
+def record_content_item_program(sender, instance, **kwargs):
+    # deleted content items, and ones that changed program, are synced by their log entries
+    record_log_entry_program(instance)
+
+
+@receiver(page_published, sender=ContentItem)
+def pregenerate_published_renditions(sender, instance, **kwargs):
+    # sent when publishing from the admin, on schedule and from code alike
+    pregenerate_renditions(get_page_renditions(instance))
+
+
+@receiver(post_save, sender=CustomImage)
+def pregenerate_replaced_image_renditions(sender, instance, created, **kwargs):
+    # a replaced image loses its renditions, regenerate the ones live content serves
+    if not created:
+        pregenerate_renditions(get_image_renditions(instance))
@@ -0,0 +1,86 @@
+"""
+Tombstones for the delta sync of content items.
+
+A sync since a watermark lists, besides the changed items, the ids of the items
+that the apps should remove: the ones that were unpublished or deleted, and the
+live ones that were taken out of the client's scope, since the watermark.
+
+Content items can change program and deleted ones can not be looked up, so the
+program that a content item was in when an action was logged is recorded on its
+page log entries (see `mycarehub.content.signals`). A client is only told about
+the items that have been in its program.
+"""
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Q
+from wagtail.models import Page, PageLogEntry
+
+from mycarehub.content.models import ContentItem
+
+# page log actions that remove a content item from the apps
+TOMBSTONE_ACTIONS = ["wagtail.unpublish", "wagtail.unpublish.scheduled", "wagtail.delete"]
+
+# page log actions, besides publishing, that may take a live item out of a client's scope
+RESCOPE_ACTIONS = ["wagtail.move"]
+
+
+def _content_item_log_entries():
+    return PageLogEntry.objects.filter(content_type=ContentType.objects.get_for_model(ContentItem))
+
+
+def record_log_entry_program(log_entry):
+    """Record the program of the content item that a new page log entry is about."""
+    content_type = ContentType.objects.get_for_model(ContentItem)
+    if log_entry.pk or log_entry.content_type_id != content_type.id:
+        return
+
+    program_id = (
+        ContentItem.objects.filter(id=log_entry.page_id)
+        .values_list("program_id", flat=True)
+        .first()
+    )
+    if program_id:
+        log_entry.data = {**(log_entry.data or {}), "program_id": str(program_id)}
+
+
+def _in_program(program_id, field="id"):
+    """Match the content items (by `field`) that are, or have been, in a program."""
+    current = ContentItem.objects.filter(program_id=program_id).values("id")
+    logged = _content_item_log_entries().filter(data__program_id=str(program_id))
+    return Q(**{f"{field}__in": current}) | Q(**{f"{field}__in": logged.values("page_id")})
+
+
+def get_deleted_content_items(since, program_id=None):
+    """
+    Return the ids of the content items that were unpublished or deleted since `since`.
+
+    Only the items that have been in a program are returned, if one is given.
+    """
+    log_entries = (
+        _content_item_log_entries()
+        .filter(action__in=TOMBSTONE_ACTIONS, timestamp__gt=since)
+        .exclude(page_id__in=Page.objects.live().values("id"))
+    )
+    if program_id:
+        log_entries = log_entries.filter(_in_program(program_id, "page_id"))
+    return list(log_entries.order_by("page_id").values_list("page_id", flat=True).distinct())
+
+
+def get_rescoped_content_items(since, scoped, program_id=None):
+    """
+    Return the ids of the live content items that left a client's scope since `since`.
+
+    These are the items that were republished or moved in the meantime, e.g. to
+    another program or facilities, and are no longer in `scoped` (the items the
+    client can see). Only the items that have been in a program are returned, if
+    one is given; the client may still not have had some of them, and the apps
+    ignore the ids they do not have.
+    """
+    moved = _content_item_log_entries().filter(action__in=RESCOPE_ACTIONS, timestamp__gt=since)
+    rescoped = (
+        ContentItem.objects.live()
+        .filter(Q(last_published_at__gt=since) | Q(id__in=moved.values("page_id")))
+        .exclude(id__in=scoped.values("id"))
+    )
+    if program_id:
+        rescoped = rescoped.filter(_in_program(program_id))
+    return list(rescoped.order_by("id").values_list("id", flat=True))
@@ -0,0 +1,164 @@
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from model_bakery import baker
+from rest_framework import status
+
+from mycarehub.common.models import Facility
+from mycarehub.content.analytics import (
+    ROLLUP_SCHEDULED_KEY,
+    rollup_interactions,
+    rollup_interactions_in_background,
+    schedule_interaction_rollup,
+)
+from mycarehub.content.models import (
+    ContentInteractionRollup,
+    ContentInteractionRollupWatermark,
+    ContentLike,
+    ContentView,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def interactions(content_item_with_tag_and_category, program):
+    """Two views yesterday, a view and a like today."""
+    now = timezone.now() - timedelta(minutes=1)
+    yesterday = now - timedelta(days=1)
+    for created in [yesterday, yesterday, now]:
+        baker.make(
+            ContentView,
+            content_item=content_item_with_tag_and_category,
+            program=program,
+            created=created,
+            updated=created,
+        )
+    baker.make(
+        ContentLike,
+        content_item=content_item_with_tag_and_category,
+        program=program,
+        created=now,
+        updated=now,
+    )
+    return content_item_with_tag_and_category
+
+
+def test_rollup_interactions(interactions, program):
+    now = timezone.now()
+    today = timezone.localdate(now)
+    yesterday = today - timedelta(days=1)
+
+    assert rollup_interactions(until=now) == {
+        "like": 1,
+        "bookmark": 0,
+        "share": 0,
+        "view": 3,
+    }
+    assert set(
+        ContentInteractionRollup.objects.values_list("date", "interaction", "count", "program_id")
+    ) == {
+        (yesterday, "view", 2, program.id),
+        (today, "view", 1, program.id),
+        (today, "like", 1, program.id),
+    }
+    assert ContentInteractionRollupWatermark.objects.count() == 4
+
+    # only the interactions created since the watermark are rolled up
+    baker.make(ContentView, content_item=interactions, program=program)
+    assert rollup_interactions(until=timezone.now() + timedelta(seconds=1))["view"] == 1
+    assert ContentInteractionRollup.objects.get(date=today, interaction="view").count == 2
+    assert set(rollup_interactions().values()) == {0}
+
+
+def test_rollup_content_interactions_command(interactions):
+    out = StringIO()
+
+    call_command("rollup_content_interactions", stdout=out)
+
+    # interactions that may not be committed yet are rolled up later
+    assert "view: 2" in out.getvalue()
+    assert "like: 0" in out.getvalue()
+
+
+def test_schedule_interaction_rollup(django_capture_on_commit_callbacks):
+    cache.delete(ROLLUP_SCHEDULED_KEY)
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        schedule_interaction_rollup()
+        schedule_interaction_rollup()
+
+    assert len(callbacks) == 1
+    cache.delete(ROLLUP_SCHEDULED_KEY)
+
+
+# the rollup is committed by the background thread
+@pytest.mark.django_db(transaction=True)
+def test_rollup_interactions_in_background():
+    thread = rollup_interactions_in_background()
+    thread.join()
+
+    assert ContentInteractionRollupWatermark.objects.count() == 4
+
+
+def test_content_engagement_timeseries_view(
+    interactions, program, user_with_all_permissions, client
+):
+    client.force_login(user_with_all_permissions)
+    rollup_interactions(until=timezone.now() + timedelta(seconds=1))
+    today = timezone.localdate()
+    url = reverse("api:content-engagement-timeseries")
+
+    response = client.get(url, {"program_id": program.id, "interaction": "view"})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [
+        {"date": str(today - timedelta(days=1)), "interaction": "view", "count": 2},
+        {"date": str(today), "interaction": "view", "count": 1},
+    ]
+
+    response = client.get(url, {"start": today, "end": today, "content_item_id": interactions.id})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [
+        {"date": str(today), "interaction": "like", "count": 1},
+        {"date": str(today), "interaction": "view", "count": 1},
+    ]
+
+
+def test_content_engagement_top_view(interactions, facility, user_with_all_permissions, client):
+    client.force_login(user_with_all_permissions)
+    rollup_interactions(until=timezone.now() + timedelta(seconds=1))
+    url = reverse("api:content-engagement-top")
+
+    response = client.get(url, {"facility_id": facility.id, "limit": 1})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == [
+        {"content_item": interactions.id, "title": "An article", "count": 4}
+    ]
+
+    response = client.get(url, {"facility_id": baker.make(Facility).id})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == []
+
+
+@pytest.mark.parametrize(
+    "params,field",
+    [
+        ({"start": "2023-02-01", "end": "2023-01-01"}, "end"),
+        ({"interaction": "comment"}, "interaction"),
+        ({"limit": 1000}, "limit"),
+    ],
+)
+def test_content_engagement_bad_requests(params, field, user_with_all_permissions, client):
+    client.force_login(user_with_all_permissions)
+
+    response = client.get(reverse("api:content-engagement-top"), params)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert field in response.json()
@@ -0,0 +1,156 @@
+import gzip
+import json
+from datetime import date, timedelta
+from io import StringIO
+
+import pytest
+from django.core.files.storage import FileSystemStorage
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from model_bakery import baker
+from rest_framework import status
+
+from mycarehub.content.analytics import rollup_interactions
+from mycarehub.content.archival import (
+    archive_content_views,
+    get_archived_until,
+    get_month_start,
+    get_next_month,
+)
+from mycarehub.content.counters import reconcile_counts
+from mycarehub.content.models import (
+    ArchivedContentView,
+    ContentItem,
+    ContentItemCounterDelta,
+    ContentView,
+    ContentViewArchive,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def archive_storage(settings, tmp_path):
+    settings.CONTENT_ARCHIVE_STORAGE = "django.core.files.storage.FileSystemStorage"
+    settings.MEDIA_ROOT = str(tmp_path)
+    return FileSystemStorage(location=tmp_path)
+
+
+@pytest.fixture
+def views(content_item_with_tag_and_category):
+    """Two views two months ago, a view last month and a view this month."""
+    this_month = get_month_start(timezone.now())
+    last_month = get_month_start(this_month - timedelta(days=1))
+    two_months_ago = get_month_start(last_month - timedelta(days=1))
+    for created in [two_months_ago, two_months_ago + timedelta(days=2), last_month, this_month]:
+        baker.make(
+            ContentView,
+            content_item=content_item_with_tag_and_category,
+            created=created,
+            updated=created,
+        )
+    ContentItem.objects.update(view_count=4)
+    return two_months_ago, last_month, this_month
+
+
+def test_get_next_month():
+    assert get_next_month(date(2023, 1, 1)) == date(2023, 2, 1)
+    assert get_next_month(date(2023, 12, 1)) == date(2024, 1, 1)
+
+
+def test_archive_content_views(views, archive_storage):
+    two_months_ago, last_month, this_month = views
+
+    # views that have not been rolled up are not archived
+    assert archive_content_views(this_month) == []
+
+    rollup_interactions(until=timezone.now())
+    archives = archive_content_views(this_month)
+
+    assert [(archive.month, archive.count) for archive in archives] == [
+        (two_months_ago.date(), 2),
+        (last_month.date(), 1),
+    ]
+    assert list(ContentView.objects.values_list("created", flat=True)) == [this_month]
+    assert get_archived_until() == this_month.date()
+    with archive_storage.open(archives[0].path) as archive:
+        lines = [json.loads(line) for line in gzip.decompress(archive.read()).splitlines()]
+    assert sorted(parse_datetime(line["created"]) for line in lines) == [
+        two_months_ago,
+        two_months_ago + timedelta(days=2),
+    ]
+    assert {"id", "client_id", "content_item_id", "program_id"} <= set(lines[0])
+    assert ArchivedContentView.objects.count() == 3
+
+    # archived views are still counted
+    assert set(reconcile_counts().values()) == {0}
+    assert ContentItem.objects.get().view_count == 4
+
+
+def test_view_after_archival(views, archive_storage, user_with_all_permissions, client):
+    two_months_ago, last_month, this_month = views
+    rollup_interactions(until=timezone.now())
+    archive_content_views(this_month)
+    client.force_login(user_with_all_permissions)
+    archived = ArchivedContentView.objects.first()
+    data = {"client": str(archived.client_id), "content_item": archived.content_item_id}
+
+    response = client.post(
+        reverse("api:contentview-list"),
+        data=data,
+        content_type="application/json",
+        accept="application/json",
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {
+        "non_field_errors": ["The fields client, content_item must make a unique set."]
+    }
+
+    new_client = baker.make("clients.Client")
+    response = client.post(
+        reverse("api:contentview-bulk"),
+        data=[data, {**data, "client": str(new_client.id)}],
+        content_type="application/json",
+        accept="application/json",
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert [outcome["status"] for outcome in response.json()] == ["duplicate", "created"]
+    assert list(ContentItemCounterDelta.objects.values_list("counter", "delta")) == [
+        ("view_count", 1)
+    ]
+
+    response = client.get(
+        reverse("api:content-interactions"),
+        {"client_id": archived.client_id, "ids": archived.content_item_id},
+    )
+
+    assert response.json()[str(archived.content_item_id)]["viewed"] is True
+
+    # the archived view was not counted again
+    assert set(reconcile_counts().values()) == {0}
+    assert ContentItem.objects.get().get_count("view_count") == 5
+
+
+def test_archive_content_views_waits_for_rollups(views, archive_storage):
+    two_months_ago, last_month, this_month = views
+    rollup_interactions(until=last_month + timedelta(days=1))
+
+    archives = archive_content_views(this_month)
+
+    assert [archive.month for archive in archives] == [two_months_ago.date()]
+    assert ContentView.objects.count() == 2
+
+
+def test_archive_content_views_command(views, archive_storage):
+    rollup_interactions(until=timezone.now())
+    out = StringIO()
+
+    call_command("archive_content_views", "--keep-months=2", stdout=out)
+
+    assert "2 views archived to content_views/" in out.getvalue()
+    assert ContentViewArchive.objects.count() == 1
+    assert ContentView.objects.count() == 2
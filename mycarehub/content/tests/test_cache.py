@@ -0,0 +1,226 @@
+import time
+import uuid
+
+import pytest
+from django.http import QueryDict
+from django.urls import reverse
+from django.utils.http import http_date
+from model_bakery import baker
+from rest_framework import status
+from rest_framework.request import Request
+
+from mycarehub.clients.models import Client
+from mycarehub.content.cache import (
+    ALL_PROGRAMS,
+    get_cache_generation,
+    get_listing_cache_key,
+    get_listing_scope,
+    invalidate_listing_cache,
+    normalize_query_parameters,
+)
+from mycarehub.content.counters import record_counter_delta
+from mycarehub.content.models import ContentItem, ContentItemCounterDelta
+
+pytestmark = pytest.mark.django_db
+
+
+def test_normalize_query_parameters():
+    first = QueryDict("type=content.ContentItem&fields=*&category=1&category=2&_=12345")
+    second = QueryDict("category=2&fields=*&category=1&type=content.ContentItem")
+
+    assert normalize_query_parameters(first) == normalize_query_parameters(second)
+    assert "_=" not in normalize_query_parameters(first)
+
+
+def test_get_listing_scope(rf, program):
+    client_one = baker.make(Client, program=program)
+
+    assert get_listing_scope(Request(rf.get("/"))) == ALL_PROGRAMS
+    assert get_listing_scope(Request(rf.get("/", {"client_id": "not-a-uuid"}))) == ALL_PROGRAMS
+    assert get_listing_scope(Request(rf.get("/", {"client_id": uuid.uuid4()}))) == ALL_PROGRAMS
+    assert get_listing_scope(Request(rf.get("/", {"client_id": client_one.id}))) == str(program.id)
+
+
+def test_invalidate_listing_cache(program):
+    program_generation = get_cache_generation(str(program.id))
+    shared_generation = get_cache_generation(ALL_PROGRAMS)
+
+    invalidate_listing_cache(program.id)
+    assert get_cache_generation(str(program.id)) == program_generation + 1
+    assert get_cache_generation(ALL_PROGRAMS) == shared_generation + 1
+
+    invalidate_listing_cache()
+    assert get_cache_generation(str(program.id)) == program_generation + 1
+    assert get_cache_generation(ALL_PROGRAMS) == shared_generation + 2
+
+
+def test_invalidate_listing_cache_evicted_generation(program):
+    invalidate_listing_cache(program.id)
+
+    assert get_cache_generation(str(program.id)) == 2
+
+
+def test_get_listing_cache_key(rf, user, program):
+    client_one = baker.make(Client, program=program)
+    request = rf.get("/", {"client_id": client_one.id, "fields": "*"})
+    request.user = user
+    key = get_listing_cache_key(Request(request))
+
+    assert key.startswith(f"contentapi:listing:{program.id}:")
+
+    invalidate_listing_cache(program.id)
+    assert get_listing_cache_key(Request(request)) != key
+
+
+def test_listing_view_served_from_cache(
+    content_item_with_tag_and_category, request_with_user, client, program
+):
+    client_one = baker.make(Client, program=program)
+    client.force_login(request_with_user.user)
+    url = (
+        reverse("wagtailapi:pages:listing")
+        + f"?type=content.ContentItem&fields=title&client_id={client_one.id}"
+    )
+
+    response = client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["items"][0]["title"] == "An article"
+
+    ContentItem.objects.filter(id=content_item_with_tag_and_category.id).update(title="Edited")
+    response = client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["items"][0]["title"] == "An article"
+
+    invalidate_listing_cache(program.id)
+    response = client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["items"][0]["title"] == "Edited"
+
+
+def test_detail_view_conditional_get(
+    content_item_with_tag_and_category, request_with_user, client
+):
+    client.force_login(request_with_user.user)
+    url = reverse("wagtailapi:pages:detail", kwargs={"pk": content_item_with_tag_and_category.id})
+
+    response = client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    etag = response.headers["ETag"]
+    # the interaction counts have no modification time
+    assert "Last-Modified" not in response.headers
+
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+
+    response = client.get(url + "?fields=title", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+
+    # pending interaction counts change the ETag
+    record_counter_delta(content_item_with_tag_and_category.id, "like_count")
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["like_count"] == 1
+    etag = response.headers["ETag"]
+
+    page = ContentItem.objects.get(id=content_item_with_tag_and_category.id)
+    page.title = "Edited"
+    page.save_revision().publish()
+
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["title"] == "Edited"
+    assert response.headers["ETag"] != etag
+
+
+def test_detail_view_conditional_get_without_counts(content_item_index, request_with_user, client):
+    client.force_login(request_with_user.user)
+    url = reverse("wagtailapi:pages:detail", kwargs={"pk": content_item_index.id})
+
+    response = client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    last_modified = response.headers["Last-Modified"]
+
+    response = client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+def test_listing_view_conditional_get(
+    content_item_with_tag_and_category, request_with_user, client
+):
+    client.force_login(request_with_user.user)
+    url = reverse("wagtailapi:pages:listing") + "?type=content.ContentItem"
+
+    response = client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    etag = response.headers["ETag"]
+    # listings change without any of their pages being published e.g. on unpublish
+    assert "Last-Modified" not in response.headers
+
+    # answered from the cached listing
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    response = client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] == etag
+
+    # answered from the queryset fingerprint
+    invalidate_listing_cache()
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    response = client.get(url, HTTP_IF_MODIFIED_SINCE=http_date(time.time()))
+    assert response.status_code == status.HTTP_200_OK
+
+    page = ContentItem.objects.get(id=content_item_with_tag_and_category.id)
+    page.title = "Edited"
+    page.save_revision().publish()
+    invalidate_listing_cache()
+
+    response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["items"][0]["title"] == "Edited"
+    assert response.headers["ETag"] != etag
+
+
+def test_listing_view_conditional_get_with_counts(
+    content_item_with_tag_and_category, make_content_item, request_with_user, client
+):
+    other_item = make_content_item("other-article")
+    ContentItem.objects.update(like_count=1)
+    client.force_login(request_with_user.user)
+    url = reverse("wagtailapi:pages:listing") + "?type=content.ContentItem&fields=like_count"
+
+    def get_etag():
+        invalidate_listing_cache()
+        response = client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        return response.headers["ETag"]
+
+    etag = get_etag()
+    record_counter_delta(other_item.id, "like_count")
+    assert get_etag() != etag
+
+    # a flush applies the pending deltas
+    etag = get_etag()
+    ContentItemCounterDelta.objects.all().delete()
+    ContentItem.objects.filter(id=other_item.id).update(like_count=2)
+    assert get_etag() != etag
+
+    # changes to the counts of two items do not cancel out
+    etag = get_etag()
+    ContentItem.objects.filter(id=content_item_with_tag_and_category.id).update(like_count=2)
+    ContentItem.objects.filter(id=other_item.id).update(like_count=1)
+    assert get_etag() != etag
+
+
+def test_search_listing_has_no_validators(
+    content_item_with_tag_and_category, request_with_user, client
+):
+    client.force_login(request_with_user.user)
+    url = reverse("wagtailapi:pages:listing") + "?type=content.ContentItem&search=article"
+
+    response = client.get(url)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "ETag" not in response.headers
+    assert "Last-Modified" not in response.headers
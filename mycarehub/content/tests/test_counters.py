@@ -0,0 +1,198 @@
+from io import StringIO
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from model_bakery import baker
+from rest_framework import status
+
+from mycarehub.clients.models import Client
+from mycarehub.content.counters import (
+    FLUSH_SCHEDULED_KEY,
+    RECONCILE_SCHEDULED_KEY,
+    annotate_pending_counts,
+    flush_all_counter_deltas,
+    flush_counter_deltas,
+    flush_counter_deltas_in_background,
+    reconcile_counts,
+    reconcile_counts_in_background,
+    record_counter_delta,
+)
+from mycarehub.content.models import (
+    ContentItem,
+    ContentItemCounterDelta,
+    ContentLike,
+    ContentView,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+def test_record_counter_delta(content_item_with_tag_and_category):
+    item_id = content_item_with_tag_and_category.id
+
+    record_counter_delta(item_id, "view_count")
+    record_counter_delta(item_id, "like_count", -1)
+
+    assert list(
+        ContentItemCounterDelta.objects.order_by("id").values_list("counter", "delta")
+    ) == [("view_count", 1), ("like_count", -1)]
+    assert ContentItem.objects.get(id=item_id).view_count == 0
+
+
+def test_flush_counter_deltas(content_item_with_tag_and_category):
+    item_id = content_item_with_tag_and_category.id
+    for counter in ["view_count", "view_count", "share_count", "like_count", "bookmark_count"]:
+        record_counter_delta(item_id, counter)
+    record_counter_delta(item_id, "bookmark_count", -1)
+
+    content_item = ContentItem.objects.get(id=item_id)
+    assert content_item.view_count == 0
+    assert content_item.get_count("view_count") == 2
+    content_item = annotate_pending_counts(ContentItem.objects.all()).get(id=item_id)
+    with CaptureQueriesContext(connection) as queries:
+        assert content_item.get_count("view_count") == 2
+        assert content_item.get_count("bookmark_count") == 0
+    assert len(queries) == 0
+
+    assert flush_counter_deltas(batch_size=5) == 5
+    assert flush_counter_deltas() == 1
+    assert flush_counter_deltas() == 0
+
+    content_item = ContentItem.objects.get(id=item_id)
+    assert not ContentItemCounterDelta.objects.exists()
+    assert content_item.view_count == 2
+    assert content_item.share_count == 1
+    assert content_item.like_count == 1
+    assert content_item.bookmark_count == 0
+    assert content_item.get_count("view_count") == 2
+
+    # deltas that cancel out leave the content item alone
+    record_counter_delta(item_id, "like_count")
+    record_counter_delta(item_id, "like_count", -1)
+    assert flush_counter_deltas() == 2
+    assert ContentItem.objects.get(id=item_id).like_count == 1
+
+
+def test_flush_all_counter_deltas(content_item_with_tag_and_category):
+    item_id = content_item_with_tag_and_category.id
+    for _ in range(5):
+        record_counter_delta(item_id, "view_count")
+
+    # batches are applied until the deltas run out, however many there are
+    assert flush_all_counter_deltas(batch_size=2) == 5
+    assert flush_all_counter_deltas(batch_size=2) == 0
+    assert not ContentItemCounterDelta.objects.exists()
+    assert ContentItem.objects.get(id=item_id).view_count == 5
+
+
+def test_counter_flush_is_scheduled_once_per_interval(
+    content_item_with_tag_and_category, django_capture_on_commit_callbacks
+):
+    item_id = content_item_with_tag_and_category.id
+    cache.delete(FLUSH_SCHEDULED_KEY)
+    cache.add(RECONCILE_SCHEDULED_KEY, True)
+
+    # the flush runs in the background, off the request
+    with django_capture_on_commit_callbacks() as callbacks:
+        record_counter_delta(item_id, "view_count")
+        record_counter_delta(item_id, "view_count")
+
+    assert callbacks == [flush_counter_deltas_in_background]
+
+    with django_capture_on_commit_callbacks() as callbacks:
+        record_counter_delta(item_id, "view_count")
+
+    assert callbacks == []
+    assert ContentItemCounterDelta.objects.count() == 3
+    cache.delete_many([FLUSH_SCHEDULED_KEY, RECONCILE_SCHEDULED_KEY])
+
+
+def test_flush_does_not_take_counts_below_zero(content_item_with_tag_and_category):
+    item_id = content_item_with_tag_and_category.id
+
+    record_counter_delta(item_id, "bookmark_count", -1)
+    flush_counter_deltas()
+
+    assert ContentItem.objects.get(id=item_id).bookmark_count == 0
+
+
+def test_reconcile_counts(content_item_with_tag_and_category):
+    content_item = content_item_with_tag_and_category
+    baker.make(ContentLike, content_item=content_item, _quantity=2)
+    baker.make(ContentView, content_item=content_item)
+    ContentItem.objects.filter(id=content_item.id).update(like_count=7, share_count=3)
+    # the pending view is already counted in the interaction tables
+    record_counter_delta(content_item.id, "view_count")
+
+    assert reconcile_counts(batch_size=1) == {
+        "like_count": -5,
+        "bookmark_count": 0,
+        "share_count": -3,
+        "view_count": 0,
+    }
+    content_item = ContentItem.objects.get(id=content_item.id)
+    assert content_item.like_count == 2
+    assert content_item.share_count == 0
+    assert content_item.view_count == 0
+    assert content_item.get_count("view_count") == 1
+
+    flush_counter_deltas()
+    assert set(reconcile_counts().values()) == {0}
+    assert ContentItem.objects.get(id=content_item.id).view_count == 1
+
+
+def test_reconcile_content_counts_command(content_item_with_tag_and_category):
+    ContentItem.objects.update(bookmark_count=2)
+    out = StringIO()
+
+    call_command("reconcile_content_counts", "--batch-size=10", stdout=out)
+
+    assert "bookmark_count: -2" in out.getvalue()
+    assert "like_count: +0" in out.getvalue()
+    assert ContentItem.objects.get().bookmark_count == 0
+
+
+def test_flush_counter_deltas_in_background():
+    thread = flush_counter_deltas_in_background()
+    thread.join()
+
+    assert not thread.is_alive()
+
+
+def test_reconcile_counts_in_background():
+    thread = reconcile_counts_in_background()
+    thread.join()
+
+    assert not thread.is_alive()
+
+
+def test_api_counts_include_pending_deltas(
+    content_item_with_tag_and_category, user_with_all_permissions, client
+):
+    client.force_login(user_with_all_permissions)
+    item_id = content_item_with_tag_and_category.id
+    ContentItem.objects.filter(id=item_id).update(like_count=3)
+
+    response = client.post(
+        reverse("api:contentlike-list"),
+        data={"client": baker.make(Client).id, "content_item": item_id},
+        content_type="application/json",
+        accept="application/json",
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+
+    response = client.get(
+        reverse("wagtailapi:pages:listing"),
+        {"type": "content.ContentItem", "fields": "like_count,view_count"},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["items"][0]["like_count"] == 4
+    assert response.json()["items"][0]["view_count"] == 0
+
+    response = client.get(reverse("wagtailapi:pages:detail", kwargs={"pk": item_id}))
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["like_count"] == 4
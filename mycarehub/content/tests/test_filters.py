@@ -1,13 +1,22 @@
+import json
 import uuid
 
 import pytest
 from django.urls import reverse
 from model_bakery import baker
 from rest_framework import status
+from rest_framework.request import Request
 
 from mycarehub.clients.models import Client
-from mycarehub.common.models import ContentSequence, Program
-from mycarehub.content.models import ContentItemCategory
+from mycarehub.common.models import ContentSequence, Facility, Program
+from mycarehub.content.filters import (
+    CategoryFilter,
+    ClientFilter,
+    ContentFilter,
+    FacilityFilter,
+    TagFilter,
+)
+from mycarehub.content.models import ContentItem, ContentItemCategory
 
 pytestmark = pytest.mark.django_db
 
@@ -338,3 +347,57 @@ def test_content_filter_exclude_content(
     assert response.status_code == status.HTTP_200_OK
     response_data = response.json()
     assert response_data["meta"]["total_count"] == 0
+
+
+def _plan_nodes(plan):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+def test_combined_filters_use_exists_without_distinct(
+    content_item_with_tag_and_category, make_content_item, rf, program, facility
+):
+    """Combining the M2M filters must not multiply rows or need a DISTINCT."""
+    categories = baker.make(ContentItemCategory, _quantity=3)
+    other_facility = baker.make(Facility)
+    for index in range(10):
+        content_item = make_content_item(f"seeded-{index}", publish=False, title=f"Seeded {index}")
+        content_item.categories.add(*categories[: index % 3 + 1])
+        content_item.tags.add("seeded", f"seeded-{index % 2}")
+        content_item.facilities.add(facility, other_facility)
+        content_item.save_revision().publish()
+
+    client_one = baker.make(Client, program=program)
+    request = Request(
+        rf.get(
+            "/",
+            {
+                "tag": "seeded",
+                "category": ",".join(str(category.id) for category in categories),
+                "category_name": ",".join(category.name for category in categories),
+                "exclude_category": "consumer-faqs",
+                "facility_id": facility.id,
+                "client_id": client_one.id,
+            },
+        )
+    )
+    queryset = ContentItem.objects.all()
+    for backend in [TagFilter, ClientFilter, FacilityFilter, CategoryFilter, ContentFilter]:
+        queryset = backend().filter_queryset(request, queryset, None)
+
+    ids = list(queryset.values_list("id", flat=True))
+    assert len(ids) == len(set(ids)) == 10
+
+    sql = str(queryset.query).upper()
+    assert "DISTINCT" not in sql
+    # the client filter compares the program, it does not need a subquery
+    assert sql.count("EXISTS") == 5
+    assert f'"PROGRAM_ID" = {program.id}'.upper() in sql
+
+    # the subqueries are planned as semi/anti joins and nothing de-duplicates rows
+    plan = json.loads(queryset.explain(format="json"))[0]["Plan"]
+    node_types = {node["Node Type"] for node in _plan_nodes(plan)}
+    join_types = {node.get("Join Type") for node in _plan_nodes(plan)}
+    assert not node_types & {"Unique", "Aggregate"}
+    assert {"Semi", "Anti"} <= join_types
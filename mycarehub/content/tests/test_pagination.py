@@ -0,0 +1,138 @@
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from mycarehub.content.models import ContentItem
+from mycarehub.content.pagination import decode_cursor, encode_cursor
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def content_items(content_item_with_tag_and_category, make_content_item):
+    for index in range(4):
+        make_content_item(f"paginated-article-{index}", title=f"Article {index}")
+
+    return ContentItem.objects.live().order_by("first_published_at", "id")
+
+
+def test_cursor_round_trip(content_item_with_tag_and_category):
+    content_item = ContentItem.objects.get(id=content_item_with_tag_and_category.id)
+    cursor = encode_cursor(content_item)
+
+    assert decode_cursor(cursor) == (content_item.first_published_at, content_item.pk)
+
+
+def test_cursor_pagination(content_items, request_with_user, client):
+    client.force_login(request_with_user.user)
+    url = reverse("wagtailapi:pages:listing")
+    params = {"type": "content.ContentItem", "pagination": "cursor", "limit": 2}
+
+    ids = []
+    response = client.get(url, params)
+    while True:
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert "total_count" not in data["meta"]
+        ids.extend(item["id"] for item in data["items"])
+        if data["meta"]["next"] is None:
+            break
+        response = client.get(url, {**params, "cursor": data["meta"]["next"]})
+
+    assert ids == [content_item.id for content_item in content_items]
+
+
+def test_cursor_pagination_of_unpublished_dates(content_items, request_with_user, client):
+    """Pages without a first publication date (e.g. imported ones) are listed first."""
+    unpublished_dates = [content_items[1].id, content_items[3].id]
+    ContentItem.objects.filter(id__in=unpublished_dates).update(first_published_at=None)
+    content_item = ContentItem.objects.get(id=unpublished_dates[0])
+    assert decode_cursor(encode_cursor(content_item)) == (None, content_item.pk)
+
+    client.force_login(request_with_user.user)
+    url = reverse("wagtailapi:pages:listing")
+    params = {"type": "content.ContentItem", "pagination": "cursor", "limit": 1}
+
+    ids = []
+    response = client.get(url, params)
+    while True:
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        ids.extend(item["id"] for item in data["items"])
+        if data["meta"]["next"] is None:
+            break
+        response = client.get(url, {**params, "cursor": data["meta"]["next"]})
+
+    assert ids == unpublished_dates + [
+        content_item.id
+        for content_item in content_items
+        if content_item.id not in unpublished_dates
+    ]
+
+
+def test_cursor_pagination_is_stable_when_content_is_published(
+    content_items, make_content_item, request_with_user, client
+):
+    client.force_login(request_with_user.user)
+    url = reverse("wagtailapi:pages:listing")
+    params = {"type": "content.ContentItem", "pagination": "cursor", "limit": 2}
+
+    response = client.get(url, params)
+    assert response.status_code == status.HTTP_200_OK
+    first_page = [item["id"] for item in response.json()["items"]]
+    cursor = response.json()["meta"]["next"]
+
+    content_item = make_content_item("a-new-article", title="A new article")
+
+    response = client.get(url, {**params, "cursor": cursor, "limit": 10})
+    assert response.status_code == status.HTTP_200_OK
+    remaining = [item["id"] for item in response.json()["items"]]
+
+    assert not set(first_page) & set(remaining)
+    assert remaining[-1] == content_item.id
+    assert first_page + remaining[:-1] == [item.id for item in content_items[:5]]
+
+
+def test_offset_pagination_remains_the_default(content_items, request_with_user, client):
+    client.force_login(request_with_user.user)
+    url = reverse("wagtailapi:pages:listing")
+
+    response = client.get(url, {"type": "content.ContentItem", "offset": 1, "limit": 2})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["meta"]["total_count"] == 5
+    assert len(response.json()["items"]) == 2
+
+
+def test_cursor_pagination_empty_page(content_items, request_with_user, client):
+    client.force_login(request_with_user.user)
+    url = reverse("wagtailapi:pages:listing")
+
+    response = client.get(url, {"type": "content.ContentItem", "pagination": "cursor", "limit": 0})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {"meta": {"next": None}, "items": []}
+
+
+@pytest.mark.parametrize(
+    "params,message",
+    [
+        ({"cursor": "not-a-cursor"}, "cursor is not valid"),
+        ({"cursor": "WyJ4IiwgMV0="}, "cursor is not valid"),
+        ({"cursor": "W251bGwsICIxIl0="}, "cursor is not valid"),
+        ({"offset": 2}, "offset cannot be used with cursor pagination"),
+        ({"order": "title"}, "order cannot be used with cursor pagination"),
+        ({"limit": "-1"}, "limit must be a positive integer"),
+        ({"limit": 1000}, "limit cannot be higher than 20"),
+    ],
+)
+def test_cursor_pagination_bad_requests(
+    params, message, content_item_with_tag_and_category, request_with_user, client
+):
+    client.force_login(request_with_user.user)
+    url = reverse("wagtailapi:pages:listing")
+
+    response = client.get(url, {"type": "content.ContentItem", "pagination": "cursor", **params})
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {"message": message}
@@ -0,0 +1,103 @@
+import pytest
+from django.contrib.auth.models import Group, Permission
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from model_bakery import baker
+from model_bakery.recipe import seq
+from wagtail.models import GroupCollectionPermission, GroupPagePermission
+
+from mycarehub.common.models import Organisation, Program
+from mycarehub.content import provisioning
+from mycarehub.content.models import ContentItemIndexPage
+from mycarehub.content.provisioning import (
+    EDITOR_COLLECTION_PERMISSIONS,
+    EDITOR_PAGE_PERMISSIONS,
+    EDITOR_PERMISSIONS,
+    HOMEPAGE_TITLE,
+    get_editor_permission_ids,
+    provision_program_editors,
+    provision_programs,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+def assert_editors_provisioned(index_page):
+    group = Group.objects.get(name=f"{index_page.program.name} Editor")
+    assert sorted(
+        f"{app_label}.{codename}"
+        for app_label, codename in group.permissions.values_list(
+            "content_type__app_label", "codename"
+        )
+    ) == sorted(EDITOR_PERMISSIONS)
+    assert sorted(
+        GroupPagePermission.objects.filter(group=group, page=index_page).values_list(
+            "permission__codename", "permission_type"
+        )
+    ) == [("add_page", "add"), ("change_page", "change"), ("publish_page", "publish")]
+    assert GroupCollectionPermission.objects.filter(group=group).count() == len(
+        EDITOR_COLLECTION_PERMISSIONS
+    )
+
+
+def test_get_editor_permission_ids():
+    with CaptureQueriesContext(connection) as queries:
+        permission_ids = get_editor_permission_ids()
+    assert len(queries) == 1
+    assert set(permission_ids) == set(
+        EDITOR_PERMISSIONS + EDITOR_PAGE_PERMISSIONS + EDITOR_COLLECTION_PERMISSIONS
+    )
+    assert Permission.objects.get(pk=permission_ids["wagtailcore.add_page"]).codename == "add_page"
+
+    with CaptureQueriesContext(connection) as queries:
+        assert get_editor_permission_ids() == permission_ids
+    assert len(queries) == 0
+
+
+def test_get_editor_permission_ids_missing_permissions(monkeypatch):
+    monkeypatch.setattr(provisioning, "EDITOR_PERMISSIONS", EDITOR_PERMISSIONS + ["content.fly"])
+
+    with pytest.raises(Permission.DoesNotExist):
+        get_editor_permission_ids()
+
+
+def test_provision_programs():
+    programs = baker.make(Program, name=seq("Program "), _quantity=3)
+
+    provision_programs(programs)
+
+    for program in programs:
+        index_page = ContentItemIndexPage.objects.get(program=program)
+        assert index_page.get_parent().title == HOMEPAGE_TITLE
+        assert index_page.organisation_id == program.organisation_id
+        assert_editors_provisioned(index_page)
+
+    # provisioned programs only have their index pages moved to a changed organisation
+    programs[0].organisation = baker.make(Organisation)
+    with CaptureQueriesContext(connection) as queries:
+        provision_programs(programs[1:])
+    assert len(queries) == 1
+    provision_programs(programs)
+    assert ContentItemIndexPage.objects.filter(program__in=programs).count() == 3
+    assert (
+        ContentItemIndexPage.objects.get(program=programs[0]).organisation
+        == programs[0].organisation
+    )
+
+    # later programs are added to the same home page
+    program = baker.make(Program, name="Diabetes")
+    provision_programs([program])
+    assert ContentItemIndexPage.objects.get(program=program).get_parent().title == HOMEPAGE_TITLE
+
+
+def test_provision_program_editors():
+    program = baker.make(Program, name="Diabetes")
+    provision_programs([program])
+    index_page = ContentItemIndexPage.objects.get(program=program)
+
+    # provisioning again does not duplicate the editors or their permissions
+    provision_program_editors([index_page])
+    provision_program_editors([])
+
+    assert Group.objects.filter(name=f"{program.name} Editor").count() == 1
+    assert_editors_provisioned(index_page)
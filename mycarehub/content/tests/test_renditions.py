@@ -0,0 +1,124 @@
+from datetime import timedelta
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.utils import timezone
+from model_bakery import baker
+from wagtail.signals import page_published
+
+from mycarehub.content import renditions
+from mycarehub.content.models import (
+    HERO_IMAGE_RENDITION,
+    ContentItem,
+    CustomImage,
+    CustomRendition,
+)
+from mycarehub.content.renditions import (
+    generate_rendition,
+    get_image_renditions,
+    get_page_renditions,
+    get_rendition_executor,
+    pregenerate_renditions,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+def test_get_page_renditions(content_item_with_tag_and_category):
+    hero_image_id = content_item_with_tag_and_category.hero_image_id
+
+    assert get_page_renditions(content_item_with_tag_and_category) == [
+        (hero_image_id, HERO_IMAGE_RENDITION),
+        (hero_image_id, "min-500x200"),
+    ]
+
+    content_item_with_tag_and_category.hero_image = None
+    assert get_page_renditions(content_item_with_tag_and_category) == []
+
+
+def test_get_image_renditions(content_item_with_tag_and_category):
+    hero_image = content_item_with_tag_and_category.hero_image
+
+    assert get_image_renditions(hero_image) == [
+        (hero_image.id, HERO_IMAGE_RENDITION),
+        (hero_image.id, "min-500x200"),
+    ]
+    assert get_image_renditions(baker.make(CustomImage, _create_files=True)) == []
+
+
+def test_generate_rendition(content_item_with_tag_and_category):
+    hero_image = content_item_with_tag_and_category.hero_image
+
+    generate_rendition(hero_image.id, HERO_IMAGE_RENDITION)
+    generate_rendition(hero_image.id, HERO_IMAGE_RENDITION)
+
+    assert (
+        CustomRendition.objects.filter(image=hero_image, filter_spec=HERO_IMAGE_RENDITION).count()
+        == 1
+    )
+
+
+def test_generate_rendition_in_progress_elsewhere(content_item_with_tag_and_category):
+    hero_image = content_item_with_tag_and_category.hero_image
+    cache.add(f"renditions:lock:{hero_image.id}:{HERO_IMAGE_RENDITION}", True)
+
+    generate_rendition(hero_image.id, HERO_IMAGE_RENDITION)
+
+    assert not CustomRendition.objects.filter(image=hero_image).exists()
+
+
+def test_generate_rendition_failures(content_item_with_tag_and_category):
+    hero_image = content_item_with_tag_and_category.hero_image
+
+    generate_rendition(0, HERO_IMAGE_RENDITION)
+    generate_rendition(hero_image.id, "not-a-filter")
+
+    assert not CustomRendition.objects.filter(image=hero_image).exists()
+    assert cache.get(f"renditions:lock:{hero_image.id}:not-a-filter") is None
+
+
+@pytest.fixture
+def published_renditions_receiver():
+    # the content signals are not connected in tests
+    def pregenerate_published_renditions(sender, instance, **kwargs):
+        pregenerate_renditions(get_page_renditions(instance))
+
+    page_published.connect(pregenerate_published_renditions, sender=ContentItem)
+    yield
+    page_published.disconnect(pregenerate_published_renditions, sender=ContentItem)
+
+
+def test_pregenerate_renditions_after_publish(
+    content_item_with_tag_and_category,
+    published_renditions_receiver,
+    settings,
+    django_capture_on_commit_callbacks,
+):
+    settings.CONTENT_RENDITION_WORKERS = 0
+    content_item = content_item_with_tag_and_category
+
+    # scheduled publishing publishes the revisions that are due, outside the admin
+    content_item.save_revision(approved_go_live_at=timezone.now() - timedelta(minutes=1))
+    with django_capture_on_commit_callbacks(execute=True):
+        call_command("publish_scheduled_pages")
+
+    assert set(
+        CustomRendition.objects.filter(image=content_item.hero_image).values_list(
+            "filter_spec", flat=True
+        )
+    ) == {HERO_IMAGE_RENDITION, "min-500x200"}
+
+
+def test_pregenerate_renditions_in_background(settings, django_capture_on_commit_callbacks):
+    settings.CONTENT_RENDITION_WORKERS = 1
+
+    # already queued renditions are not queued again
+    renditions._pending.add((0, "min-500x200"))
+    with django_capture_on_commit_callbacks(execute=True):
+        pregenerate_renditions([(0, HERO_IMAGE_RENDITION), (0, "min-500x200")])
+
+    # the single worker has finished the queued renditions once this one runs
+    get_rendition_executor().submit(lambda: None).result()
+    assert renditions._pending == {(0, "min-500x200")}
+    renditions._pending.clear()
@@ -0,0 +1,168 @@
+import time
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import parse_http_date
+from model_bakery import baker
+from rest_framework import status
+
+from mycarehub.clients.context import get_client_context
+from mycarehub.clients.models import Client
+from mycarehub.common.models import ContentSequence
+from mycarehub.content.cache import invalidate_listing_cache
+from mycarehub.content.models import ContentItem
+from mycarehub.content.schedule import get_unlock_schedule, get_unlocked_content
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def gradual_program(content_item_with_tag_and_category, make_content_item, program):
+    """A GRADUAL program that started ten days ago and published content every other day."""
+    now = timezone.now()
+    program.content_sequence = ContentSequence.GRADUAL
+    program.start_date = now - timedelta(days=10)
+    program.save()
+
+    ContentItem.objects.update(date=timezone.localdate(program.start_date))
+    for days in [6, 2, 4]:
+        make_content_item(
+            f"day-{days}",
+            title=f"Day {days}",
+            date=timezone.localdate(program.start_date + timedelta(days=days)),
+        )
+
+    return program
+
+
+def test_get_unlock_schedule(gradual_program):
+    schedule = get_unlock_schedule(gradual_program.id)
+
+    assert schedule == list(ContentItem.objects.order_by("date", "id").values_list("date", "id"))
+    assert [date for date, _ in schedule] == sorted(date for date, _ in schedule)
+
+    with CaptureQueriesContext(connection) as queries:
+        assert get_unlock_schedule(gradual_program.id) == schedule
+    assert len(queries) == 0
+
+    invalidate_listing_cache(gradual_program.id)
+    with CaptureQueriesContext(connection) as queries:
+        assert get_unlock_schedule(gradual_program.id) == schedule
+    assert len(queries) == 1
+
+
+def test_get_unlocked_content(gradual_program):
+    now = timezone.now()
+    schedule = get_unlock_schedule(gradual_program.id)
+    client_one = get_client_context(
+        baker.make(Client, program=gradual_program, enrollment_date=now - timedelta(days=3)).id
+    )
+
+    page_ids, next_unlock_at = get_unlocked_content(client_one, now)
+
+    assert page_ids == [page_id for _, page_id in schedule[:2]]
+    next_date = timezone.localdate(gradual_program.start_date + timedelta(days=4))
+    assert next_unlock_at > now
+    assert (
+        timezone.localdate(
+            gradual_program.start_date + (next_unlock_at - client_one.enrollment_date)
+        )
+        == next_date
+    )
+    assert get_unlocked_content(client_one, next_unlock_at - timedelta(seconds=1))[0] == page_ids
+    assert get_unlocked_content(client_one, next_unlock_at)[0] == [
+        page_id for _, page_id in schedule[:3]
+    ]
+
+    client_two = get_client_context(
+        baker.make(Client, program=gradual_program, enrollment_date=now - timedelta(days=9)).id
+    )
+    page_ids, next_unlock_at = get_unlocked_content(client_two, now)
+    assert page_ids == [page_id for _, page_id in schedule]
+    assert next_unlock_at is None
+
+
+def test_gradual_listing_expires_at_next_unlock(
+    gradual_program, request_with_user, client, settings
+):
+    settings.CONTENT_API_CACHE_TIMEOUT = 30 * 24 * 60 * 60
+    now = timezone.now()
+    client_one = baker.make(
+        Client, program=gradual_program, enrollment_date=now - timedelta(days=3)
+    )
+    client.force_login(request_with_user.user)
+    url = reverse("wagtailapi:pages:listing")
+    params = {"type": "content.ContentItem", "client_id": client_one.id}
+
+    response = client.get(url, params)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["meta"]["total_count"] == 2
+    assert "private" in response.headers["Cache-Control"]
+    assert "max-age=" in response.headers["Cache-Control"]
+    expires = response.headers["Expires"]
+
+    # cached listings and conditional responses expire at the same time
+    response = client.get(url, params)
+    assert response.headers["Expires"] == expires
+    response = client.get(url, params, HTTP_IF_NONE_MATCH=response.headers["ETag"])
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["Expires"] == expires
+
+    invalidate_listing_cache(gradual_program.id)
+    response = client.get(url, params, HTTP_IF_NONE_MATCH=response.headers["ETag"])
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["Expires"] == expires
+
+
+def test_gradual_listing_expiry_is_capped(gradual_program, request_with_user, client, settings):
+    client_one = baker.make(
+        Client, program=gradual_program, enrollment_date=timezone.now() - timedelta(days=3)
+    )
+    client.force_login(request_with_user.user)
+    url = reverse("wagtailapi:pages:listing")
+    params = {"type": "content.ContentItem", "client_id": client_one.id}
+
+    # the next unlock is a day away, but publishing should reach clients before then
+    response = client.get(url, params)
+    assert response.status_code == status.HTTP_200_OK
+    max_age = int(response.headers["Cache-Control"].split("max-age=")[1].split(",")[0])
+    assert 0 < max_age <= settings.CONTENT_API_CACHE_TIMEOUT
+    expires = parse_http_date(response.headers["Expires"])
+    assert expires <= time.time() + settings.CONTENT_API_CACHE_TIMEOUT
+
+    response = client.get(url, params, HTTP_IF_NONE_MATCH=response.headers["ETag"])
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert parse_http_date(response.headers["Expires"]) == expires
+
+
+def test_fully_unlocked_listing_does_not_expire(gradual_program, request_with_user, client):
+    client_one = baker.make(
+        Client, program=gradual_program, enrollment_date=timezone.now() - timedelta(days=30)
+    )
+    client.force_login(request_with_user.user)
+
+    response = client.get(
+        reverse("wagtailapi:pages:listing"),
+        {"type": "content.ContentItem", "client_id": client_one.id},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["meta"]["total_count"] == 4
+    assert "Expires" not in response.headers
+
+
+def test_sync_reports_next_unlock(gradual_program, request_with_user, client):
+    client_one = baker.make(
+        Client, program=gradual_program, enrollment_date=timezone.now() - timedelta(days=3)
+    )
+    client.force_login(request_with_user.user)
+
+    response = client.get(reverse("wagtailapi:pages:sync"), {"client_id": client_one.id})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()["items"]) == 2
+    assert response.json()["meta"]["next_unlock_at"] is not None
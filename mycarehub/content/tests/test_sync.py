@@ -0,0 +1,236 @@
+import uuid
+from datetime import timedelta
+
+import pytest
+from django.contrib.contenttypes.models import ContentType
+from django.db.models.signals import pre_save
+from django.urls import reverse
+from django.utils import timezone
+from model_bakery import baker
+from rest_framework import status
+from wagtail.models import PageLogEntry
+
+from mycarehub.clients.models import Client
+from mycarehub.common.models import ContentSequence, Program
+from mycarehub.content.models import ContentItem, ContentItemIndexPage
+from mycarehub.content.sync import record_log_entry_program
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture(autouse=True)
+def log_entry_program_receiver():
+    # the content signals are not connected in tests
+    def record_content_item_program(sender, instance, **kwargs):
+        record_log_entry_program(instance)
+
+    pre_save.connect(record_content_item_program, sender=PageLogEntry)
+    yield
+    pre_save.disconnect(record_content_item_program, sender=PageLogEntry)
+
+
+def test_full_sync(content_item_with_tag_and_category, request_with_user, client, program):
+    client_one = baker.make(Client, program=program)
+    client.force_login(request_with_user.user)
+
+    response = client.get(
+        reverse("wagtailapi:pages:sync"), {"client_id": client_one.id, "fields": "title"}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["meta"]["watermark"]
+    assert data["items"] == [
+        {
+            "id": content_item_with_tag_and_category.id,
+            "meta": data["items"][0]["meta"],
+            "title": "An article",
+        }
+    ]
+    assert data["deleted"] == []
+
+
+def test_sync_since_watermark(
+    content_item_with_tag_and_category, make_content_item, request_with_user, client, program
+):
+    an_hour_ago = timezone.now() - timedelta(hours=1)
+    ContentItem.objects.update(last_published_at=an_hour_ago)
+    client_one = baker.make(Client, program=program)
+    client.force_login(request_with_user.user)
+    url = reverse("wagtailapi:pages:sync")
+    since = (an_hour_ago + timedelta(minutes=10)).isoformat()
+
+    response = client.get(url, {"client_id": client_one.id, "since": since})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["items"] == []
+    assert response.json()["deleted"] == []
+
+    new_item = make_content_item("new-article")
+    removed_item = make_content_item("removed-article")
+    removed_item.unpublish()
+    deleted_item = make_content_item("deleted-article")
+    deleted_item_id = deleted_item.id
+    deleted_item.delete()
+
+    response = client.get(url, {"client_id": client_one.id, "since": since})
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert [item["id"] for item in data["items"]] == [new_item.id]
+    assert data["deleted"] == sorted([removed_item.id, deleted_item_id])
+
+
+def test_sync_items_that_left_the_clients_scope(
+    make_content_item, homepage, request_with_user, client, program, settings
+):
+    # moving a page creates redirects from its URLs on the site
+    settings.ALLOWED_HOSTS = ["testserver", "localhost"]
+    an_hour_ago = timezone.now() - timedelta(hours=1)
+    client_one = baker.make(Client, program=program)
+    republished_item = make_content_item("republished-article")
+    moved_item = make_content_item("moved-article")
+    kept_item = make_content_item("kept-article")
+    ContentItem.objects.update(last_published_at=an_hour_ago)
+    since = (an_hour_ago + timedelta(minutes=10)).isoformat()
+
+    other_program = baker.make(Program, name="Other program")
+    other_index = ContentItemIndexPage(
+        title="Other Content", slug="other-articles", intro="content", program=other_program
+    )
+    homepage.add_child(instance=other_index)
+    republished_item.program = other_program
+    republished_item.save_revision().publish()
+    ContentItem.objects.filter(id=moved_item.id).update(program=other_program)
+    ContentItem.objects.get(id=moved_item.id).move(other_index, pos="last-child")
+    kept_item.save_revision().publish()
+    client.force_login(request_with_user.user)
+
+    response = client.get(
+        reverse("wagtailapi:pages:sync"), {"client_id": client_one.id, "since": since}
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert [item["id"] for item in data["items"]] == [kept_item.id]
+    assert data["deleted"] == sorted([republished_item.id, moved_item.id])
+
+
+def test_sync_does_not_list_other_programs_items(
+    make_content_item, content_item_index, request_with_user, client, program
+):
+    an_hour_ago = timezone.now() - timedelta(hours=1)
+    client_one = baker.make(Client, program=program)
+    other_program = baker.make(Program, name="Other program")
+    other_items = [
+        make_content_item(slug, program=other_program)
+        for slug in ["other-removed", "other-deleted", "other-republished"]
+    ]
+    ContentItem.objects.update(last_published_at=an_hour_ago)
+    since = (an_hour_ago + timedelta(minutes=10)).isoformat()
+
+    removed_item, deleted_item, republished_item = other_items
+    removed_item.unpublish()
+    deleted_item.delete()
+    republished_item.save_revision().publish()
+    client.force_login(request_with_user.user)
+    url = reverse("wagtailapi:pages:sync")
+
+    response = client.get(url, {"client_id": client_one.id, "since": since})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["items"] == []
+    assert response.json()["deleted"] == []
+
+    # unknown clients can not see any content
+    response = client.get(url, {"client_id": uuid.uuid4(), "since": since})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["items"] == []
+    assert response.json()["deleted"] == []
+
+    # syncs that are not limited to a client's program see every program's
+    response = client.get(url, {"since": since})
+    assert response.status_code == status.HTTP_200_OK
+    assert [item["id"] for item in response.json()["items"]] == [republished_item.id]
+    assert response.json()["deleted"] == sorted([removed_item.id, deleted_item.id])
+
+
+def test_record_log_entry_program(content_item_with_tag_and_category, program):
+    content_type = ContentType.objects.get_for_model(ContentItem)
+    log_entry = PageLogEntry(
+        page_id=content_item_with_tag_and_category.id, content_type=content_type, data={}
+    )
+    record_log_entry_program(log_entry)
+    assert log_entry.data == {"program_id": str(program.id)}
+
+    ContentItem.objects.update(program=None)
+    log_entry = PageLogEntry(
+        page_id=content_item_with_tag_and_category.id, content_type=content_type, data={}
+    )
+    record_log_entry_program(log_entry)
+    assert log_entry.data == {}
+
+
+def test_sync_route_does_not_shadow_slugs(make_content_item, request_with_user, client):
+    content_item = make_content_item("sync")
+    client.force_login(request_with_user.user)
+
+    response = client.get(reverse("wagtailapi:pages:detail", kwargs={"slug": "sync"}))
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["id"] == content_item.id
+
+
+def test_sync_unlocked_gradual_content(
+    content_item_with_tag_and_category, make_content_item, request_with_user, client, program
+):
+    now = timezone.now()
+    program.content_sequence = ContentSequence.GRADUAL
+    program.start_date = now - timedelta(days=10)
+    program.save()
+    client_one = baker.make(Client, program=program, enrollment_date=now - timedelta(days=5))
+    ContentItem.objects.update(date=now + timedelta(days=30))
+    content_item = make_content_item("gradual-article", date=(now - timedelta(days=7)).date())
+    ContentItem.objects.update(last_published_at=now - timedelta(days=30))
+    client.force_login(request_with_user.user)
+    url = reverse("wagtailapi:pages:sync")
+
+    # the item was unlocked two days into the client's enrollment
+    response = client.get(
+        url, {"client_id": client_one.id, "since": (now - timedelta(days=4)).isoformat()}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert [item["id"] for item in response.json()["items"]] == [content_item.id]
+
+    response = client.get(
+        url, {"client_id": client_one.id, "since": (now - timedelta(days=1)).isoformat()}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["items"] == []
+
+
+def test_sync_naive_watermark(content_item_with_tag_and_category, request_with_user, client):
+    client.force_login(request_with_user.user)
+    since = (timezone.localtime() + timedelta(hours=1)).replace(tzinfo=None).isoformat()
+
+    response = client.get(reverse("wagtailapi:pages:sync"), {"since": since})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["items"] == []
+
+
+@pytest.mark.parametrize(
+    "params,message",
+    [
+        ({"since": "yesterday"}, "since must be an ISO 8601 date and time"),
+        ({"since": "2023-02-30T00:00:00"}, "since must be an ISO 8601 date and time"),
+        (
+            {"fields": "title("},
+            "fields error: unexpected end of input (did you miss out a close bracket?)",
+        ),
+    ],
+)
+def test_sync_bad_requests(params, message, request_with_user, client):
+    client.force_login(request_with_user.user)
+
+    response = client.get(reverse("wagtailapi:pages:sync"), params)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {"message": message}
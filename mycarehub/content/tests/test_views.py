@@ -1,13 +1,24 @@
 import pytest
 from django.contrib import messages
 from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
 from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from model_bakery import baker
 from rest_framework import status
 
 from mycarehub.clients.models import Client
-from mycarehub.content.models import CustomDocument, CustomImage, CustomMedia
+from mycarehub.content.models import (
+    HERO_IMAGE_RENDITION,
+    ContentItem,
+    ContentItemCounterDelta,
+    ContentItemGalleryImage,
+    CustomDocument,
+    CustomImage,
+    CustomMedia,
+)
+from mycarehub.content.serializers import ContentInteractionBatchSerializer
 from mycarehub.content.wagtail_hooks import before_publish_page
 
 from ..models import (
@@ -283,6 +294,136 @@ def test_content_bookmark_create_view(
     assert response_data["id"] != ""
 
 
+def test_content_like_bulk_view(
+    content_item_with_tag_and_category, user_with_all_permissions, client
+):
+    client.force_login(user_with_all_permissions)
+    url = reverse("api:contentlike-bulk")
+    item_id = content_item_with_tag_and_category.id
+    client_one, client_two = baker.make(Client, _quantity=2)
+    baker.make(ContentLike, client=client_one, content_item=content_item_with_tag_and_category)
+
+    response = client.post(
+        url,
+        data=[
+            {"client": client_one.id, "content_item": item_id},
+            {"client": client_two.id, "content_item": item_id},
+            {"client": client_two.id, "content_item": item_id},
+            {"content_item": item_id},
+        ],
+        content_type="application/json",
+        accept="application/json",
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    outcomes = response.json()
+    like = ContentLike.objects.get(client=client_two)
+    assert outcomes[:3] == [
+        {"status": "duplicate"},
+        {"status": "created", "id": str(like.id)},
+        {"status": "duplicate"},
+    ]
+    assert outcomes[3]["status"] == "invalid"
+    assert "client" in outcomes[3]["errors"]
+    assert list(
+        ContentItemCounterDelta.objects.values_list("content_item_id", "counter", "delta")
+    ) == [(item_id, "like_count", 1)]
+
+
+def test_content_view_bulk_view_requires_a_list(user_with_all_permissions, client):
+    client.force_login(user_with_all_permissions)
+
+    response = client.post(
+        reverse("api:contentview-bulk"),
+        data={},
+        content_type="application/json",
+        accept="application/json",
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {"non_field_errors": ["Expected a list of interactions."]}
+
+    response = client.post(
+        reverse("api:contentview-bulk"),
+        data=[],
+        content_type="application/json",
+        accept="application/json",
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == []
+    assert not ContentItemCounterDelta.objects.exists()
+
+
+def test_content_view_bulk_view_caps_the_batch_size(user_with_all_permissions, client):
+    client.force_login(user_with_all_permissions)
+    interaction = {"client": str(baker.make(Client).id), "content_item": 1}
+
+    response = client.post(
+        reverse("api:contentview-bulk"),
+        data=[interaction] * (ContentInteractionBatchSerializer.MAX_INTERACTIONS + 1),
+        content_type="application/json",
+        accept="application/json",
+    )
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "interactions" in response.json()
+    assert not ContentView.objects.exists()
+    assert not ContentItemCounterDelta.objects.exists()
+
+
+def test_content_interaction_state_view(
+    content_item_with_tag_and_category, user_with_all_permissions, client
+):
+    client.force_login(user_with_all_permissions)
+    item_id = content_item_with_tag_and_category.id
+    client_one = baker.make(Client)
+    baker.make(ContentLike, client=client_one, content_item=content_item_with_tag_and_category)
+    baker.make(ContentView, client=client_one, content_item=content_item_with_tag_and_category)
+    baker.make(ContentBookmark, content_item=content_item_with_tag_and_category)
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(
+            reverse("api:content-interactions"),
+            {"client_id": client_one.id, "ids": f"{item_id},{item_id + 1}"},
+        )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json() == {
+        str(item_id): {"liked": True, "bookmarked": False, "viewed": True, "shared": False},
+        str(item_id + 1): {"liked": False, "bookmarked": False, "viewed": False, "shared": False},
+    }
+    interaction_queries = [query for query in queries if "content_content" in query["sql"]]
+    assert len(interaction_queries) == 4
+
+
+@pytest.mark.parametrize(
+    "params,field",
+    [
+        ({"ids": "1"}, "client_id"),
+        ({"client_id": "not-a-uuid", "ids": "1"}, "client_id"),
+        ({"client_id": "0b0d6d2e-6e3e-4b6e-9d6e-3f7e0c2d9b1a"}, "ids"),
+        ({"client_id": "0b0d6d2e-6e3e-4b6e-9d6e-3f7e0c2d9b1a", "ids": "1,x"}, "ids"),
+        (
+            {
+                "client_id": "0b0d6d2e-6e3e-4b6e-9d6e-3f7e0c2d9b1a",
+                "ids": ",".join(str(i) for i in range(1, 502)),
+            },
+            "ids",
+        ),
+    ],
+)
+def test_content_interaction_state_view_bad_requests(
+    params, field, user_with_all_permissions, client
+):
+    client.force_login(user_with_all_permissions)
+
+    response = client.get(reverse("api:content-interactions"), params)
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert field in response.json()
+
+
 def test_author_snippet_list(user_with_all_permissions, client):
     client.force_login(user_with_all_permissions)
     url = reverse("wagtailsnippets_content_author:list")
@@ -597,3 +738,58 @@ def test_content_detail_view(
     response_data = response_two.json()
 
     assert response_data["id"] == content_item_with_tag_and_category.id
+
+
+def test_content_listing_query_count_does_not_grow_with_items(
+    content_item_with_tag_and_category, make_content_item, request_with_user, client
+):
+    category = ContentItemCategory.objects.get(id=999_999)
+    for index in range(4):
+        content_item = make_content_item(
+            f"article-{index + 2}",
+            publish=False,
+            title=f"Article {index}",
+            author=baker.make(Author, avatar=baker.make(CustomImage, _create_files=True)),
+        )
+        content_item.categories.add(category)
+        content_item.tags.add(f"tag-{index}")
+        content_item.gallery_images.add(
+            ContentItemGalleryImage(image=baker.make(CustomImage, _create_files=True))
+        )
+        content_item.save_revision().publish()
+
+    for content_item in ContentItem.objects.all():
+        content_item.hero_image.get_rendition(HERO_IMAGE_RENDITION)
+
+    client.force_login(request_with_user.user)
+    url = reverse("wagtailapi:pages:listing") + "?type=content.ContentItem&fields=*"
+
+    with CaptureQueriesContext(connection) as few_items_queries:
+        response = client.get(url + "&limit=2")
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()["items"]) == 2
+
+    with CaptureQueriesContext(connection) as all_items_queries:
+        response = client.get(url + "&limit=10")
+    assert response.status_code == status.HTTP_200_OK
+    assert len(response.json()["items"]) == 5
+
+    assert len(all_items_queries) == len(few_items_queries)
+
+
+def test_content_listing_with_minimal_and_invalid_fields(
+    content_item_with_tag_and_category, request_with_user, client
+):
+    client.force_login(request_with_user.user)
+    url = reverse("wagtailapi:pages:listing") + "?type=content.ContentItem"
+
+    response = client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["items"][0]["title"] == "An article"
+
+    response = client.get(url + "&fields=_,id")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["items"] == [{"id": content_item_with_tag_and_category.id}]
+
+    response = client.get(url + "&fields=title(")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
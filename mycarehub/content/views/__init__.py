@@ -1,8 +1,10 @@
+from .analytics import ContentEngagementTimeseriesView, ContentEngagementTopItemsView
 from .chooser import author_chooser_viewset
 from .documents import CustomDocumentIndexView
 from .images import CustomImageIndexView
 from .interaction import (
     ContentBookmarkViewSet,
+    ContentInteractionStateView,
     ContentLikeViewSet,
     ContentShareViewSet,
     ContentViewViewSet,
@@ -24,6 +26,9 @@ __all__ = [
     "ContentShareViewSet",
     "ContentLikeViewSet",
     "ContentBookmarkViewSet",
+    "ContentInteractionStateView",
+    "ContentEngagementTimeseriesView",
+    "ContentEngagementTopItemsView",
     "AuthorSnippetViewSet",
     "ContentItemCategorySnippetViewSet",
     "SMSContentItemCategorySnippetViewSet",
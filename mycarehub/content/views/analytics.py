@@ -0,0 +1,54 @@
+from abc import ABCMeta, abstractmethod
+
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from mycarehub.content.analytics import (
+    get_engagement_timeseries,
+    get_rollups,
+    get_top_content_items,
+)
+from mycarehub.content.models import ContentInteractionRollup
+from mycarehub.content.serializers import ContentEngagementQuerySerializer
+
+
+class ContentEngagementView(APIView, metaclass=ABCMeta):
+    """Base view for engagement reports on the daily content interaction rollups."""
+
+    queryset = ContentInteractionRollup.objects.all()
+    serializer_class = ContentEngagementQuerySerializer
+
+    @abstractmethod
+    def get_report(self, rollups, limit):
+        """Return the report on the filtered rollups, limited to `limit` rows if it is ranked."""
+
+    def get(self, request):
+        serializer = self.serializer_class(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        filters = dict(serializer.validated_data)
+        limit = filters.pop("limit")
+
+        return Response(self.get_report(get_rollups(**filters), limit), status=status.HTTP_200_OK)
+
+
+class ContentEngagementTimeseriesView(ContentEngagementView):
+    """
+    The daily number of interactions of each kind.
+
+    e.g. `GET /api/content_engagement/timeseries/?program_id=<uuid>&start=2023-01-01`
+    """
+
+    def get_report(self, rollups, limit):
+        return get_engagement_timeseries(rollups)
+
+
+class ContentEngagementTopItemsView(ContentEngagementView):
+    """
+    The `limit` content items with the most interactions.
+
+    e.g. `GET /api/content_engagement/top/?interaction=like&limit=5`
+    """
+
+    def get_report(self, rollups, limit):
+        return get_top_content_items(rollups, limit)
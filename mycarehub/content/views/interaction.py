@@ -1,38 +1,222 @@
+from collections import Counter
+
+from django.db import transaction
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
 from mycarehub.common.views.base_views import BaseView
+from mycarehub.content.analytics import schedule_interaction_rollup
+from mycarehub.content.counters import record_counter_deltas
 from mycarehub.content.filters import (
     ContentBookmarkFilter,
     ContentLikeFilter,
     ContentShareFilter,
     ContentViewFilter,
 )
-from mycarehub.content.models import ContentBookmark, ContentLike, ContentShare, ContentView
+from mycarehub.content.models import (
+    ArchivedContentView,
+    ContentBookmark,
+    ContentLike,
+    ContentShare,
+    ContentView,
+)
 from mycarehub.content.serializers import (
     ContentBookmarkSerializer,
+    ContentInteractionBatchSerializer,
+    ContentInteractionStateQuerySerializer,
     ContentLikeSerializer,
     ContentShareSerializer,
     ContentViewSerializer,
 )
 
+# the outcomes of the interactions sent to the bulk ingestion endpoints
+CREATED = "created"
+DUPLICATE = "duplicate"
+INVALID = "invalid"
+
+# the interaction state flags and the interactions they are looked up in
+INTERACTION_STATE_FLAGS = {
+    "liked": ContentLike,
+    "bookmarked": ContentBookmark,
+    "viewed": ContentView,
+    "shared": ContentShare,
+}
+
+# the records that are kept of the interactions that were archived
+ARCHIVED_INTERACTIONS = {ContentView: ArchivedContentView}
+
+
+def get_archived_interactions(model, keys):
+    """Return which of the `(client_id, content_item_id)` interactions have been archived."""
+    if model not in ARCHIVED_INTERACTIONS or not keys:
+        return set()
+
+    client_ids, content_item_ids = zip(*keys)
+    archived = ARCHIVED_INTERACTIONS[model].objects.filter(
+        client_id__in=set(client_ids), content_item_id__in=set(content_item_ids)
+    )
+    return set(archived.values_list("client_id", "content_item_id")) & set(keys)
+
+
+def get_interaction_state(client_id, content_item_ids):
+    """
+    Return whether a client has liked, bookmarked, viewed and shared each of the content items.
+
+    Each interaction is looked up with a single query on its `(client, content_item)`
+    unique index; the archived views are looked up in the same query as the views.
+    """
+    state = {
+        content_item_id: dict.fromkeys(INTERACTION_STATE_FLAGS, False)
+        for content_item_id in content_item_ids
+    }
+    for flag, model in INTERACTION_STATE_FLAGS.items():
+        interacted = model.objects.filter(
+            client_id=client_id, content_item_id__in=content_item_ids
+        ).values_list("content_item_id", flat=True)
+        if model in ARCHIVED_INTERACTIONS:
+            archived = ARCHIVED_INTERACTIONS[model].objects.filter(
+                client_id=client_id, content_item_id__in=content_item_ids
+            )
+            interacted = interacted.union(archived.values_list("content_item_id", flat=True))
+        for content_item_id in interacted:
+            state[content_item_id][flag] = True
+
+    return state
+
+
+class ContentInteractionViewSet(BaseView):
+    """
+    Base viewset for content interactions.
+
+    Besides the usual endpoints, interactions can be ingested in bulk (e.g. when the
+    apps upload the interactions that were queued while offline) with a POST of a
+    list of interactions to `bulk/`.
+    """
+
+    @action(detail=False, methods=["POST"])
+    def bulk(self, request):
+        """
+        Ingest a list of interactions and return the outcome of each one.
+
+        Interactions are inserted together and the interactions that a client already
+        had with a content item are reported as duplicates instead of failing the batch.
+        The counts on the affected content items are updated once per item. At most
+        `ContentInteractionBatchSerializer.MAX_INTERACTIONS` interactions are accepted
+        per request.
+        """
+        if not isinstance(request.data, list):
+            raise ValidationError({"non_field_errors": ["Expected a list of interactions."]})
+        ContentInteractionBatchSerializer(data={"interactions": request.data}).is_valid(
+            raise_exception=True
+        )
 
-class ContentViewViewSet(BaseView):
+        model = self.get_queryset().model
+        outcomes = []
+        interactions = {}
+        for data in request.data:
+            serializer = self.get_serializer(data=data)
+            # duplicates are detected by the insert, not by a query per interaction
+            serializer.validators = []
+            if not serializer.is_valid():
+                outcomes.append({"status": INVALID, "errors": serializer.errors})
+                continue
+
+            interaction = model(**serializer.validated_data)
+            key = (interaction.client_id, interaction.content_item_id)
+            if key in interactions:
+                outcomes.append({"status": DUPLICATE})
+                continue
+
+            interactions[key] = interaction
+            outcomes.append({"status": CREATED, "interaction": interaction})
+
+        # archived interactions were counted already, like the ones that conflict below
+        for key in get_archived_interactions(model, interactions.keys()):
+            del interactions[key]
+
+        with transaction.atomic():
+            model.objects.bulk_create(interactions.values(), ignore_conflicts=True)
+            # the interactions that conflicted with existing ones were not inserted
+            created_ids = set(
+                model.objects.filter(
+                    id__in=[interaction.id for interaction in interactions.values()]
+                ).values_list("id", flat=True)
+            )
+
+            counter = self.get_serializer_class().counter
+            deltas = Counter(
+                (interaction.content_item_id, counter)
+                for interaction in interactions.values()
+                if interaction.id in created_ids
+            )
+            if deltas:
+                record_counter_deltas(deltas)
+                schedule_interaction_rollup()
+
+        for outcome in outcomes:
+            interaction = outcome.pop("interaction", None)
+            if interaction is None:
+                continue
+            if interaction.id in created_ids:
+                outcome["id"] = interaction.id
+            else:
+                outcome["status"] = DUPLICATE
+
+        return Response(outcomes, status=status.HTTP_200_OK)
+
+
+class ContentViewViewSet(ContentInteractionViewSet):
     queryset = ContentView.objects.all()
     serializer_class = ContentViewSerializer
     filterset_class = ContentViewFilter
 
 
-class ContentShareViewSet(BaseView):
+class ContentShareViewSet(ContentInteractionViewSet):
     queryset = ContentShare.objects.all()
     serializer_class = ContentShareSerializer
     filterset_class = ContentShareFilter
 
 
-class ContentLikeViewSet(BaseView):
+class ContentLikeViewSet(ContentInteractionViewSet):
     queryset = ContentLike.objects.all()
     serializer_class = ContentLikeSerializer
     filterset_class = ContentLikeFilter
 
 
-class ContentBookmarkViewSet(BaseView):
+class ContentBookmarkViewSet(ContentInteractionViewSet):
     queryset = ContentBookmark.objects.all()
     serializer_class = ContentBookmarkSerializer
     filterset_class = ContentBookmarkFilter
+
+
+class ContentInteractionStateView(APIView):
+    """
+    Look up a client's interactions with a batch of content items.
+
+    e.g. `GET /api/content_interactions/?client_id=<uuid>&ids=3,5,8` returns
+    `{"3": {"liked": true, "bookmarked": false, "viewed": true, "shared": false}, ...}`.
+    """
+
+    queryset = ContentLike.objects.all()
+    serializer_class = ContentInteractionStateQuerySerializer
+
+    def get(self, request):
+        serializer = self.serializer_class(
+            data={
+                "client_id": request.query_params.get("client_id"),
+                "ids": [
+                    content_item_id
+                    for value in request.query_params.getlist("ids")
+                    for content_item_id in value.split(",")
+                    if content_item_id
+                ],
+            }
+        )
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        state = get_interaction_state(data["client_id"], set(data["ids"]))
+        return Response(state, status=status.HTTP_200_OK)
@@ -1,4 +1,15 @@
+from collections import OrderedDict
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Prefetch, Q
 from django.urls import path
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.dateparse import parse_datetime
+from django.utils.http import http_date, quote_etag
+from rest_framework.response import Response
 from wagtail.api.v2.filters import (
     AncestorOfFilter,
     ChildOfFilter,
@@ -9,9 +20,18 @@ from wagtail.api.v2.filters import (
     SearchFilter,
     TranslationOfFilter,
 )
+from wagtail.api.v2.utils import BadRequestError, parse_fields_parameter
 from wagtail.api.v2.views import PagesAPIViewSet
 
+from mycarehub.clients.context import get_client_context
+from mycarehub.common.models import ContentSequence
 from mycarehub.common.views.base_views import BaseView
+from mycarehub.content.cache import (
+    get_detail_validators,
+    get_listing_cache_key,
+    get_listing_validators,
+)
+from mycarehub.content.counters import COUNTED_INTERACTIONS, annotate_pending_counts
 from mycarehub.content.filters import (
     CategoryFilter,
     ClientFilter,
@@ -22,8 +42,139 @@ from mycarehub.content.filters import (
     SMSContentItemFilterSet,
     TagFilter,
 )
-from mycarehub.content.models import ContentItemCategory
+from mycarehub.content.models import (
+    HERO_IMAGE_RENDITION,
+    ContentItem,
+    ContentItemCategory,
+    CustomImage,
+)
+from mycarehub.content.pagination import CURSOR_PAGINATION, ContentCursorPagination
+from mycarehub.content.schedule import get_content_sequence_cutoff
 from mycarehub.content.serializers import ContentItemCategorySerializer
+from mycarehub.content.sync import get_deleted_content_items, get_rescoped_content_items
+
+# the related objects that each ContentItem API field reads when serialized
+CONTENT_ITEM_SELECT_RELATED = {
+    "author": ["author"],
+    "author_name": ["author"],
+    "author_avatar_url": ["author__avatar"],
+    "hero_image": ["hero_image"],
+    "program": ["program"],
+    "locale": ["locale"],
+}
+CONTENT_ITEM_PREFETCH_RELATED = {
+    "tag_names": ["tags"],
+    "documents": ["documents__document"],
+    "featured_media": ["featured_media__featured_media"],
+    "gallery_images": ["gallery_images__image"],
+    "questionnaires": ["questionnaires"],
+}
+
+
+def prefetch_content_item_fields(queryset, fields):
+    """
+    Fetch the related objects needed to serialize the given ContentItem fields.
+
+    The related objects are loaded in a fixed number of queries instead of one
+    (or more) queries per item, and the pending deltas of the interaction counts
+    are summed in the same query as the items.
+    """
+    select_related = {
+        lookup for field in fields for lookup in CONTENT_ITEM_SELECT_RELATED.get(field, [])
+    }
+    prefetch_related = list(
+        dict.fromkeys(
+            lookup for field in fields for lookup in CONTENT_ITEM_PREFETCH_RELATED.get(field, [])
+        )
+    )
+    # `Prefetch` objects are modified when used, so they are built per queryset
+    if "category_details" in fields:
+        prefetch_related.append(
+            Prefetch("categories", queryset=ContentItemCategory.objects.select_related("icon"))
+        )
+    if "hero_image_rendition" in fields:
+        # a hero image loaded through a join would not get its renditions prefetched
+        select_related.discard("hero_image")
+        prefetch_related.append(
+            Prefetch(
+                "hero_image",
+                queryset=CustomImage.objects.prefetch_renditions(HERO_IMAGE_RENDITION),
+            )
+        )
+
+    if select_related:
+        queryset = queryset.select_related(*sorted(select_related))
+    if prefetch_related:
+        queryset = queryset.prefetch_related(*prefetch_related)
+    counters = [field for field in fields if field in COUNTED_INTERACTIONS]
+    if counters:
+        queryset = annotate_pending_counts(queryset, counters)
+    return queryset
+
+
+# the filters that decide which content a client is allowed to sync
+SYNC_FILTER_BACKENDS = [ClientFilter, FacilityFilter, ContentSequenceFilter]
+
+# changes committed while a sync was being served may carry an earlier timestamp
+# than the watermark that was handed out, so every sync looks back a little further
+SYNC_WATERMARK_OVERLAP = timedelta(minutes=1)
+
+
+def parse_sync_watermark(value):
+    """Parse the `since` watermark of a sync request."""
+    try:
+        since = parse_datetime(value)
+    except ValueError:
+        since = None
+    if since is None:
+        raise BadRequestError("since must be an ISO 8601 date and time")
+
+    if timezone.is_naive(since):
+        since = timezone.make_aware(since)
+    return since
+
+
+def get_not_modified_response(request, etag, last_modified):
+    """Return a 304 (or 412) response when the client's copy is still current."""
+    response = get_conditional_response(
+        request,
+        etag=quote_etag(etag) if etag else None,
+        last_modified=int(last_modified.timestamp()) if last_modified else None,
+    )
+    if response is not None:
+        set_validators(response, etag, last_modified)
+    return response
+
+
+def set_validators(response, etag, last_modified):
+    if etag:
+        response.headers["ETag"] = quote_etag(etag)
+    if last_modified:
+        response.headers["Last-Modified"] = http_date(last_modified.timestamp())
+    return response
+
+
+def get_listing_expiry(next_unlock_at):
+    """
+    Return when a listing that changes at `next_unlock_at` expires, if it does.
+
+    Listings are not cached for longer than `CONTENT_API_CACHE_TIMEOUT`, by the
+    server or by clients, so that publishing and unpublishing reach the apps.
+    """
+    if next_unlock_at is None:
+        return None
+
+    timeout = timedelta(seconds=settings.CONTENT_API_CACHE_TIMEOUT)
+    return min(next_unlock_at, timezone.now() + timeout)
+
+
+def set_expiry(response, expires_at):
+    """Let clients cache a response until `expires_at` e.g. the next content unlock."""
+    if expires_at:
+        max_age = max(0, int((expires_at - timezone.now()).total_seconds()))
+        patch_cache_control(response, private=True, max_age=max_age)
+        response.headers["Expires"] = http_date(expires_at.timestamp())
+    return response
 
 
 class CustomPageAPIViewset(PagesAPIViewSet):
@@ -57,15 +208,181 @@ class CustomPageAPIViewset(PagesAPIViewSet):
             "facility_id",
             "exclude_category",
             "exclude_content",
+            "pagination",
+            "cursor",
         ]
     )
+    # set by `ContentSequenceFilter` when the listed content changes with time
+    next_unlock_at = None
+
+    @property
+    def paginator(self):
+        """
+        Use keyset pagination when it is requested with `?pagination=cursor`.
+
+        Offset pagination remains the default so that existing clients keep working.
+        """
+        if not hasattr(self, "_paginator"):
+            if self.request.GET.get("pagination") == CURSOR_PAGINATION:
+                self._paginator = ContentCursorPagination()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
+
+    def get_fields_serializer_class(self, model):
+        """Return the serializer class of the fields requested with `?fields=`."""
+        fields_config = []
+        if "fields" in self.request.GET:
+            try:
+                fields_config = parse_fields_parameter(self.request.GET["fields"])
+            except ValueError as e:
+                raise BadRequestError("fields error: %s" % str(e))
+
+        return self._get_serializer_class(
+            self.request.wagtailapi_router,
+            model,
+            fields_config,
+            show_details=self.action == "detail_view",
+        )
+
+    def get_requested_fields(self, model):
+        """Return the names of the fields that will be serialized for each item."""
+        try:
+            serializer_class = self.get_fields_serializer_class(model)
+        except BadRequestError:
+            # the error is reported when the response is serialized
+            return []
+        return serializer_class.Meta.fields
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if queryset.model is ContentItem:
+            queryset = prefetch_content_item_fields(
+                queryset, self.get_requested_fields(queryset.model)
+            )
+        return queryset
+
+    def listing_view(self, request):
+        """
+        Serve listings from the cache when possible.
+
+        Cached listings are evicted when content in their program is published,
+        unpublished, moved or deleted (see `mycarehub.content.signals`). The
+        listing's validators are cached with it so that conditional requests for
+        cached listings are answered without querying the database.
+
+        Listings of GRADUAL programs are only cached until more content unlocks,
+        and clients are told to cache them for as long as the server does.
+        """
+        cache_key = get_listing_cache_key(request)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            data, etag, last_modified, expires_at = cached
+            not_modified = get_not_modified_response(request, etag, last_modified)
+            if not_modified is not None:
+                return set_expiry(not_modified, expires_at)
+            return set_expiry(set_validators(Response(data), etag, last_modified), expires_at)
+
+        queryset = self.get_queryset()
+        self.check_query_parameters(queryset)
+        queryset = self.filter_queryset(queryset)
+
+        etag, last_modified = get_listing_validators(request, queryset)
+        expires_at = get_listing_expiry(self.next_unlock_at)
+        not_modified = get_not_modified_response(request, etag, last_modified)
+        if not_modified is not None:
+            return set_expiry(not_modified, expires_at)
+
+        queryset = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(queryset, many=True)
+        response = self.get_paginated_response(serializer.data)
+
+        timeout = settings.CONTENT_API_CACHE_TIMEOUT
+        if expires_at:
+            timeout = max(0, int((expires_at - timezone.now()).total_seconds()))
+        cache.set(cache_key, (response.data, etag, last_modified, expires_at), timeout)
+
+        return set_expiry(set_validators(response, etag, last_modified), expires_at)
 
     def detail_view(self, request, pk=None, slug=None):
-        param = pk
         if slug is not None:
             self.lookup_field = "slug"
-            param = slug
-        return super().detail_view(request, param)
+        instance = self.get_object()
+
+        etag, last_modified = get_detail_validators(request, instance)
+        not_modified = get_not_modified_response(request, etag, last_modified)
+        if not_modified is not None:
+            return not_modified
+
+        serializer = self.get_serializer(instance)
+        return set_validators(Response(serializer.data), etag, last_modified)
+
+    def get_changed_since_filter(self, request, since):
+        """Match the content items that a client has not seen as of `since`."""
+        changed = Q(last_published_at__gt=since)
+
+        client_id = request.query_params.get("client_id", "")
+        client_context = get_client_context(client_id) if client_id else None
+        if client_context and client_context.content_sequence == ContentSequence.GRADUAL:
+            # content that has been unlocked with time need not have been published recently
+            changed |= Q(date__gt=get_content_sequence_cutoff(client_context, since))
+
+        return changed
+
+    def sync_view(self, request):
+        """
+        Return the content items that were published or edited after a watermark.
+
+        The watermark is passed as `?since=`. The response contains the changed items,
+        the ids of the items that were unpublished, deleted or taken out of the client's
+        scope in the meantime and the watermark to send with the next sync. Without a
+        watermark, every item that the client can see is returned.
+        """
+        watermark = timezone.now()
+
+        queryset = ContentItem.objects.filter(
+            id__in=self.get_base_queryset().values_list("id", flat=True)
+        )
+        for backend in SYNC_FILTER_BACKENDS:
+            queryset = backend().filter_queryset(request, queryset, self)
+
+        deleted = []
+        if "since" in request.GET:
+            since = parse_sync_watermark(request.GET["since"]) - SYNC_WATERMARK_OVERLAP
+            client_id = request.query_params.get("client_id", "")
+            client_context = get_client_context(client_id) if client_id else None
+            # unknown clients can not view any content, nor learn of any
+            if client_context or not client_id:
+                program_id = client_context.program_id if client_context else None
+                deleted = sorted(
+                    get_deleted_content_items(since, program_id)
+                    + get_rescoped_content_items(since, queryset, program_id)
+                )
+            queryset = queryset.filter(self.get_changed_since_filter(request, since))
+
+        serializer_class = self.get_fields_serializer_class(ContentItem)
+        queryset = prefetch_content_item_fields(
+            queryset.order_by("first_published_at", "id"), serializer_class.Meta.fields
+        )
+        serializer = serializer_class(queryset, many=True, context=self.get_serializer_context())
+
+        return Response(
+            OrderedDict(
+                [
+                    (
+                        "meta",
+                        OrderedDict(
+                            [
+                                ("watermark", watermark.isoformat()),
+                                ("next_unlock_at", self.next_unlock_at),
+                            ]
+                        ),
+                    ),
+                    ("items", serializer.data),
+                    ("deleted", deleted),
+                ]
+            )
+        )
 
     @classmethod
     def get_urlpatterns(cls):
@@ -76,6 +393,8 @@ class CustomPageAPIViewset(PagesAPIViewSet):
             path("", cls.as_view({"get": "listing_view"}), name="listing"),
             path("<int:pk>/", cls.as_view({"get": "detail_view"}), name="detail"),
             path("<slug:slug>/", cls.as_view({"get": "detail_view"}), name="detail"),
+            # a single path segment would be taken for the slug of a page
+            path("sync/changes/", cls.as_view({"get": "sync_view"}), name="sync"),
             path("find/", cls.as_view({"get": "find_view"}), name="find"),
         ]
 
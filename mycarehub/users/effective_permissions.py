@@ -0,0 +1,51 @@
+"""
+The effective permissions of users.
+
+A user's effective permissions are the permissions granted to them directly
+and through their groups. They are looked up in a single query and cached, as
+a frozenset of "<app label>.<codename>" strings, so that listing users with
+their permissions does not query the permissions of every user and group.
+
+Every user has a cache "generation" that is part of the cache key, and so does
+the shared namespace of all users. Changing a user's groups or permissions
+bumps the user's generation and changing the permissions (or members) of a
+group bumps the shared one (see `mycarehub.users.signals` and
+`mycarehub.utils.cache_generations`).
+"""
+from django.conf import settings
+from django.contrib.auth.models import Permission
+from django.core.cache import cache
+from django.db.models import Q
+
+from mycarehub.utils.cache_generations import bump_generation, get_generation
+
+USER_PERMISSIONS_CACHE_PREFIX = "users:permissions"
+ALL_USERS = "all"
+
+
+def invalidate_effective_permissions(user_id=None):
+    """Evict the cached permissions of a user, or of all the users when no user is given."""
+    bump_generation(USER_PERMISSIONS_CACHE_PREFIX, ALL_USERS if user_id is None else str(user_id))
+
+
+def get_effective_permissions(user):
+    """Return the permissions of a user, directly and through their groups, as a frozenset."""
+    scope = str(user.pk)
+    key = (
+        f"{USER_PERMISSIONS_CACHE_PREFIX}:permissions:{scope}:"
+        f"{get_generation(USER_PERMISSIONS_CACHE_PREFIX, ALL_USERS)}:"
+        f"{get_generation(USER_PERMISSIONS_CACHE_PREFIX, scope)}"
+    )
+    permissions = cache.get(key)
+    if permissions is None:
+        permissions = frozenset(
+            f"{app_label}.{codename}"
+            for app_label, codename in Permission.objects.filter(
+                Q(user=user) | Q(group__user=user)
+            )
+            .values_list("content_type__app_label", "codename")
+            .distinct()
+        )
+        cache.set(key, permissions, settings.USER_PERMISSIONS_CACHE_TIMEOUT)
+
+    return permissions
@@ -19,6 +19,8 @@ from django.utils.translation import gettext_lazy as _
 
 from mycarehub.utils.general_utils import default_organisation, default_program
 
+from .effective_permissions import get_effective_permissions
+
 
 class UserTypes(TextChoices):
     CLIENT = "CLIENT", _("Client")
@@ -52,22 +54,7 @@ class User(AbstractUser):
 
     @property
     def permissions(self):
-        perms = set(
-            [
-                f"{perm.content_type.app_label}.{perm.codename}"
-                for perm in self.user_permissions.all()
-            ]
-        )
-        groups = self.groups.all()
-        for group in groups:
-            group_perms = set(
-                [
-                    f"{perm.content_type.app_label}.{perm.codename}"
-                    for perm in group.permissions.all()
-                ]
-            )
-            perms = perms | group_perms
-        return ",\n".join(list(perms))
+        return ",\n".join(sorted(get_effective_permissions(self)))
 
     @property
     def gps(self):
@@ -4,10 +4,12 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group, Permission
 from django.core.exceptions import ObjectDoesNotExist
-from django.db.models.signals import post_save
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 from rest_framework.authtoken.models import Token
 
+from .effective_permissions import invalidate_effective_permissions
+
 LOGGER = logging.getLogger(__name__)
 BASIC_PERMISSIONS = [
     "users.can_view_dashboard",
@@ -77,5 +79,24 @@ def assign_user_editor_permission(sender, instance, created, **kwargs):
     except ObjectDoesNotExist:
         return
 
-    instance.groups.clear()
-    instance.groups.add(group)
+    # `set` only writes (and sends `m2m_changed`) when the user's groups change
+    instance.groups.set([group])
+
+
+@receiver(m2m_changed, sender=User.groups.through)
+@receiver(m2m_changed, sender=User.user_permissions.through)
+@receiver(m2m_changed, sender=Group.permissions.through)
+def invalidate_permissions_on_membership_change(sender, instance, action, **kwargs):
+    if not action.startswith("post_"):
+        return
+
+    if isinstance(instance, User):
+        invalidate_effective_permissions(instance.pk)
+    else:
+        invalidate_effective_permissions()
+
+
+@receiver(post_delete, sender=Group)
+@receiver(post_delete, sender=Permission)
+def invalidate_permissions_on_delete(sender, instance, **kwargs):
+    invalidate_effective_permissions()
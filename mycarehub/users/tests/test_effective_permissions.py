@@ -0,0 +1,52 @@
+import pytest
+from django.contrib.auth.models import Group, Permission
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from model_bakery import baker
+
+from mycarehub.users.effective_permissions import (
+    get_effective_permissions,
+    invalidate_effective_permissions,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+def test_get_effective_permissions(user):
+    group = baker.make(Group)
+    group.permissions.add(Permission.objects.get(codename="change_facility"))
+    user.groups.add(group)
+    user.user_permissions.add(Permission.objects.get(codename="view_facility"))
+
+    with CaptureQueriesContext(connection) as queries:
+        permissions = get_effective_permissions(user)
+    assert len(queries) == 1
+    assert {"common.view_facility", "common.change_facility"} <= permissions
+
+    with CaptureQueriesContext(connection) as queries:
+        assert get_effective_permissions(user) == permissions
+    assert len(queries) == 0
+
+    invalidate_effective_permissions(user.pk)
+    with CaptureQueriesContext(connection) as queries:
+        assert get_effective_permissions(user) == permissions
+    assert len(queries) == 1
+
+
+def test_effective_permissions_follow_membership_changes(user):
+    group = baker.make(Group)
+    permission = Permission.objects.get(codename="change_facility")
+    assert "common.change_facility" not in get_effective_permissions(user)
+
+    user.groups.add(group)
+    group.permissions.add(permission)
+    assert "common.change_facility" in get_effective_permissions(user)
+
+    group.delete()
+    assert "common.change_facility" not in get_effective_permissions(user)
+
+    permission.user_set.add(user)
+    assert "common.change_facility" in get_effective_permissions(user)
+
+    user.user_permissions.remove(permission)
+    assert "common.change_facility" not in get_effective_permissions(user)
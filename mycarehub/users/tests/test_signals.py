@@ -1,9 +1,13 @@
 import pytest
 from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from faker import Faker
 from model_bakery import baker
 from rest_framework.authtoken.models import Token
 
+from mycarehub.common.models import Program
 from mycarehub.users.signals import (
     BASIC_PERMISSIONS,
     account_confirmed_handler,
@@ -71,3 +75,24 @@ def test_create_auth_token(program):
 
     # confirm that the token was not regenerated
     assert token.pk == token2.pk
+
+
+def test_assign_user_editor_permission():
+    program = baker.make(Program, name="Diabetes")
+    editor_group = baker.make(Group, name=f"{program.name} Editor")
+    user = baker.make(User, email=fake.email(), program=program)
+    user.groups.add(baker.make(Group))
+
+    user.save()
+    assert list(user.groups.all()) == [editor_group]
+
+    # the groups are not written again when they have not changed
+    with CaptureQueriesContext(connection) as queries:
+        user.save()
+    assert not [
+        query
+        for query in queries
+        if query["sql"].startswith(
+            ('INSERT INTO "users_user_groups"', 'DELETE FROM "users_user_groups"')
+        )
+    ]
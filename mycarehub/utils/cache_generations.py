@@ -0,0 +1,36 @@
+"""
+Cache generations.
+
+A namespace of cached values (e.g. the listings of a program, or the permissions
+of a user) has a "generation" that is part of the keys of its values. Bumping the
+generation evicts all the values cached in the namespace without enumerating
+keys, which works on every cache backend, including the database cache used in
+production.
+
+Namespaces are identified by a key prefix and a scope within it.
+"""
+from django.core.cache import cache
+
+
+def _generation_key(prefix, scope):
+    return f"{prefix}:generation:{scope}"
+
+
+def get_generation(prefix, scope):
+    """Return the current generation of a namespace."""
+    key = _generation_key(prefix, scope)
+    generation = cache.get(key)
+    if generation is None:
+        cache.add(key, 1, timeout=None)
+        generation = cache.get(key, 1)
+
+    return generation
+
+
+def bump_generation(prefix, scope):
+    """Evict the values cached in a namespace by bumping its generation."""
+    key = _generation_key(prefix, scope)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 2, timeout=None)
@@ -1,12 +1,34 @@
 import uuid
 
 from django.conf import settings
+from django.db import transaction
 from django.db.utils import ProgrammingError
 
 DEFAULT_ORG_CODE = 1
 
+# the primary keys of the default rows, keyed by model name, once they are known to exist
+_defaults = {}
+
+
+def clear_defaults():
+    """
+    Forget the memoized default organisation and program.
+
+    This runs when a default row is deleted (see `mycarehub.common.signals`) so that
+    the row is created again by the next lookup.
+    """
+    _defaults.clear()
+
+
+def _memoize_default(name, pk):
+    # memoize only once the row is committed, a rolled back row should be looked up again
+    transaction.on_commit(lambda: _defaults.__setitem__(name, pk))
+
 
 def default_organisation():
+    if "organisation" in _defaults:
+        return _defaults["organisation"]
+
     try:
         from mycarehub.common.models import Organisation  # intentional late import
 
@@ -19,6 +41,7 @@ def default_organisation():
                 "phone_number": settings.ORGANISATION_PHONE,
             },
         )
+        _memoize_default("organisation", org.pk)
         return org.pk
     except (ProgrammingError, Exception):  # pragma: nocover
         # this will occur during initial migrations on a clean db
@@ -26,6 +49,9 @@ def default_organisation():
 
 
 def default_program():
+    if "program" in _defaults:
+        return _defaults["program"]
+
     try:
         from django.db.models.signals import post_save
 
@@ -37,7 +63,16 @@ def default_program():
                 "name": f"{settings.ORGANISATION_NAME}",
             },
         )
-        post_save.send(Program, instance=program, created=created)
+        if created:
+            # the content signals skip the creation of the default program, so it is
+            # announced again once it is committed, for its content index page to be
+            # provisioned
+            transaction.on_commit(lambda: post_save.send(Program, instance=program, created=False))
+        else:
+            # an existing program is announced once per process so that its content index
+            # page is provisioned
+            post_save.send(Program, instance=program, created=False)
+        _memoize_default("program", program.pk)
         return program.pk
     except (ProgrammingError, Exception):  # pragma: nocover
         # this will occur during initial migrations on a clean db
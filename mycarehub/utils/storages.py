@@ -9,3 +9,9 @@ class StaticRootGoogleCloudStorage(GoogleCloudStorage):
 class MediaRootGoogleCloudStorage(GoogleCloudStorage):
     location = "media"
     file_overwrite = False
+
+
+class ArchiveGoogleCloudStorage(GoogleCloudStorage):
+    location = "archives"
+    default_acl = "project-private"
+    file_overwrite = False
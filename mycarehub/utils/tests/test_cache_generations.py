@@ -0,0 +1,20 @@
+from django.core.cache import cache
+
+from ..cache_generations import bump_generation, get_generation
+
+
+def test_bump_generation():
+    assert get_generation("test", "one") == 1
+
+    bump_generation("test", "one")
+    assert get_generation("test", "one") == 2
+    assert get_generation("test", "two") == 1
+    assert get_generation("other", "one") == 1
+
+
+def test_bump_evicted_generation():
+    get_generation("test", "one")
+    cache.delete("test:generation:one")
+
+    bump_generation("test", "one")
+    assert get_generation("test", "one") == 2
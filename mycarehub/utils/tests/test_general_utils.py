@@ -1,6 +1,15 @@
 import pytest
+from django.conf import settings
+from django.db import connection
+from django.db.models.signals import post_save
+from django.test.utils import CaptureQueriesContext
+from model_bakery import baker
 
-from ..general_utils import default_organisation
+from mycarehub.common.models import Organisation, Program
+from mycarehub.content.models import ContentItemIndexPage
+from mycarehub.content.provisioning import provision_programs
+
+from ..general_utils import default_organisation, default_program
 
 pytestmark = pytest.mark.django_db
 
@@ -9,3 +18,68 @@ def test_default_organisation():
     first_fetch_org = default_organisation()
     second_fetch_org = default_organisation()
     assert str(first_fetch_org) == str(second_fetch_org)
+
+
+def test_default_organisation_is_memoized(django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        org_id = default_organisation()
+
+    with CaptureQueriesContext(connection) as queries:
+        assert default_organisation() == org_id
+    assert len(queries) == 0
+
+    # deleting other organisations keeps the memoized default
+    baker.make(Organisation).delete()
+    with CaptureQueriesContext(connection) as queries:
+        default_organisation()
+    assert len(queries) == 0
+
+
+def test_default_program_is_memoized(django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        program_id = default_program()
+    assert str(program_id) == settings.DEFAULT_PROGRAM_ID
+
+    with CaptureQueriesContext(connection) as queries:
+        assert default_program() == program_id
+    assert len(queries) == 0
+
+    Program.objects.get(id=program_id).delete()
+    with CaptureQueriesContext(connection) as queries:
+        assert default_program() == program_id
+    assert len(queries) > 0
+    assert Program.objects.filter(id=program_id).exists()
+
+
+def test_default_program_is_looked_up_until_committed():
+    program_id = default_program()
+
+    with CaptureQueriesContext(connection) as queries:
+        assert default_program() == program_id
+    assert len(queries) > 0
+
+
+@pytest.fixture
+def program_content_receiver():
+    # the content signals are not connected in tests
+    def create_program_content_index_page(sender, instance, created, **kwargs):
+        if settings.DEFAULT_PROGRAM_ID == str(instance.id) and created:
+            return
+        provision_programs([instance])
+
+    post_save.connect(create_program_content_index_page, sender=Program)
+    yield
+    post_save.disconnect(create_program_content_index_page, sender=Program)
+
+
+def test_default_program_is_provisioned_when_created(
+    program_content_receiver, django_capture_on_commit_callbacks
+):
+    # a fresh database, without the default program
+    ContentItemIndexPage.objects.filter(program_id=settings.DEFAULT_PROGRAM_ID).delete()
+    Program.objects.filter(id=settings.DEFAULT_PROGRAM_ID).delete()
+
+    with django_capture_on_commit_callbacks(execute=True):
+        program_id = default_program()
+
+    assert ContentItemIndexPage.objects.filter(program_id=program_id).exists()